@@ -31,6 +31,76 @@ DARK_THEME = {
     "shadow_color": "#000000" # Black shadow on dark cards looks better/grounded
 }
 
+_MISSING = object()  # marks a key absent from the stored task
+
+
+class TaskRecord:
+    """A stored task, kept in slots instead of a dict.
+
+    Keys that are unknown, missing, or of an unexpected type are kept in
+    `extra` and written back unchanged until the field is edited, so
+    tasks.json round-trips exactly. A non-bool `completed` still counts
+    by its truth value, as in the desktop app's Task model.
+    """
+
+    __slots__ = ("id", "text", "deadline", "priority", "completed", "extra", "_due")
+    FIELDS = {"task": "text", "deadline": "deadline", "priority": "priority", "completed": "completed"}
+    DEFAULTS = {"text": "", "deadline": "", "priority": "Medium", "completed": False}
+
+    def __init__(self, id, text="", deadline="", priority="Medium", completed=False):
+        self.id = id
+        self.text = text
+        self.deadline = deadline
+        self.priority = priority
+        self.completed = completed
+        self.extra = {}
+        self._due = None  # (deadline, parsed date) once `due` is read
+
+    @property
+    def due(self):
+        """The deadline as a date, or None; parsed on first access."""
+        if self._due is None or self._due[0] != self.deadline:
+            try:
+                parsed = datetime.strptime(self.deadline, "%d-%m-%Y").date()
+            except (TypeError, ValueError):
+                parsed = None
+            self._due = (self.deadline, parsed)
+        return self._due[1]
+
+    @classmethod
+    def from_dict(cls, data):
+        record = cls(data.get("id"))
+        record.extra = {k: v for k, v in data.items() if k != "id" and k not in cls.FIELDS}
+        for key, attr in cls.FIELDS.items():
+            value = data.get(key, _MISSING)
+            if type(value) is type(cls.DEFAULTS[attr]):
+                setattr(record, attr, value)
+            else:
+                record.extra[key] = value
+                if attr == "completed":
+                    record.completed = value is not _MISSING and bool(value)
+        return record
+
+    def to_dict(self):
+        data = {"id": self.id}
+        for key, attr in self.FIELDS.items():
+            data[key] = getattr(self, attr)
+        for key, value in self.extra.items():
+            if value is _MISSING:
+                del data[key]
+            else:
+                data[key] = value
+        return data
+
+    def update(self, **fields):
+        """Set fields by attribute name; edited fields drop their stored original."""
+        for attr, value in fields.items():
+            setattr(self, attr, value)
+        for key, attr in self.FIELDS.items():
+            if attr in fields:
+                self.extra.pop(key, None)
+
+
 class Task(ft.Container): # Changed from Column to Container for styling
     def __init__(self, app, task_id, task_text, deadline, priority, completed):
         super().__init__()
@@ -171,7 +241,7 @@ class Task(ft.Container): # Changed from Column to Container for styling
         self.text_control.spans[0].style.decoration = ft.TextDecoration.LINE_THROUGH if self.completed else ft.TextDecoration.NONE
         self.checkbox.update()
         self.text_control.update()
-        self.app.update_task_data(self.task_id, {'completed': self.completed})
+        self.app.update_task_data(self.task_id, completed=self.completed)
         
         msg = "Task marked completed!" if self.completed else "Task marked active!"
         if self.page:
@@ -198,11 +268,12 @@ class Task(ft.Container): # Changed from Column to Container for styling
         self.priority_view.bgcolor = self.get_priority_color(self.priority)
         self.priority_view.update()
 
-        self.app.update_task_data(self.task_id, {
-            'task': self.task_text,
-            'deadline': self.deadline,
-            'priority': self.priority
-        })
+        self.app.update_task_data(
+            self.task_id,
+            text=self.task_text,
+            deadline=self.deadline,
+            priority=self.priority
+        )
         
         self.edit_mode = False
         self.display_view.visible = True
@@ -393,29 +464,27 @@ class TodoApp(ft.Column):
         if not self.new_task.value:
             return
         
-        task_data = {
-            'id': str(uuid.uuid4()),
-            'task': self.new_task.value,
-            'deadline': self.new_deadline.value,
-            'priority': self.new_priority.value,
-            'completed': False
-        }
-        self.tasks.append(task_data)
+        self.tasks.append(TaskRecord(
+            str(uuid.uuid4()),
+            self.new_task.value,
+            self.new_deadline.value or "",
+            self.new_priority.value or "Medium"
+        ))
         self.save_tasks()
         self.new_task.value = ""
         self.update_list()
         self.update()
 
-    def update_task_data(self, task_id, updates):
+    def update_task_data(self, task_id, **updates):
         for task in self.tasks:
-            if task['id'] == task_id:
-                task.update(updates)
+            if task.id == task_id:
+                task.update(**updates)
                 break
         self.save_tasks()
         self.update_count()
 
     def delete_task(self, task_control):
-        self.tasks = [t for t in self.tasks if t['id'] != task_control.task_id]
+        self.tasks = [t for t in self.tasks if t.id != task_control.task_id]
         self.save_tasks()
         self.update_list()
         self.update()
@@ -428,7 +497,7 @@ class TodoApp(ft.Column):
         self.update()
 
     def clear_completed_clicked(self, e):
-        self.tasks = [t for t in self.tasks if not t['completed']]
+        self.tasks = [t for t in self.tasks if not t.completed]
         self.save_tasks()
         self.update_list()
         self.update()
@@ -441,20 +510,20 @@ class TodoApp(ft.Column):
             if status == "All":
                 visible = True
             elif status == "Active":
-                visible = not task.get('completed', False)
+                visible = not task.completed
             elif status == "Completed":
-                visible = task.get('completed', False)
+                visible = task.completed
             else:
                 visible = True
             
             if visible:
                 t = Task(
                     self,
-                    task['id'],
-                    task['task'],
-                    task.get('deadline', ''),
-                    task.get('priority', 'Medium'),
-                    task.get('completed', False)
+                    task.id,
+                    task.text,
+                    task.deadline,
+                    task.priority,
+                    task.completed
                 )
                 if self.is_dark:
                    t.update_theme(DARK_THEME) # Apply dark theme if active
@@ -462,7 +531,7 @@ class TodoApp(ft.Column):
         self.update_count()
 
     def update_count(self):
-        count = sum(1 for t in self.tasks if not t.get('completed', False))
+        count = sum(1 for t in self.tasks if not t.completed)
         self.items_left.value = f"{count} items left"
         if hasattr(self.items_left, 'page') and self.items_left.page:
             self.items_left.update()
@@ -471,7 +540,7 @@ class TodoApp(ft.Column):
         if os.path.exists(self.tasks_file):
             try:
                 with open(self.tasks_file, 'r') as f:
-                    self.tasks = json.load(f)
+                    self.tasks = [TaskRecord.from_dict(t) for t in json.load(f)]
             except:
                 self.tasks = []
         else:
@@ -479,7 +548,7 @@ class TodoApp(ft.Column):
 
     def save_tasks(self):
         with open(self.tasks_file, 'w') as f:
-            json.dump(self.tasks, f, indent=4)
+            json.dump([t.to_dict() for t in self.tasks], f, indent=4)
 
 def main(page: ft.Page):
     page.title = "Habito-do"
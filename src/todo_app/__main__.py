@@ -1,15 +1,75 @@
-"""Entry point for `python -m todo_app`."""
+"""Entry point for `python -m todo_app`.
 
+Usage:
+    python -m todo_app                               # launch the GUI
+    python -m todo_app --storage journal             # ... with another backend
+    python -m todo_app convert SRC DST [--to FORMAT] # convert a task file
+"""
+
+import argparse
 import os
 import sys
-import tkinter as tk
 
-from .app import TodoApp
-from .constants import MIN_WINDOW_HEIGHT, MIN_WINDOW_WIDTH
+from .constants import (
+    DEFAULT_STORAGE_BACKEND,
+    FILE_FORMATS,
+    MIN_WINDOW_HEIGHT,
+    MIN_WINDOW_WIDTH,
+)
+from .storage import STORAGE_BACKENDS
+
+
+def build_parser():
+    """Create the command-line argument parser."""
+    parser = argparse.ArgumentParser(
+        prog="todo_app", description="A modern, feature-rich To-Do List application."
+    )
+    parser.add_argument(
+        "--storage",
+        choices=sorted(STORAGE_BACKENDS),
+        default=DEFAULT_STORAGE_BACKEND,
+        help="Persistence backend for the GUI; journal and sqlite write only "
+        f"the changed tasks on each save (default: {DEFAULT_STORAGE_BACKEND})",
+    )
+    subparsers = parser.add_subparsers(dest="command")
+
+    convert = subparsers.add_parser(
+        "convert", help="Convert a task file between JSON and the binary format"
+    )
+    convert.add_argument("src", help="Existing task file (format is auto-detected)")
+    convert.add_argument("dst", help="File to write (may equal SRC)")
+    convert.add_argument(
+        "--to",
+        choices=FILE_FORMATS,
+        default=None,
+        help="Target format (default: the opposite of the source format)",
+    )
+    return parser
+
+
+def convert(args):
+    """Run the `convert` subcommand."""
+    from .storage import convert_file
 
+    try:
+        count, file_format = convert_file(args.src, args.dst, args.to)
+    except (OSError, ValueError) as e:
+        print(f"Conversion failed: {e}", file=sys.stderr)
+        return 1
+    print(f"Wrote {count} task(s) to {args.dst} ({file_format})")
+    return 0
+
+
+def launch(storage_backend=DEFAULT_STORAGE_BACKEND):
+    """Launch the To-Do List application.
+
+    Args:
+        storage_backend: Key into :data:`~todo_app.storage.STORAGE_BACKENDS`.
+    """
+    import tkinter as tk
+
+    from .app import TodoApp
 
-def main():
-    """Launch the To-Do List application."""
     # Determine data directory (project_root/data/)
     package_dir = os.path.dirname(os.path.abspath(__file__))
     project_root = os.path.dirname(os.path.dirname(package_dir))
@@ -19,11 +79,23 @@ def main():
     root = tk.Tk()
     root.minsize(MIN_WINDOW_WIDTH, MIN_WINDOW_HEIGHT)
 
-    app = TodoApp(root, data_dir=data_dir)
+    app = TodoApp(root, data_dir=data_dir, storage_backend=storage_backend)
     app.change_theme()  # Apply initial theme fully
 
-    root.mainloop()
+    try:
+        root.mainloop()
+    finally:
+        app.close()  # Drain the background writer before exiting
+    return 0
+
+
+def main(argv=None):
+    """Dispatch to the GUI or a subcommand."""
+    args = build_parser().parse_args(argv)
+    if args.command == "convert":
+        return convert(args)
+    return launch(args.storage)
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
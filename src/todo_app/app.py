@@ -1,6 +1,12 @@
 """Main application module - TodoApp Tkinter GUI."""
 
+import gc
+import itertools
+import json
 import math
+import operator
+import os
+import time
 import tkinter as tk
 from datetime import date, datetime
 from tkinter import messagebox, ttk
@@ -9,6 +15,7 @@ from tkcalendar import DateEntry
 
 from .constants import (
     APP_TITLE,
+    ARCHIVE_FILENAME,
     BASE_FONT,
     BOLD_FONT,
     CARD_TITLE_FONT,
@@ -22,37 +29,65 @@ from .constants import (
     DATE_FORMAT,
     DEFAULT_CATEGORY,
     DEFAULT_FILTER,
+    DEFAULT_SEARCH_MODE,
     DEFAULT_PRIORITY,
     DEFAULT_SORT_COLUMN,
+    DEFAULT_STORAGE_BACKEND,
     DEFAULT_THEME,
     DEFAULT_WINDOW_SIZE,
     HEADER_FONT,
     KEYBOARD_SHORTCUTS,
     LABEL_FONT,
+    LOAD_BATCH_SIZE,
+    LOAD_SLICE_MS,
     PRIORITY_COLORS,
     PRIORITY_LEVELS,
-    PRIORITY_ORDER,
+    SEARCH_DEBOUNCE_MS,
+    SEARCH_MODES,
     SMALL_FONT,
     STAT_OVERDUE_COLOR,
     STAT_PENDING_COLOR,
     STAT_TOTAL_COLOR,
     STAT_VALUE_FONT,
     TREEVIEW_COLUMNS,
+    TREEVIEW_ROW_HEIGHT,
+    VIEW_BUSY_DELAY_MS,
+    VIEW_POLL_INTERVAL_MS,
+    WATCH_POLL_INTERVAL_MS,
+    WATCH_RESULT_POLL_MS,
     WELCOME_FONT,
+    WRITER_POLL_INTERVAL_MS,
 )
-from .storage import TaskStorage
+from .archive import (
+    ArchiveFormatError,
+    CompletedArchive,
+    is_archivable,
+)
+from .cache import StartupCache
+from .dates import remember_deadline_ordinals
+from .models import Task
+from .query import Clause, Query, QueryError, parse_query
+from .refresh import RefreshScheduler
+from .storage import create_storage
+from .table import TaskTable
 from .themes import THEMES
+from .view_worker import ViewWorker
+from .virtual_list import VirtualTaskList
+from .watcher import FileWatcher
+from .writer import WriteBehindWriter
 
 
 class TodoApp:
     """Main To-Do List application with Tkinter GUI."""
 
-    def __init__(self, root, data_dir):
+    def __init__(self, root, data_dir, storage_backend=DEFAULT_STORAGE_BACKEND):
         """Initialize the application.
 
         Args:
             root: The Tkinter root window.
             data_dir: Directory path for storing task data.
+            storage_backend: Name of the persistence backend
+                ("json", "journal" or "sqlite").
         """
         self.root = root
         self.root.title(APP_TITLE)
@@ -60,10 +95,19 @@ class TodoApp:
         self.style = ttk.Style()
 
         # Initialize storage
-        self.storage = TaskStorage(
-            filepath=__import__("os").path.join(data_dir, "tasks.json")
-        )
+        self.storage = create_storage(data_dir, backend=storage_backend)
+        self.cache = StartupCache(data_dir)
+        self.archive = self._open_archive(os.path.join(data_dir, ARCHIVE_FILENAME))
+        self._unarchived = set()  # archived IDs moved back into self.tasks
+        self.watcher = None
+        if self.storage.supports_external_changes:
+            self.watcher = FileWatcher(
+                self.root,
+                self.storage.source_paths + [self.archive.filepath],
+                self._on_files_changed,
+            )
         self.is_first_run = not self.storage.exists
+        self.writer = WriteBehindWriter(self.storage)
 
         # Theme configuration
         self.themes = THEMES
@@ -71,8 +115,38 @@ class TodoApp:
 
         # Core data structures
         self.tasks = []
+        self.table = TaskTable()  # columnar copy of self.tasks for statistics
+        # Sort orders, word and trigram indexes, on a background thread
+        self.view_worker = ViewWorker()
+        self._refresh_after_id = None  # pending debounced update_treeview
+        # Views repainted once per idle pass, however often they are marked
+        self.refresh = RefreshScheduler(
+            self.root,
+            {
+                "tasks": self.update_treeview,
+                "status": self.update_status,
+                "dashboard": self.update_dashboard,
+            },
+        )
+        self._shown_view = None  # (filter, query, mode) the Treeview last showed
+        self._pending_view = None  # (query, mode) of the list being computed
+        self._view_poll_id = None
+        self._external_poll_id = None  # waiting for the writer's external changes
+        self._view_submitted = 0.0  # time.monotonic() of the last request
+        self._view_busy_shown = False  # the status bar says the list is updating
+        # Derived views of self.tasks, all kept current by the same calls
+        self._indexes = (self.table, self.view_worker)
+        self._positions = {}  # task ID -> index in self.tasks
+        self._load_stream = None  # TaskStream while a load is in progress
+        self._load_trigrams = None  # cached fuzzy postings, applied after the load
+        self._load_iter = None
+        self._load_gc_enabled = None  # gc.isenabled() before the load paused it
+        self._load_after_id = None  # the next scheduled load slice
+        self._save_after_load = False
+        self._in_sync_with_disk = False  # self.tasks mirrors the storage files
         self.sort_column = DEFAULT_SORT_COLUMN
         self.sort_order = True  # True = ascending
+        self._sort_active = False  # show file order until a heading is clicked
         self.categories = list(CATEGORIES)
 
         # Configure base style and build UI
@@ -83,8 +157,7 @@ class TodoApp:
 
         # Load existing tasks
         self.load_tasks()
-        self.update_status()
-        self.update_dashboard()
+        self.refresh.mark("status", "dashboard")
 
         # Keyboard shortcuts
         self.root.bind("<Control-n>", lambda e: self.task_entry.focus())
@@ -92,16 +165,112 @@ class TodoApp:
         self.root.bind("<Delete>", lambda e: self.remove_task())
         self.root.bind("<Control-s>", lambda e: self.save_tasks())
 
+        self.root.after(WRITER_POLL_INTERVAL_MS, self._poll_write_errors)
+        if self.watcher is not None:
+            self.watcher.start()
+
     # ------------------------------------------------------------------ #
     #  Task Lookup                                                        #
     # ------------------------------------------------------------------ #
 
     def _find_task_by_id(self, task_id):
         """Find a task by its unique ID."""
+        index = self._positions.get(task_id)
+        return None if index is None else self.tasks[index]
+
+    def _set_tasks(self, tasks):
+        """Replace the task list, rebuilding the indexes."""
+        self.tasks = []
+        for index in self._indexes:
+            index.reset()
+        self._positions = {}
+        self._append_tasks(tasks)
+
+    def _append_tasks(self, tasks):
+        """Add tasks to the end of the list and to the indexes."""
+        start = len(self.tasks)
+        self.tasks.extend(tasks)
+        for index in self._indexes:
+            index.extend(self.tasks[start:])
+        for index in range(start, len(self.tasks)):
+            self._index_task(index)
+
+    def _index_task(self, index):
+        """Record the position of ``self.tasks[index]`` in the ID index.
+
+        Only string IDs (the Treeview item IDs) are indexed; if several
+        tasks share an ID, the first one is found.
+        """
+        task_id = self.tasks[index].id
+        if isinstance(task_id, str) and task_id not in self._positions:
+            self._positions[task_id] = index
+
+    def _task_updated(self, task):
+        """Bring the indexes up to date after editing ``task``."""
+        for index in self._indexes:
+            index.update(task)
+
+    def _replace_task(self, position, task):
+        """Put ``task`` in place of the task at ``self.tasks[position]``."""
+        for index in self._indexes:
+            index.replace(self.tasks[position], task)
+        self.tasks[position] = task
+
+    def _reindex(self):
+        """Rebuild the ID index after ``self.tasks`` was reordered."""
+        self._positions = {}
+        for index in range(len(self.tasks)):
+            self._index_task(index)
+
+    def _unarchive(self, task_id):
+        """Move an archived task back into the working list.
+
+        The archive entry is hidden until :meth:`close` (or the next load)
+        drops it, so the task is never missing from disk in between.
+
+        Returns:
+            The Task, or None if ``task_id`` is not archived.
+        """
+        task = self._archived_task(task_id)
+        if task is None:
+            return None
+        self._unarchived.add(task_id)
+        self._append_tasks([task])
+        return task
+
+    def _archived_task(self, task_id):
+        """Return a Task read from the archive, leaving the archive as it is.
+
+        Returns:
+            The Task, or None if ``task_id`` is not archived (or was
+            already moved back into the working list).
+        """
+        if task_id in self._unarchived:
+            return None
+        index = self.archive.index_of(task_id)
+        if index is None:
+            return None
+        return Task.from_dict(self.archive.get(index))
+
+    def _drop_tasks(self, task_ids):
+        """Remove the tasks whose ID is in ``task_ids`` from the list.
+
+        Returns:
+            int: The number of tasks removed.
+        """
+        task_ids = set(task_ids)
+        kept = []
         for task in self.tasks:
-            if task.get("id") == task_id:
-                return task
-        return None
+            if isinstance(task.id, str) and task.id in task_ids:
+                for index in self._indexes:
+                    index.remove(task)
+            else:
+                kept.append(task)
+        removed = len(self.tasks) - len(kept)
+        if removed:
+            self.tasks = kept
+            self._reindex()
+        return removed
 
     # ------------------------------------------------------------------ #
     #  Context Menu                                                       #
@@ -124,9 +293,9 @@ class TodoApp:
         """Display the context menu at mouse position."""
         item_id = self.tree.identify_row(event.y)
         if item_id:
-            self.tree.selection_set(item_id)
+            self.task_list.selection_set(item_id)
             task = self._find_task_by_id(item_id)
-            if task:
+            if task or self.archive.index_of(item_id) is not None:
                 self.context_menu.post(event.x_root, event.y_root)
 
     # ------------------------------------------------------------------ #
@@ -135,22 +304,22 @@ class TodoApp:
 
     def mark_complete(self):
         """Toggle completion status of selected task(s)."""
-        selected_items = self.tree.selection()
+        selected_items = self.task_list.selection()
         if not selected_items:
             messagebox.showwarning("Warning", "No task selected!")
             return
 
-        updated = False
+        changed = []
         for item_id in selected_items:
-            task = self._find_task_by_id(item_id)
+            task = self._find_task_by_id(item_id) or self._unarchive(item_id)
             if task:
-                task["completed"] = not task["completed"]
-                updated = True
+                task.completed = not task.completed
+                self._task_updated(task)
+                changed.append(task)
 
-        if updated:
-            self.save_tasks()
-            self.update_treeview()
-            self.update_status()
+        if changed:
+            self.save_tasks(changed=changed)
+            self.refresh.mark("tasks", "status", "dashboard")
 
     def add_task(self):
         """Add a new task with current input values."""
@@ -176,25 +345,22 @@ class TodoApp:
             messagebox.showerror("Error", "Invalid date format selected!")
             return
 
-        new_task = {
-            "id": str(uuid.uuid4()),
-            "task": task_text,
-            "deadline": deadline_str,
-            "priority": priority,
-            "category": category,
-            "completed": False,
-        }
-
-        self.tasks.append(new_task)
-        self.save_tasks()
+        new_task = Task(
+            str(uuid.uuid4()),
+            text=task_text,
+            deadline=deadline_str,
+            priority=priority,
+            category=category,
+        )
+
+        self._append_tasks([new_task])
+        self.save_tasks(changed=[new_task])
         self.clear_inputs()
-        self.update_treeview()
-        self.update_status()
-        self.update_dashboard()
+        self.refresh.mark("tasks", "status", "dashboard")
 
     def remove_task(self):
         """Remove selected task(s) after confirmation."""
-        selected_items = self.tree.selection()
+        selected_items = self.task_list.selection()
         if not selected_items:
             messagebox.showwarning("Warning", "No task selected to remove!")
             return
@@ -206,15 +372,23 @@ class TodoApp:
             return
 
         ids_to_remove = list(selected_items)
-        original_count = len(self.tasks)
-        self.tasks = [
-            task for task in self.tasks if task.get("id") not in ids_to_remove
+        removed_count = self._drop_tasks(ids_to_remove)
+        archived_ids = [
+            task_id for task_id in ids_to_remove
+            if self.archive.index_of(task_id) is not None
         ]
-
-        if len(self.tasks) < original_count:
-            self.save_tasks()
-            self.update_treeview()
-            self.update_status()
+        if archived_ids:
+            try:
+                self.archive.update(removed=archived_ids)
+            except OSError as e:
+                messagebox.showerror("Error", f"Failed to update the archive: {e}")
+                archived_ids = []
+            self._unarchived.difference_update(archived_ids)
+
+        if removed_count or archived_ids:
+            if removed_count:
+                self.save_tasks(deleted=ids_to_remove)
+            self.refresh.mark("tasks", "status", "dashboard")
         else:
             messagebox.showerror("Error", "Could not find selected tasks to remove.")
 
@@ -234,77 +408,361 @@ class TodoApp:
     #  Persistence                                                        #
     # ------------------------------------------------------------------ #
 
-    def save_tasks(self):
-        """Save all tasks to disk."""
-        try:
-            self.storage.save(self.tasks)
-        except IOError as e:
-            messagebox.showerror(
-                "Error", f"Failed to save tasks to {self.storage.filepath}: {e}"
+    def save_tasks(self, changed=None, deleted=()):
+        """Queue tasks to be written to disk by the background writer.
+
+        Args:
+            changed: Tasks created or modified by the current action. When
+                given (and the backend supports it), only these tasks and
+                the ``deleted`` IDs are written; otherwise all tasks are.
+            deleted: IDs of tasks removed by the current action.
+        """
+        if changed is None and not deleted or not self.storage.supports_deltas:
+            if self._load_iter is not None:
+                # Never overwrite the file with a partially loaded list
+                self._save_after_load = True
+                return
+            self.writer.submit(self.tasks)
+            self._in_sync_with_disk = True
+            return
+
+        for task in changed or ():
+            self.storage.mark_dirty(task.to_dict())
+        for task_id in deleted:
+            self.storage.mark_deleted(task_id)
+        self.writer.submit_changes()
+
+    def close(self):
+        """Write outstanding saves, refresh the startup cache, release storage."""
+        if self.watcher is not None:
+            self.watcher.stop()
+        if self._external_poll_id is not None:
+            self.root.after_cancel(self._external_poll_id)
+            self._external_poll_id = None
+        self._cancel_load()  # closed mid-load
+        self.writer.close()
+        if self._unarchived and self.writer.last_error is None:
+            try:
+                self.archive.update(removed=self._unarchived)
+            except OSError as e:
+                print(f"Could not update the archive: {e}")
+        self.archive.close()
+        if (
+            self.storage.cacheable
+            and self._in_sync_with_disk
+            and self._load_iter is None
+            and self.writer.last_error is None
+        ):
+            try:
+                self._store_cache()
+            except (OSError, ValueError) as e:
+                print(f"Could not write startup cache: {e}")
+        self.view_worker.close()
+
+    def _store_cache(self):
+        """Write the startup cache from the tasks the file actually holds.
+
+        Saves may have merged in tasks from other programs that are not in
+        ``self.tasks``; caching only ``self.tasks`` would hide those from
+        the next start and let its next save delete them.
+        """
+        ours = [task.to_dict() for task in self.tasks]
+        tasks = self.storage.disk_tasks(ours)
+        if tasks is None:
+            return  # changed by another program; the next start re-reads it
+        trigrams = None
+        if len(tasks) == len(ours) and all(map(operator.is_, tasks, ours)):
+            trigrams = self.view_worker.dump_trigrams(self.tasks)
+        self.cache.store(self.storage.source_paths, tasks, trigrams=trigrams)
+
+    def _poll_write_errors(self):
+        """Report failed background writes on the Tk thread."""
+        for e in self.writer.pop_errors():
+            if isinstance(e, (IOError, OSError)):
+                messagebox.showerror(
+                    "Error", f"Failed to save tasks to {self.storage.filepath}: {e}"
+                )
+            else:
+                messagebox.showerror(
+                    "Error", f"An unexpected error occurred while saving tasks: {e}"
+                )
+        self.root.after(WRITER_POLL_INTERVAL_MS, self._poll_write_errors)
+
+    def _on_files_changed(self):
+        """Pick up edits made to the task files by other programs.
+
+        The file is read and diffed on the writer thread (after any saves
+        still queued), so the Tk thread never waits on it; the changes are
+        applied by :meth:`_apply_external_changes` once they arrive.
+        """
+        if self._load_iter is not None:
+            # The load in progress may predate the change; look again later
+            self.root.after(WATCH_POLL_INTERVAL_MS, self._on_files_changed)
+            return
+
+        self.writer.request_external_changes()
+        if self._external_poll_id is None:
+            self._external_poll_id = self.root.after(
+                WATCH_RESULT_POLL_MS, self._poll_external_changes
             )
-        except Exception as e:
-            messagebox.showerror(
-                "Error", f"An unexpected error occurred while saving tasks: {e}"
+
+    def _poll_external_changes(self):
+        """Apply the writer's external-change results once they are ready."""
+        self._external_poll_id = None
+        changes = self.writer.pop_external_changes()
+        if self.writer.external_changes_pending:
+            self._external_poll_id = self.root.after(
+                WATCH_RESULT_POLL_MS, self._poll_external_changes
             )
+        if changes is not None:
+            self._apply_external_changes(changes)
+
+    def _apply_external_changes(self, changes):
+        """Apply other programs' edits to the tasks and the archive.
+
+        Only the tasks that changed are updated in ``self.tasks`` and the
+        Treeview; the file is never reloaded as a whole.
+
+        Args:
+            changes: Task ID -> task dictionary (None if deleted), as
+                returned by ``poll_external_changes``.
+        """
+        try:
+            archive_changed = self.archive.refresh()
+        except ArchiveFormatError as e:
+            print(f"Ignoring unreadable archive update: {e}")
+            archive_changed = False
+        if not changes and not archive_changed:
+            return
+
+        _, search_text, search_mode = self._view_filter()
+        ranked = search_mode == "Fuzzy" and search_text
+        try:
+            query = self._view_query()
+        except QueryError:
+            query = None  # the list shows the error until the search changes
+        removed = set()
+        hidden = []  # rows to drop from the list in one pass
+        for task_id, data in changes.items():
+            index = self._positions.get(task_id)
+            task = None if data is None else Task.from_dict(data)
+            if task is None:
+                if index is not None:
+                    removed.add(task_id)
+            elif index is not None:
+                self._replace_task(index, task)
+            else:
+                self._append_tasks([task])
+            if not ranked and not self._refresh_task_row(task_id, task, query):
+                hidden.append(task_id)
+        self.task_list.remove_many(hidden)
+        if removed:
+            self._drop_tasks(removed)
+
+        if ranked or archive_changed and query is not None and query.completed():
+            self.refresh.mark("tasks")
+        self.refresh.mark("status", "dashboard")
 
     def load_tasks(self):
-        """Load tasks from disk."""
+        """Load tasks from disk progressively.
+
+        The window first appears with an empty list. Tasks are then read
+        from the startup cache, or parsed incrementally from the file, and
+        added to the list in slices of about ``LOAD_SLICE_MS`` between
+        event-loop turns. The first screen of rows shows after the first
+        slice, the status bar reports progress, and the window stays
+        responsive however large the file is.
+        """
+        self._set_tasks([])
+        self.update_treeview()
+        # While the list grows, every full collection rescans all tasks
+        # loaded so far, stalling the UI longer with each slice. The
+        # collector is paused until this load ends, however it ends.
+        self._cancel_load()  # a load this one replaces
+        self._load_gc_enabled = gc.isenabled()
+        gc.disable()
+        self._save_after_load = False
+        self._load_trigrams = None
+        self._load_iter = self._load_source()  # reads nothing until iterated
+        self._load_after_id = self.root.after(1, self._load_next_batch)
+
+    def _load_source(self):
+        """Yield the task dictionaries to load, from the cache if it is current."""
+        cached = None
+        if self.storage.cacheable:
+            cached = self.cache.load(self.storage.source_paths)
+        if cached is not None:
+            remember_deadline_ordinals(cached.deadline_ordinals)
+            self._load_trigrams = cached.trigrams
+            self._load_stream = self.storage.stream_cached(cached.tasks)
+        else:
+            self._load_stream = self.storage.stream()
+        yield from self._load_stream
+
+    def _load_next_batch(self):
+        """Add streamed tasks for about ``LOAD_SLICE_MS``, then reschedule."""
+        self._load_after_id = None
         try:
-            tasks, was_updated = self.storage.load()
-            self.tasks = tasks
-            if was_updated:
-                self.save_tasks()
-            self.update_treeview()
-        except FileNotFoundError:
-            self.tasks = []
-            self.update_treeview()
-        except __import__("json").JSONDecodeError:
+            self._load_slice()
+        except BaseException:
+            self._resume_gc()
+            raise
+
+    def _load_slice(self):
+        """Do the work of :meth:`_load_next_batch`."""
+        deadline = time.perf_counter() + LOAD_SLICE_MS / 1000
+        _, search_text, search_mode = self._view_filter()
+        ranked = search_mode == "Fuzzy" and search_text
+        try:
+            query = self._view_query()
+        except QueryError:
+            query = None
+        while True:
+            try:
+                batch = [
+                    Task.from_dict(data)
+                    for data in itertools.islice(self._load_iter, LOAD_BATCH_SIZE)
+                ]
+            except Exception as e:
+                self._load_failed(e)
+                return
+
+            self._append_tasks(batch)
+            if not ranked:  # ranked results are shown once loading finishes
+                self.task_list.extend(
+                    (task.id, task)
+                    for task in batch
+                    if self._task_matches(task, query)
+                )
+            if len(batch) < LOAD_BATCH_SIZE:
+                break
+            if time.perf_counter() >= deadline:
+                self.update_status()
+                self._load_after_id = self.root.after(1, self._load_next_batch)
+                return
+
+        # Loaded tasks live as long as the app; freezing them keeps every
+        # later full collection from rescanning the whole list
+        gc.freeze()
+        self._resume_gc()
+        was_updated = self._load_stream.updated or self._save_after_load
+        self._load_stream = self._load_iter = None
+        self._in_sync_with_disk = True
+        if self._load_trigrams is not None:
+            self.view_worker.restore_trigrams(self.tasks, self._load_trigrams)
+            self._load_trigrams = None
+        if was_updated:
+            self.save_tasks()
+        if self._archive_completed() or ranked:
+            self.refresh.mark("tasks")
+        self.refresh.mark("status", "dashboard")
+
+    def _open_archive(self, filepath):
+        """Open the completed-task archive, setting aside an unreadable one."""
+        try:
+            return CompletedArchive(filepath)
+        except (OSError, ArchiveFormatError) as e:
+            corrupt_path = filepath + ".corrupt"
+            try:
+                os.replace(filepath, corrupt_path)
+            except OSError:
+                raise e from None
+            messagebox.showerror(
+                "Error",
+                f"The completed-task archive could not be read ({e}). "
+                f"It was moved to {corrupt_path}.",
+            )
+            return CompletedArchive(filepath)
+
+    def _archive_completed(self):
+        """Move completed tasks from the working list into the archive.
+
+        Archived copies of tasks that are live again are dropped at the same
+        time. The archive is written before the tasks are removed from the
+        main storage, so an interruption can only leave a task in both
+        places, which the next load resolves.
+
+        Returns:
+            bool: True if the archive or the working list changed.
+        """
+        completed = [
+            data
+            for data in (task.to_dict() for task in self.tasks if task.completed)
+            if is_archivable(data)
+        ]
+        moved = {data["id"] for data in completed}
+        archived_ids = set(self.archive.ids())
+        shadowed = [
+            task.id
+            for task in self.tasks
+            if isinstance(task.id, str)
+            and task.id in archived_ids
+            and task.id not in moved
+        ]
+        if not completed and not shadowed:
+            return False
+
+        try:
+            self.archive.update(added=completed, removed=shadowed)
+        except (OSError, ValueError) as e:
+            print(f"Could not archive completed tasks: {e}")
+            return False
+        self._unarchived.clear()
+        if completed:
+            self._drop_tasks(moved)
+            self.save_tasks(deleted=list(moved))
+        return True
+
+    def _cancel_load(self):
+        """Stop running slices of a load in progress, if any.
+
+        The load still counts as unfinished (``_load_iter`` is kept), so the
+        partial list is never saved or cached.
+        """
+        if self._load_after_id is not None:
+            self.root.after_cancel(self._load_after_id)
+            self._load_after_id = None
+        self._resume_gc()
+
+    def _resume_gc(self):
+        """Undo the pause of garbage collection by :meth:`load_tasks`, if any."""
+        if self._load_gc_enabled is None:
+            return
+        if self._load_gc_enabled:
+            gc.enable()
+        self._load_gc_enabled = None
+
+    def _load_failed(self, error):
+        """Reset to an empty task list after a failed load."""
+        self._resume_gc()
+        self._load_stream = self._load_iter = None
+        self._in_sync_with_disk = isinstance(error, FileNotFoundError)
+        if isinstance(error, json.JSONDecodeError):
             messagebox.showerror(
                 "Error",
                 "Error reading tasks file. File might be corrupted. Starting fresh.",
             )
-            self.tasks = []
-            self.update_treeview()
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to load tasks: {e}")
-            self.tasks = []
-            self.update_treeview()
+        elif not isinstance(error, FileNotFoundError):
+            messagebox.showerror("Error", f"Failed to load tasks: {error}")
+        self._set_tasks([])
+        self.refresh.mark("tasks", "status", "dashboard")
 
     # ------------------------------------------------------------------ #
     #  Sorting                                                            #
     # ------------------------------------------------------------------ #
 
     def sort_tasks(self, column):
-        """Sort tasks by the given column."""
-        if self.sort_column == column:
+        """Sort tasks by the given column.
+
+        Every column's order is kept up to date by ``self.view_worker``,
+        so this only switches which one the task list shows.
+        """
+        if self._sort_active and self.sort_column == column:
             self.sort_order = not self.sort_order
         else:
             self.sort_column = column
             self.sort_order = True
-
-        reverse = not self.sort_order
-
-        if column == "deadline":
-            def deadline_key(task):
-                try:
-                    return datetime.strptime(task.get("deadline", ""), DATE_FORMAT)
-                except (ValueError, TypeError):
-                    return datetime.max
-            key_func = deadline_key
-        elif column == "priority":
-            key_func = lambda task: PRIORITY_ORDER.get(
-                task.get("priority", DEFAULT_PRIORITY), 2
-            )
-        elif column == "completed":
-            key_func = lambda task: task.get("completed", False)
-        else:
-            key_func = lambda task: task.get("task", "").lower()
-
-        try:
-            self.tasks.sort(key=key_func, reverse=reverse)
-        except Exception as e:
-            messagebox.showerror("Sort Error", f"Could not sort tasks: {e}")
-            return
+        self._sort_active = True
 
         for col in self.tree["columns"]:
             indicator = ""
@@ -319,71 +777,202 @@ class TodoApp:
     # ------------------------------------------------------------------ #
 
     def update_treeview(self):
-        """Refresh the task list based on current filters and search."""
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        """Refresh the task list based on current filters, search and sort.
 
-        current_filter = self.filter_combo.get()
-        search_query = self.search_entry.get().strip().lower()
+        Unless every task is shown in file order, ``self.view_worker``
+        works out the matching tasks off the Tk thread, and
+        :meth:`_poll_view` shows them once they arrive.
+        """
+        self._cancel_view_refresh()
+        self.refresh.discard("tasks")
+        self._shown_view = self._view_filter()
+        search_mode = self._shown_view[2]
+        try:
+            query = self._view_query()
+        except QueryError as e:
+            self.view_worker.cancel()
+            self.task_list.set_items(())
+            self._view_busy_shown = False
+            self.status_bar.config(text=f"Invalid search: {e}")
+            return
+        self._pending_view = (query, search_mode)
+        if query or self._sort_active:
+            sort = None
+            if self._sort_active:
+                sort = (self.sort_column, not self.sort_order)
+            self.view_worker.submit(query, search_mode, sort)
+            self._view_submitted = time.monotonic()
+            if self._view_poll_id is None:
+                self._view_poll_id = self.root.after(
+                    VIEW_POLL_INTERVAL_MS, self._poll_view
+                )
+        else:
+            self.view_worker.cancel()
+            self._show_view(self.tasks)
 
-        for task in self.tasks:
-            task_id = task.get("id")
-            if not task_id:
-                continue
+        self.tree.tag_configure("overdue", foreground="#EF4444")
+        self.tree.tag_configure("due_today", foreground="#F59E0B")
 
-            task_completed = task.get("completed", False)
-            task_category = task.get("category", DEFAULT_CATEGORY)
+    def schedule_view_refresh(self):
+        """Refresh the task list once typing or filter changes pause.
 
-            # Status / category filter
-            if current_filter == "Completed" and not task_completed:
-                continue
-            elif current_filter == "Pending" and task_completed:
-                continue
-            elif current_filter in self.categories and task_category != current_filter:
-                continue
+        Each call restarts the delay, so a burst of keystrokes results in
+        a single :meth:`update_treeview`.
+        """
+        self._cancel_view_refresh()
+        self._refresh_after_id = self.root.after(
+            SEARCH_DEBOUNCE_MS, self._run_view_refresh
+        )
 
-            # Text search filter
-            if search_query:
-                searchable = " ".join(
-                    [
-                        task.get("task", ""),
-                        task.get("deadline", ""),
-                        task.get("priority", ""),
-                        task_category,
-                    ]
-                ).lower()
-                if search_query not in searchable:
-                    continue
+    def _run_view_refresh(self):
+        self._refresh_after_id = None
+        if self._view_filter() != self._shown_view:  # e.g. not just arrow keys
+            self.update_treeview()
 
-            display_completed = "✓" if task_completed else "✗"
-            display_values = (
-                task.get("task", ""),
-                task_category,
-                task.get("deadline", ""),
-                task.get("priority", DEFAULT_PRIORITY),
-                display_completed,
+    def _cancel_view_refresh(self):
+        if self._refresh_after_id is not None:
+            self.root.after_cancel(self._refresh_after_id)
+            self._refresh_after_id = None
+
+    def _poll_view(self):
+        """Show the list computed by the view worker, once it is ready."""
+        self._view_poll_id = None
+        try:
+            tasks = self.view_worker.poll()
+        except Exception as e:
+            print(f"Could not update the task list: {e}")
+            self._view_busy_shown = False
+            self.status_bar.config(text=f"Could not update the task list: {e}")
+            return
+        if tasks is not None:
+            self._show_view(tasks)
+        elif self.view_worker.busy:
+            waited_ms = (time.monotonic() - self._view_submitted) * 1000
+            if not self._view_busy_shown and waited_ms >= VIEW_BUSY_DELAY_MS:
+                self._view_busy_shown = True
+                self.status_bar.config(text="Updating task list...")
+            self._view_poll_id = self.root.after(
+                VIEW_POLL_INTERVAL_MS, self._poll_view
             )
 
-            try:
-                tags = ()
-                if not task_completed:
-                    try:
-                        d = datetime.strptime(
-                            task.get("deadline", ""), DATE_FORMAT
-                        ).date()
-                        if d < date.today():
-                            tags = ("overdue",)
-                        elif d == date.today():
-                            tags = ("due_today",)
-                    except (ValueError, TypeError):
-                        pass
-
-                self.tree.insert("", "end", iid=task_id, values=display_values, tags=tags)
-            except tk.TclError as e:
-                print(f"Error inserting task {task_id}: {e}")
+    def _show_view(self, tasks):
+        """Show ``tasks``, the matching tasks in display order, in the list."""
+        query, search_mode = self._pending_view
+        self.task_list.set_items(self._visible_items(tasks, query, search_mode))
+        if self._view_busy_shown:
+            self._view_busy_shown = False
+            self.update_status()
 
-        self.tree.tag_configure("overdue", foreground="#EF4444")
-        self.tree.tag_configure("due_today", foreground="#F59E0B")
+    def _view_filter(self):
+        """Return the (status/category filter, search text, search mode)."""
+        return (
+            self.filter_combo.get(),
+            self.search_entry.get().strip(),
+            self.search_mode_combo.get(),
+        )
+
+    def _view_query(self):
+        """Compile the filter combobox and the search box into one query.
+
+        Raises:
+            QueryError: If the search box holds an invalid query.
+        """
+        current_filter, search_text, _ = self._view_filter()
+        query = parse_query(search_text)
+        if current_filter == "Completed":
+            clause = Clause("completed", True)
+        elif current_filter == "Pending":
+            clause = Clause("completed", False)
+        elif current_filter in self.categories:
+            clause = Clause("category", frozenset([current_filter.lower()]))
+        else:
+            return query
+        return Query([clause]) & query
+
+    def _task_matches(self, task, query):
+        """Check whether an indexed task can be listed and matches ``query``.
+
+        A None query (an invalid search) matches nothing.
+        """
+        return query is not None and bool(task.id) and query.matches(task)
+
+    def _visible_items(self, tasks, query, search_mode):
+        """Yield the ``(iid, source)`` pairs the task list should show.
+
+        ``tasks`` are the tasks matching ``query`` in display order; any
+        matching archived tasks follow them. Sources are tasks, or archive
+        indexes for archived tasks; rows are only rendered from them (see
+        :meth:`_row_values`) when scrolled into view.
+        """
+        for task in tasks:
+            if task.id:
+                yield task.id, task
+        # Fuzzy results are ranked; archived tasks are only searched exactly
+        if query.completed() and not (search_mode == "Fuzzy" and query.text_terms()):
+            yield from self._archived_items(query)
+
+    def _insert_task_row(self, task):
+        """Append a row for a task to the task list."""
+        self.task_list.append(task.id, task)
+
+    def _row_values(self, source):
+        """Return the (values, tags) of a task list row."""
+        if isinstance(source, Task):
+            return self._row_display(source)
+        text, category, deadline, priority = self.archive.row(source)
+        return (text, category, deadline, priority, "✓"), ()
+
+    def _row_display(self, task):
+        """Return the (values, tags) shown in a task's Treeview row."""
+        display_values = (
+            task.text,
+            task.category,
+            task.deadline,
+            task.priority,
+            "✓" if task.completed else "✗",
+        )
+
+        tags = ()
+        if not task.completed and task.due_ordinal is not None:
+            today = date.today().toordinal()
+            if task.due_ordinal < today:
+                tags = ("overdue",)
+            elif task.due_ordinal == today:
+                tags = ("due_today",)
+        return display_values, tags
+
+    def _refresh_task_row(self, task_id, task, query):
+        """Update or add one task's row to match ``task`` (None = deleted).
+
+        Returns:
+            bool: False if the row should be dropped from the list instead;
+            the caller removes such rows together.
+        """
+        if task is not None and self._task_matches(task, query):
+            self._insert_task_row(task)  # updates the row if already shown
+            return True
+        return False
+
+    def _archived_items(self, query):
+        """Yield ``(iid, archive index)`` pairs of archived tasks matching ``query``.
+
+        Rows are read straight from the archive's columns and ordered by
+        the current sort column. The archive's own word search narrows
+        them down; other terms are checked on each remaining row.
+        """
+        indexes = self.archive.search(" ".join(query.text_terms()))
+        indexes.sort(key=self.archive.sort_key(self.sort_column), reverse=not self.sort_order)
+        rest = Query(c for c in query.without_text().clauses if c.field != "completed")
+        for index in indexes:
+            task_id = self.archive.task_id(index)
+            if task_id in self._unarchived:
+                continue
+            if rest:
+                text, category, deadline, priority = self.archive.row(index)
+                task = Task(task_id, text, deadline, priority, category, completed=True)
+                if not rest.matches(task):
+                    continue
+            yield task_id, index
 
     # ------------------------------------------------------------------ #
     #  Edit Task                                                          #
@@ -398,13 +987,14 @@ class TodoApp:
     def edit_task(self, task_id=None):
         """Open the edit dialog for a task."""
         if not task_id:
-            selected_items = self.tree.selection()
+            selected_items = self.task_list.selection()
             if not selected_items:
                 messagebox.showwarning("Warning", "No task selected to edit!")
                 return
             task_id = selected_items[0]
 
-        task_to_edit = self._find_task_by_id(task_id)
+        # An archived task only leaves the archive once the edit is saved
+        task_to_edit = self._find_task_by_id(task_id) or self._archived_task(task_id)
         if not task_to_edit:
             messagebox.showerror(
                 "Error", "Could not find the selected task to edit."
@@ -431,7 +1021,7 @@ class TodoApp:
         ).pack(anchor="w", pady=(0, 8))
         task_entry = ttk.Entry(main_frame, style="TEntry", width=60)
         task_entry.pack(fill="x", pady=(0, 25))
-        task_entry.insert(0, task_to_edit.get("task", ""))
+        task_entry.insert(0, task_to_edit.text)
         task_entry.focus_set()
         task_entry.bind("<Tab>", lambda e: cal.focus_set())
         task_entry.bind("<Return>", lambda e: "break")
@@ -442,12 +1032,11 @@ class TodoApp:
         ).pack(anchor="w", pady=(0, 8))
         cal = DateEntry(main_frame, width=30, date_pattern="dd-mm-yyyy", style="TEntry")
         cal.pack(fill="x", pady=(0, 25))
-        try:
-            cal.set_date(
-                datetime.strptime(task_to_edit.get("deadline", ""), DATE_FORMAT)
-            )
-        except (ValueError, TypeError):
-            cal.set_date(date.today())
+        cal.set_date(
+            date.fromordinal(task_to_edit.due_ordinal)
+            if task_to_edit.due_ordinal is not None
+            else date.today()
+        )
         cal.bind("<Return>", lambda e: "break")
         cal.bind("<Tab>", lambda e: category_combo.focus_set())
 
@@ -463,7 +1052,7 @@ class TodoApp:
             width=30,
         )
         category_combo.pack(fill="x", pady=(0, 25))
-        category_combo.set(task_to_edit.get("category", DEFAULT_CATEGORY))
+        category_combo.set(task_to_edit.category)
         if (
             DEFAULT_CATEGORY not in self.categories
             and not category_combo.get()
@@ -485,12 +1074,12 @@ class TodoApp:
             width=30,
         )
         priority_combo.pack(fill="x", pady=(0, 25))
-        priority_combo.set(task_to_edit.get("priority", DEFAULT_PRIORITY))
+        priority_combo.set(task_to_edit.priority)
         priority_combo.bind("<Return>", lambda e: "break")
         priority_combo.bind("<Tab>", lambda e: completed_cb.focus_set())
 
         # --- Completed ---
-        completed_var = tk.BooleanVar(value=task_to_edit.get("completed", False))
+        completed_var = tk.BooleanVar(value=task_to_edit.completed)
         completed_cb = ttk.Checkbutton(
             main_frame,
             text="Mark as completed",
@@ -536,21 +1125,16 @@ class TodoApp:
                 cal.focus_set()
                 return
 
-            task_to_update = self._find_task_by_id(task_id)
+            task_to_update = self._find_task_by_id(task_id) or self._unarchive(task_id)
             if task_to_update:
-                task_to_update.update(
-                    {
-                        "task": new_text,
-                        "deadline": new_deadline_str,
-                        "priority": new_priority,
-                        "category": category_combo.get(),
-                        "completed": new_completed,
-                    }
-                )
-                self.save_tasks()
-                self.update_treeview()
-                self.update_status()
-                self.update_dashboard()
+                task_to_update.text = new_text
+                task_to_update.set_deadline(new_deadline_str)
+                task_to_update.priority = new_priority
+                task_to_update.category = category_combo.get()
+                task_to_update.completed = new_completed
+                self._task_updated(task_to_update)
+                self.save_tasks(changed=[task_to_update])
+                self.refresh.mark("tasks", "status", "dashboard")
                 edit_dialog.destroy()
             else:
                 messagebox.showerror(
@@ -604,15 +1188,24 @@ class TodoApp:
     # ------------------------------------------------------------------ #
 
     def update_status(self):
-        """Refresh the status bar with current statistics."""
-        total = len(self.tasks)
-        completed = sum(1 for t in self.tasks if t.get("completed", False))
+        """Refresh the status bar with current statistics (or load progress)."""
+        if self._load_iter is not None:
+            progress = 0.0 if self._load_stream is None else self._load_stream.progress
+            self.status_bar.config(text=f"Loading tasks... {progress:.0%}")
+            return
+        archived = self._archived_count()
+        total = len(self.tasks) + archived
+        completed = archived + self.table.count(completed=True)
         pending = total - completed
         pct = (completed / total * 100) if total > 0 else 0
         self.status_bar.config(
             text=f"Total: {total} | Completed: {completed} | Pending: {pending} ({pct:.0f}%)"
         )
 
+    def _archived_count(self):
+        """Return the number of archived tasks not moved back to the list."""
+        return len(self.archive) - len(self._unarchived)
+
     def show_status_tooltip(self, event):
         """Show keyboard-shortcut tooltip near the status bar."""
         self.hide_status_tooltip(None)
@@ -779,7 +1372,7 @@ class TodoApp:
         self.style.configure(
             "Treeview",
             font=BASE_FONT,
-            rowheight=45,
+            rowheight=TREEVIEW_ROW_HEIGHT,
             fieldbackground=theme["tree_bg"],
             background=theme["tree_bg"],
             foreground=theme["tree_fg"],
@@ -908,7 +1501,7 @@ class TodoApp:
         self.notebook.add(self.dashboard_frame, text="   Dashboard   ")
         self.create_dashboard_view(self.dashboard_frame)
 
-        self.notebook.bind("<<NotebookTabChanged>>", lambda e: self.update_dashboard())
+        self.notebook.bind("<<NotebookTabChanged>>", lambda e: self.refresh.mark("dashboard"))
 
     def create_tasks_view(self, parent):
         """Build the tasks tab: inputs, search, treeview, status bar."""
@@ -1006,16 +1599,32 @@ class TodoApp:
         ).grid(row=0, column=0, padx=(0, 10), pady=5, sticky="w")
         self.search_entry = ttk.Entry(controls_frame, style="TEntry")
         self.search_entry.grid(row=0, column=1, padx=5, pady=5, sticky="ew")
-        self.search_entry.bind("<KeyRelease>", lambda e: self.update_treeview())
+        self.search_entry.bind("<KeyRelease>", lambda e: self.schedule_view_refresh())
         self.search_entry.bind(
             "<Escape>",
-            lambda e: [self.search_entry.delete(0, tk.END), self.update_treeview()],
+            lambda e: [self.search_entry.delete(0, tk.END), self.schedule_view_refresh()],
         )
         self.create_tooltip(self.search_entry, "Search tasks (Ctrl+F)\nPress Esc to clear")
+        self.search_mode_combo = ttk.Combobox(
+            controls_frame,
+            values=SEARCH_MODES,
+            width=7,
+            state="readonly",
+            style="Filter.TCombobox",
+        )
+        self.search_mode_combo.grid(row=0, column=2, padx=5, pady=5, sticky="w")
+        self.search_mode_combo.set(DEFAULT_SEARCH_MODE)
+        self.search_mode_combo.bind(
+            "<<ComboboxSelected>>", lambda e: self.schedule_view_refresh()
+        )
+        self.create_tooltip(
+            self.search_mode_combo,
+            "Exact: tasks containing every word\nFuzzy: closest matches first, despite typos",
+        )
 
         ttk.Label(
             controls_frame, text="Filter:", style="TLabel", font=LABEL_FONT
-        ).grid(row=0, column=2, padx=(20, 10), pady=5, sticky="w")
+        ).grid(row=0, column=3, padx=(20, 10), pady=5, sticky="w")
         self.filter_combo = ttk.Combobox(
             controls_frame,
             values=[DEFAULT_FILTER, "Completed", "Pending"] + self.categories,
@@ -1023,14 +1632,16 @@ class TodoApp:
             state="readonly",
             style="Filter.TCombobox",
         )
-        self.filter_combo.grid(row=0, column=3, padx=5, pady=5, sticky="w")
+        self.filter_combo.grid(row=0, column=4, padx=5, pady=5, sticky="w")
         self.filter_combo.set(DEFAULT_FILTER)
-        self.filter_combo.bind("<<ComboboxSelected>>", lambda e: self.update_treeview())
+        self.filter_combo.bind(
+            "<<ComboboxSelected>>", lambda e: self.schedule_view_refresh()
+        )
         self.create_tooltip(self.filter_combo, "Filter tasks by status or category")
 
         ttk.Label(
             controls_frame, text="Theme:", style="TLabel", font=LABEL_FONT
-        ).grid(row=0, column=4, padx=(20, 10), pady=5, sticky="w")
+        ).grid(row=0, column=5, padx=(20, 10), pady=5, sticky="w")
         self.theme_combo = ttk.Combobox(
             controls_frame,
             values=list(self.themes.keys()),
@@ -1038,7 +1649,7 @@ class TodoApp:
             state="readonly",
             style="Filter.TCombobox",
         )
-        self.theme_combo.grid(row=0, column=5, padx=5, pady=5, sticky="w")
+        self.theme_combo.grid(row=0, column=6, padx=5, pady=5, sticky="w")
         self.theme_combo.set(self.current_theme)
         self.theme_combo.bind("<<ComboboxSelected>>", self.change_theme)
         self.create_tooltip(self.theme_combo, "Change application theme")
@@ -1077,9 +1688,10 @@ class TodoApp:
                 stretch=tk.YES if col == "task" else tk.NO,
             )
 
-        vsb = ttk.Scrollbar(tree_frame, orient="vertical", command=self.tree.yview)
+        vsb = ttk.Scrollbar(tree_frame, orient="vertical")
         vsb.pack(side=tk.RIGHT, fill=tk.Y)
-        self.tree.configure(yscrollcommand=vsb.set)
+        # Holds only the rows in view; all row changes go through it
+        self.task_list = VirtualTaskList(self.tree, vsb, self._row_values)
         self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         self.tree.bind("<Double-1>", self.edit_task_event)
         self.tree.bind("<Delete>", lambda e: self.remove_task())
@@ -1135,19 +1747,11 @@ class TodoApp:
         if not hasattr(self, "stat_total"):
             return
 
-        total = len(self.tasks)
-        pending = sum(1 for t in self.tasks if not t.get("completed", False))
-
-        today = date.today()
-        overdue_or_today = 0
-        for t in self.tasks:
-            if not t.get("completed", False):
-                try:
-                    d = datetime.strptime(t.get("deadline", ""), DATE_FORMAT).date()
-                    if d <= today:
-                        overdue_or_today += 1
-                except (ValueError, TypeError):
-                    pass
+        total = len(self.tasks) + self._archived_count()
+        pending = self.table.count(completed=False)
+        overdue_or_today = self.table.count(
+            completed=False, due_on_or_before=date.today().toordinal()
+        )
 
         self.stat_total.set(str(total))
         self.stat_pending.set(str(pending))
@@ -1168,7 +1772,8 @@ class TodoApp:
         if width < 50 or height < 50:
             return
 
-        total = len(self.tasks)
+        archived = self._archived_count()
+        total = len(self.tasks) + archived
         if total == 0:
             self.chart_canvas.create_text(
                 width / 2,
@@ -1179,7 +1784,7 @@ class TodoApp:
             )
             return
 
-        completed_count = sum(1 for t in self.tasks if t.get("completed", False))
+        completed_count = archived + self.table.count(completed=True)
         pending_count = total - completed_count
 
         angles = []
@@ -0,0 +1,460 @@
+"""Memory-mapped, read-only columnar archive of completed tasks.
+
+Completed tasks are rarely edited, so they are moved out of the working
+task list into a single file that is mapped into memory and read in place.
+Rows are never turned into dictionaries unless a caller asks for one.
+
+Layout (all integers little-endian)::
+
+    header      magic (8 bytes), u32 count, u32 offset of each section
+    ids         u32 offsets[count + 1], then NUL-terminated UTF-8 IDs
+    text        u32 offsets[count + 1], then UTF-8 task descriptions
+    search      u32 offsets[count + 1], then NUL-terminated lowercase
+                search text (see :func:`searchable_text`)
+    deadline    i32[count] date ordinals (NO_DEADLINE if not canonical)
+    priority    u16[count] string-table index (NO_STRING if absent)
+    category    u16[count] string-table index (NO_STRING if absent)
+    extra       u32 offsets[count + 1], then JSON objects holding every
+                field that has no column (empty when there are none)
+    strings     JSON array, the shared priority/category string table
+
+Every archived task has ``completed`` set to True, so it is not stored.
+"""
+
+import bisect
+import json
+import mmap
+import os
+import struct
+from datetime import date
+
+from .constants import DATE_FORMAT, DEFAULT_CATEGORY, DEFAULT_PRIORITY, PRIORITY_ORDER
+from .dates import canonical_deadline_ordinal
+from .search_index import matches_terms, query_terms, tokenize
+from .storage import FileLock, atomic_write
+
+FORMAT_VERSION = 1
+MAGIC = b"TODOARC" + bytes([FORMAT_VERSION])
+NO_DEADLINE = -(2**31)
+NO_STRING = 0xFFFF
+
+_SECTIONS = ("ids", "text", "search", "deadline", "priority", "category", "extra", "strings")
+_HEADER = struct.Struct("<8sI" + "I" * len(_SECTIONS))
+_U32 = struct.Struct("<I")
+_COLUMN_KEYS = ("id", "task", "deadline", "priority", "category", "completed")
+
+
+class ArchiveFormatError(ValueError):
+    """Raised when the archive file is corrupt or has the wrong magic."""
+
+
+def searchable_text(task):
+    """Return the lowercase text that the search box is matched against."""
+    fields = (
+        task.get("task", ""),
+        task.get("deadline", ""),
+        task.get("priority", ""),
+        task.get("category", DEFAULT_CATEGORY),
+    )
+    return " ".join(value if isinstance(value, str) else "" for value in fields).lower()
+
+
+def is_archivable(task):
+    """Check whether a task can be moved to the archive."""
+    task_id = task.get("id")
+    return task.get("completed") is True and isinstance(task_id, str) and bool(task_id)
+
+
+class CompletedArchive:
+    """Read-only view over the archive file, with whole-file rewrites.
+
+    Reads go straight to the mapped file: :meth:`row` decodes only the
+    displayed columns of one task, :meth:`search` scans the search column
+    with ``mmap.find`` and :meth:`sort_key` reads fixed-width columns.
+    :meth:`update` rewrites the file atomically and remaps it, holding the
+    data directory's :class:`~todo_app.storage.FileLock` so that archives
+    written by other instances are picked up rather than overwritten.
+    """
+
+    def __init__(self, filepath):
+        """Open the archive at ``filepath`` (a missing file is an empty archive).
+
+        Args:
+            filepath: Path to the archive file.
+
+        Raises:
+            ArchiveFormatError: If the file exists but is not a valid archive.
+        """
+        self.filepath = filepath
+        self._file_lock = FileLock(os.path.dirname(filepath))
+        self._file = None
+        self._mm = None
+        self._count = 0
+        self._identity = None  # (inode, mtime_ns, size) of the mapped file
+        self._positions = None  # task ID -> index, built on first lookup
+        self._open()
+
+    def __len__(self):
+        return self._count
+
+    # ------------------------------------------------------------------ #
+    #  Reading                                                            #
+    # ------------------------------------------------------------------ #
+
+    def task_id(self, index):
+        """Return the ID of the task at ``index``."""
+        return self._blob("ids", index, 1).decode("utf-8")
+
+    def ids(self):
+        """Return the IDs of all archived tasks, in archive order."""
+        if not self._count:
+            return []
+        start, end = self._blob_range("ids")
+        return self._mm[start : end - 1].decode("utf-8").split("\0")
+
+    def index_of(self, task_id):
+        """Return the index of the task with ``task_id``, or None.
+
+        The first call after the archive is (re)mapped decodes the ID
+        column into a dictionary, so later lookups take constant time.
+        """
+        if not isinstance(task_id, str):
+            return None
+        if self._positions is None:
+            ids = self.ids()
+            # Reversed, so the first of any duplicate IDs wins
+            self._positions = dict(zip(reversed(ids), range(len(ids) - 1, -1, -1)))
+        return self._positions.get(task_id)
+
+    def row(self, index):
+        """Return ``(task, category, deadline, priority)`` display values."""
+        extra = None
+        text = self._blob("text", index).decode("utf-8")
+        if not text:
+            extra = self._extra(index)
+            text = extra.get("task", "")
+
+        columns = []
+        for key, default in (("category", DEFAULT_CATEGORY), ("priority", DEFAULT_PRIORITY)):
+            value = self._string(key, index)
+            if value is None:
+                if extra is None:
+                    extra = self._extra(index)
+                value = extra.get(key, default)
+            columns.append(value)
+
+        ordinal = self._int("deadline", "<i", index)
+        if ordinal != NO_DEADLINE:
+            deadline = date.fromordinal(ordinal).strftime(DATE_FORMAT)
+        else:
+            if extra is None:
+                extra = self._extra(index)
+            deadline = extra.get("deadline", "")
+        return text, columns[0], deadline, columns[1]
+
+    def get(self, index):
+        """Return the full task dictionary at ``index``."""
+        task = {"id": self.task_id(index)}
+        text = self._blob("text", index).decode("utf-8")
+        if text:
+            task["task"] = text
+        ordinal = self._int("deadline", "<i", index)
+        if ordinal != NO_DEADLINE:
+            task["deadline"] = date.fromordinal(ordinal).strftime(DATE_FORMAT)
+        for key in ("priority", "category"):
+            value = self._string(key, index)
+            if value is not None:
+                task[key] = value
+        task["completed"] = True
+        task.update(self._extra(index))
+        return task
+
+    def search(self, query):
+        """Return the indexes of tasks matching ``query``.
+
+        Matching is the same as :class:`~todo_app.search_index.SearchIndex`:
+        every query word must start a word of the task's search text.
+
+        Args:
+            query: Search string; an empty query matches all tasks.
+        """
+        terms = query_terms(query)
+        if not terms:
+            return list(range(self._count))
+        if not self._count:
+            return []
+        # Find tasks containing the longest term, then check the words
+        needle = terms[0].encode("utf-8")
+        start, end = self._blob_range("search")
+        matches = []
+        pos = self._mm.find(needle, start, end)
+        while pos != -1:
+            index = self._entry_at("search", pos)
+            text = self._blob("search", index).decode("utf-8")
+            if matches_terms(tokenize(text), terms):
+                matches.append(index)
+            # Resume at the next task; one check per task is enough
+            pos = self._mm.find(needle, self._offset("search", index + 1), end)
+        return matches
+
+    def sort_key(self, column):
+        """Return a key function over indexes matching the app's column sort.
+
+        Args:
+            column: Treeview column name; like :meth:`TodoApp.sort_tasks`,
+                columns other than deadline, priority and completed sort by
+                the task description.
+        """
+        if column == "deadline":
+
+            def deadline_key(i):
+                ordinal = self._int("deadline", "<i", i)
+                return (ordinal == NO_DEADLINE, ordinal)  # invalid deadlines last
+
+            return deadline_key
+        if column == "priority":
+            return lambda i: PRIORITY_ORDER.get(self.row(i)[3], 2)
+        if column == "completed":
+            return lambda i: True
+        return lambda i: self.row(i)[0].lower()
+
+    # ------------------------------------------------------------------ #
+    #  Writing                                                            #
+    # ------------------------------------------------------------------ #
+
+    def update(self, added=(), removed=()):
+        """Add tasks and drop IDs, rewriting the archive file.
+
+        Added tasks replace archived ones with the same ID.
+
+        Args:
+            added: Completed task dictionaries (see :func:`is_archivable`).
+            removed: IDs of tasks to drop from the archive.
+
+        Raises:
+            ValueError: If an added task is not archivable.
+        """
+        added = list(added)
+        for task in added:
+            if not is_archivable(task):
+                raise ValueError(f"Task {task.get('id')!r} cannot be archived")
+        dropped = set(removed) | {task["id"] for task in added}
+        with self._file_lock:
+            self.refresh()
+            kept = [
+                self.get(i) for i in range(self._count) if self.task_id(i) not in dropped
+            ]
+            if not added and len(kept) == self._count:
+                return
+
+            data = dumps(kept + added)
+            self.close()
+            try:
+                atomic_write(self.filepath, data)
+            finally:
+                self._open()
+
+    def refresh(self):
+        """Remap the file if another program replaced it.
+
+        Returns:
+            bool: True if the archive was reopened.
+
+        Raises:
+            ArchiveFormatError: If the new file is not a valid archive.
+        """
+        try:
+            st = os.stat(self.filepath)
+            identity = (st.st_ino, st.st_mtime_ns, st.st_size)
+        except FileNotFoundError:
+            identity = None
+        if identity == self._identity:
+            return False
+        self.close()
+        self._open()
+        return True
+
+    def close(self):
+        """Unmap and close the archive file."""
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._count = 0
+        self._identity = None
+        self._positions = None
+
+    # ------------------------------------------------------------------ #
+    #  Internals                                                          #
+    # ------------------------------------------------------------------ #
+
+    def _open(self):
+        """Map the archive file and validate its header."""
+        try:
+            self._file = open(self.filepath, "rb")
+        except FileNotFoundError:
+            return
+        try:
+            st = os.fstat(self._file.fileno())
+            self._identity = (st.st_ino, st.st_mtime_ns, st.st_size)
+            size = st.st_size
+            if size < _HEADER.size:
+                raise ArchiveFormatError("Archive file is truncated")
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, count, *offsets = _HEADER.unpack_from(self._mm, 0)
+            if magic != MAGIC:
+                raise ArchiveFormatError("Not a task archive file")
+            if offsets != sorted(offsets) or offsets[-1] > size:
+                raise ArchiveFormatError("Corrupt archive header")
+            self._sections = dict(zip(_SECTIONS, offsets))
+            self._strings = json.loads(self._mm[self._sections["strings"] :])
+            self._count = count
+            # Check the end of each variable-length column lies in the file
+            for name in ("ids", "text", "search", "extra"):
+                if self._blob_range(name)[1] > size:
+                    raise ArchiveFormatError("Corrupt archive column")
+        except (ArchiveFormatError, ValueError, struct.error) as e:
+            self.close()
+            if isinstance(e, ArchiveFormatError):
+                raise
+            raise ArchiveFormatError(f"Corrupt archive file: {e}") from None
+        except BaseException:
+            self.close()
+            raise
+
+    def _offset(self, name, index):
+        """Return the absolute file position where entry ``index`` starts."""
+        section = self._sections[name]
+        (relative,) = _U32.unpack_from(self._mm, section + 4 * index)
+        return section + 4 * (self._count + 1) + relative
+
+    def _blob_range(self, name):
+        """Return the (start, end) file positions of a column's data."""
+        return self._offset(name, 0), self._offset(name, self._count)
+
+    def _entry_at(self, name, pos):
+        """Return the index of the entry containing file position ``pos``."""
+        # Bisect over the offsets table without materializing it
+        return bisect.bisect_right(_OffsetView(self, name), pos, 0, self._count) - 1
+
+    def _blob(self, name, index, terminator=0):
+        """Return the raw bytes of entry ``index`` (minus any terminator)."""
+        self._check(index)
+        return self._mm[self._offset(name, index) : self._offset(name, index + 1) - terminator]
+
+    def _int(self, name, fmt, index):
+        """Read a fixed-width integer column value."""
+        self._check(index)
+        size = struct.calcsize(fmt)
+        return struct.unpack_from(fmt, self._mm, self._sections[name] + size * index)[0]
+
+    def _string(self, name, index):
+        """Read a string-table column value, or None if absent."""
+        code = self._int(name, "<H", index)
+        return None if code == NO_STRING else self._strings[code]
+
+    def _extra(self, index):
+        """Decode the extra JSON object of entry ``index``."""
+        raw = self._blob("extra", index)
+        return json.loads(raw) if raw else {}
+
+    def _check(self, index):
+        if not 0 <= index < self._count:
+            raise IndexError("archive index out of range")
+
+
+class _OffsetView:
+    """Sequence view of a column's absolute entry offsets, for bisect."""
+
+    def __init__(self, archive, name):
+        self._archive = archive
+        self._name = name
+
+    def __len__(self):
+        return self._archive._count + 1
+
+    def __getitem__(self, index):
+        return self._archive._offset(self._name, index)
+
+
+def dumps(tasks):
+    """Encode completed tasks in the archive layout.
+
+    Args:
+        tasks: List of archivable task dictionaries.
+
+    Returns:
+        bytes: The encoded file contents.
+    """
+    strings = {}
+
+    def intern(value):
+        if not isinstance(value, str):
+            return NO_STRING
+        if value not in strings:
+            if len(strings) >= NO_STRING:
+                raise ValueError("Too many distinct priority/category values")
+            strings[value] = len(strings)
+        return strings[value]
+
+    ids, texts, searches, extras = [], [], [], []
+    deadlines = bytearray()
+    priorities = bytearray()
+    categories = bytearray()
+    for task in tasks:
+        extra = {key: value for key, value in task.items() if key not in _COLUMN_KEYS}
+        ids.append(task["id"].encode("utf-8") + b"\0")
+
+        text = task.get("task")
+        if isinstance(text, str) and text:
+            texts.append(text.encode("utf-8"))
+        else:
+            texts.append(b"")
+            if "task" in task:
+                extra["task"] = text
+
+        ordinal = canonical_deadline_ordinal(task.get("deadline"))
+        if ordinal is None:
+            ordinal = NO_DEADLINE
+            if "deadline" in task:
+                extra["deadline"] = task["deadline"]
+        deadlines += struct.pack("<i", ordinal)
+
+        for key, column in (("priority", priorities), ("category", categories)):
+            code = intern(task.get(key))
+            if code == NO_STRING and key in task:
+                extra[key] = task[key]
+            column += struct.pack("<H", code)
+
+        searches.append(searchable_text(task).encode("utf-8") + b"\0")
+        extras.append(json.dumps(extra).encode("utf-8") if extra else b"")
+
+    sections = {
+        "ids": _offsets_column(ids),
+        "text": _offsets_column(texts),
+        "search": _offsets_column(searches),
+        "deadline": bytes(deadlines),
+        "priority": bytes(priorities),
+        "category": bytes(categories),
+        "extra": _offsets_column(extras),
+        "strings": json.dumps(list(strings)).encode("utf-8"),
+    }
+    body = bytearray()
+    offsets = []
+    for name in _SECTIONS:
+        offsets.append(_HEADER.size + len(body))
+        body += sections[name]
+    return _HEADER.pack(MAGIC, len(tasks), *offsets) + bytes(body)
+
+
+def _offsets_column(entries):
+    """Encode byte strings as a u32 offsets table followed by their data."""
+    offsets = bytearray()
+    position = 0
+    for entry in entries:
+        offsets += _U32.pack(position)
+        position += len(entry)
+    offsets += _U32.pack(position)
+    return bytes(offsets) + b"".join(entries)
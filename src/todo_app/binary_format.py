@@ -0,0 +1,228 @@
+"""Compact binary encoding of task lists.
+
+Layout (all integers little-endian)::
+
+    magic       8 bytes   b"TODOBIN" + format version
+    count       u32       number of task records
+    strings     u16 n, then n x (u16 length + UTF-8 bytes)
+                          shared table for priority and category values
+    records     count x record
+
+    record:
+        flags       u8    which fields are packed (see _F_* below)
+        id          16 bytes if _F_UUID_ID, else u16 length + UTF-8
+        task        u32 length + UTF-8                  (if _F_TASK)
+        deadline    i32 date ordinal                    (if _F_DEADLINE)
+        priority    u16 string-table index              (if _F_PRIORITY)
+        category    u16 string-table index              (if _F_CATEGORY)
+        extra       u32 length + JSON object            (if _F_EXTRA)
+
+The completed flag is a bit in ``flags``. Any field whose value does not
+have the canonical type (or any unknown key) is kept in ``extra``, so every
+JSON task list round-trips exactly.
+"""
+
+import json
+import struct
+import uuid
+from datetime import date
+
+from .constants import DATE_FORMAT
+from .dates import canonical_deadline_ordinal
+
+FORMAT_VERSION = 1
+MAGIC = b"TODOBIN" + bytes([FORMAT_VERSION])
+
+_F_COMPLETED = 0x01
+_F_UUID_ID = 0x02
+_F_TASK = 0x04
+_F_DEADLINE = 0x08
+_F_PRIORITY = 0x10
+_F_CATEGORY = 0x20
+_F_EXTRA = 0x40
+_F_HAS_COMPLETED = 0x80
+
+_U16 = struct.Struct("<H")
+_U32 = struct.Struct("<I")
+_I32 = struct.Struct("<i")
+_PACKED_KEYS = ("id", "task", "deadline", "priority", "category", "completed")
+
+
+class BinaryFormatError(ValueError):
+    """Raised when data is not a valid binary task file."""
+
+
+def is_binary(data):
+    """Check whether ``data`` (the start of a file) carries the binary magic."""
+    return data[: len(MAGIC)] == MAGIC
+
+
+def dumps(tasks):
+    """Encode a list of task dictionaries.
+
+    Args:
+        tasks: List of task dictionaries; every task must have an ``id``.
+
+    Returns:
+        bytes: The encoded file contents.
+    """
+    strings = {}
+    body = bytearray()
+
+    def intern(value):
+        if value not in strings:
+            strings[value] = len(strings)
+        return strings[value]
+
+    for task in tasks:
+        flags = 0
+        extra = {key: value for key, value in task.items() if key not in _PACKED_KEYS}
+
+        task_id = task["id"]
+        id_bytes = None
+        if isinstance(task_id, str):
+            id_bytes = _uuid_bytes(task_id)
+            if id_bytes is not None:
+                flags |= _F_UUID_ID
+        else:
+            extra["id"] = task_id
+            task_id = ""
+
+        fields = bytearray()
+        text = task.get("task")
+        if isinstance(text, str):
+            flags |= _F_TASK
+            encoded = text.encode("utf-8")
+            fields += _U32.pack(len(encoded)) + encoded
+        elif "task" in task:
+            extra["task"] = text
+
+        deadline = task.get("deadline")
+        ordinal = canonical_deadline_ordinal(deadline)
+        if ordinal is not None:
+            flags |= _F_DEADLINE
+            fields += _I32.pack(ordinal)
+        elif "deadline" in task:
+            extra["deadline"] = deadline
+
+        for key, flag in (("priority", _F_PRIORITY), ("category", _F_CATEGORY)):
+            value = task.get(key)
+            if isinstance(value, str):
+                flags |= flag
+                fields += _U16.pack(intern(value))
+            elif key in task:
+                extra[key] = value
+
+        completed = task.get("completed")
+        if isinstance(completed, bool):
+            flags |= _F_HAS_COMPLETED
+            if completed:
+                flags |= _F_COMPLETED
+        elif "completed" in task:
+            extra["completed"] = completed
+
+        if extra:
+            flags |= _F_EXTRA
+            encoded = json.dumps(extra).encode("utf-8")
+            fields += _U32.pack(len(encoded)) + encoded
+
+        body.append(flags)
+        if id_bytes is not None:
+            body += id_bytes
+        else:
+            encoded = task_id.encode("utf-8")
+            body += _U16.pack(len(encoded)) + encoded
+        body += fields
+
+    if len(strings) > 0xFFFF:
+        raise ValueError("Too many distinct priority/category values")
+
+    header = bytearray(MAGIC)
+    header += _U32.pack(len(tasks))
+    header += _U16.pack(len(strings))
+    for value in strings:
+        encoded = value.encode("utf-8")
+        header += _U16.pack(len(encoded)) + encoded
+    return bytes(header + body)
+
+
+def loads(data):
+    """Decode bytes produced by :func:`dumps`.
+
+    Raises:
+        BinaryFormatError: If the data is truncated or has the wrong magic.
+    """
+    if not is_binary(data):
+        raise BinaryFormatError("Not a binary task file")
+
+    view = memoryview(data)
+    try:
+        pos = len(MAGIC)
+        (count,) = _U32.unpack_from(view, pos)
+        pos += 4
+        (n_strings,) = _U16.unpack_from(view, pos)
+        pos += 2
+        strings = []
+        for _ in range(n_strings):
+            value, pos = _read_str(view, pos, _U16)
+            strings.append(value)
+
+        tasks = []
+        for _ in range(count):
+            flags = view[pos]
+            pos += 1
+            task = {}
+            if flags & _F_UUID_ID:
+                if pos + 16 > len(view):
+                    raise BinaryFormatError("Truncated task ID")
+                task["id"] = str(uuid.UUID(bytes=bytes(view[pos : pos + 16])))
+                pos += 16
+            else:
+                task["id"], pos = _read_str(view, pos, _U16)
+            if flags & _F_TASK:
+                task["task"], pos = _read_str(view, pos, _U32)
+            if flags & _F_DEADLINE:
+                (ordinal,) = _I32.unpack_from(view, pos)
+                pos += 4
+                task["deadline"] = date.fromordinal(ordinal).strftime(DATE_FORMAT)
+            if flags & _F_PRIORITY:
+                (index,) = _U16.unpack_from(view, pos)
+                pos += 2
+                task["priority"] = strings[index]
+            if flags & _F_CATEGORY:
+                (index,) = _U16.unpack_from(view, pos)
+                pos += 2
+                task["category"] = strings[index]
+            if flags & _F_HAS_COMPLETED:
+                task["completed"] = bool(flags & _F_COMPLETED)
+            if flags & _F_EXTRA:
+                extra, pos = _read_str(view, pos, _U32)
+                task.update(json.loads(extra))
+            tasks.append(task)
+    except (struct.error, IndexError, ValueError) as e:
+        if isinstance(e, BinaryFormatError):
+            raise
+        raise BinaryFormatError(f"Corrupt binary task file: {e}") from None
+
+    return tasks
+
+
+def _read_str(view, pos, length_struct):
+    """Read a length-prefixed UTF-8 string at ``pos``; return (value, new_pos)."""
+    (length,) = length_struct.unpack_from(view, pos)
+    pos += length_struct.size
+    end = pos + length
+    if end > len(view):
+        raise BinaryFormatError("Truncated string")
+    return str(view[pos:end], "utf-8"), end
+
+
+def _uuid_bytes(value):
+    """Return the 16 raw bytes of a canonical UUID string, else None."""
+    if len(value) != 36:
+        return None
+    try:
+        parsed = uuid.UUID(value)
+    except ValueError:
+        return None
+    return parsed.bytes if str(parsed) == value else None
@@ -0,0 +1,116 @@
+"""Binary startup cache of parsed tasks, validated against the source file."""
+
+import hashlib
+import marshal
+import os
+
+from .constants import CACHE_FILENAME
+from .dates import deadline_ordinal
+from .storage import atomic_write
+
+CACHE_VERSION = 1
+_HASH_BLOCK_SIZE = 1024 * 1024
+
+
+class CachedTasks:
+    """Tasks restored from the cache together with their derived fields."""
+
+    def __init__(self, tasks, deadline_ordinals, trigrams=None):
+        self.tasks = tasks
+        self.deadline_ordinals = deadline_ordinals  # deadline string -> ordinal
+        self.trigrams = trigrams  # TrigramIndex.dump() data, if it was built
+
+
+class StartupCache:
+    """Stores parsed tasks in a marshal file so startup can skip parsing.
+
+    The cache records the modification time, size, and BLAKE2 hash of every
+    source file it was built from and is only used while all three still
+    match, so external edits to the task file are never masked.
+    """
+
+    def __init__(self, data_dir):
+        """Initialize the cache for the given data directory.
+
+        Args:
+            data_dir: Directory holding the task data files.
+        """
+        self.filepath = os.path.join(data_dir, CACHE_FILENAME)
+
+    def load(self, source_paths):
+        """Return the cached tasks if they match ``source_paths``, else None.
+
+        Args:
+            source_paths: Paths of the files the tasks were loaded from.
+        """
+        try:
+            with open(self.filepath, "rb") as f:
+                # marshal.load() reads a file object in many small reads;
+                # decoding the whole file at once is several times faster
+                payload = marshal.loads(f.read())
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+
+        if not isinstance(payload, dict) or payload.get("version") != CACHE_VERSION:
+            return None
+        if payload.get("sources") != _fingerprint(source_paths, payload.get("sources")):
+            return None
+
+        return CachedTasks(
+            payload["tasks"],
+            payload["deadline_ordinals"],
+            payload.get("trigrams"),
+        )
+
+    def store(self, source_paths, tasks, trigrams=None):
+        """Write ``tasks`` to the cache, keyed to the current source files.
+
+        Args:
+            source_paths: Paths of the files holding exactly ``tasks``.
+            tasks: List of task dictionaries.
+            trigrams: Optional fuzzy search postings for ``tasks``, as
+                returned by ``TrigramIndex.dump``.
+        """
+        payload = {
+            "version": CACHE_VERSION,
+            "sources": _fingerprint(source_paths),
+            "tasks": tasks,
+            "deadline_ordinals": {
+                deadline: deadline_ordinal(deadline)
+                for deadline in {t.get("deadline", "") for t in tasks}
+                if isinstance(deadline, str)
+            },
+            "trigrams": trigrams,
+        }
+        atomic_write(self.filepath, marshal.dumps(payload))
+
+
+def _fingerprint(paths, expected=None):
+    """Describe each existing file in ``paths`` as (path, mtime_ns, size, hash).
+
+    When ``expected`` is given, hashing is skipped (returning None) as soon
+    as a cheap stat comparison already shows a mismatch.
+    """
+    entries = []
+    for path in paths:
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            continue
+        entry = [path, st.st_mtime_ns, st.st_size]
+        if expected is not None:
+            index = len(entries)
+            if index >= len(expected) or expected[index][:3] != entry:
+                return None
+        entry.append(_file_hash(path))
+        entries.append(entry)
+    return entries
+
+
+def _file_hash(path):
+    """Return the hex BLAKE2b digest of a file's contents."""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(_HASH_BLOCK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
@@ -6,12 +6,38 @@ DEFAULT_WINDOW_SIZE = "800x600"
 MIN_WINDOW_WIDTH = 600
 MIN_WINDOW_HEIGHT = 400
 
+# Storage settings
+TASKS_FILENAME = "tasks.json"
+SQLITE_FILENAME = "tasks.db"
+CACHE_FILENAME = "tasks.cache"
+ARCHIVE_FILENAME = "tasks.archive"  # memory-mapped store of completed tasks
+FILE_FORMATS = ("json", "binary")  # on-disk encodings of the task file
+DEFAULT_STORAGE_BACKEND = "json"
+JOURNAL_COMPACT_THRESHOLD = 1000  # journal entries before a snapshot rewrite
+SAVE_COALESCE_WINDOW = 0.3  # seconds; bursts of saves within it share one write
+WRITE_QUEUE_SIZE = 8  # pending snapshots held by the write-behind worker
+WRITER_POLL_INTERVAL_MS = 250  # how often the UI checks for failed writes
+STREAM_CHUNK_SIZE = 64 * 1024  # bytes read per step by the streaming loader
+LOAD_BATCH_SIZE = 100  # tasks added between checks of the load time budget
+LOAD_SLICE_MS = 8  # time spent adding loaded tasks per event-loop turn
+WATCH_POLL_INTERVAL_MS = 1000  # stat polling period where inotify is unavailable
+WATCH_DEBOUNCE_MS = 100  # quiet time before reacting to a burst of file events
+WATCH_RESULT_POLL_MS = 20  # how often the UI checks for external changes read
+SEARCH_DEBOUNCE_MS = 150  # typing pause before the task list is re-filtered
+VIEW_POLL_INTERVAL_MS = 10  # how often the UI checks for a filtered/sorted list
+VIEW_BUSY_DELAY_MS = 100  # wait before the status bar says the list is updating
+FUZZY_MIN_SIMILARITY = 0.3  # share of query trigrams a fuzzy match must contain
+FUZZY_RESULT_LIMIT = 100  # best-ranked tasks shown in fuzzy search mode
+
 # Date format used throughout the application
 DATE_FORMAT = "%d-%m-%Y"
 
 # Default task categories
 CATEGORIES = ["Work", "Personal", "Health", "Finance", "Other"]
 
+# Search modes: "Exact" filters by word prefix, "Fuzzy" ranks by similarity
+SEARCH_MODES = ["Exact", "Fuzzy"]
+
 # Priority levels and sort order
 PRIORITY_LEVELS = ["Low", "Medium", "High"]
 PRIORITY_ORDER = {"Low": 1, "Medium": 2, "High": 3}
@@ -29,6 +55,7 @@ DEFAULT_PRIORITY = "Medium"
 DEFAULT_CATEGORY = "General"
 DEFAULT_SORT_COLUMN = "deadline"
 DEFAULT_FILTER = "All"
+DEFAULT_SEARCH_MODE = "Exact"
 
 # Font definitions
 FONT_FAMILY = "Segoe UI"
@@ -47,6 +74,8 @@ WELCOME_FONT = (FONT_FAMILY, 10)
 TREEVIEW_COLUMNS = ("task", "category", "deadline", "priority", "completed")
 COLUMN_WIDTHS = {"task": 300, "category": 100, "deadline": 100, "priority": 80, "completed": 80}
 COLUMN_ANCHORS = {"task": "w", "category": "center", "deadline": "center", "priority": "center", "completed": "center"}
+TREEVIEW_ROW_HEIGHT = 45  # pixels per task row
+VIRTUAL_LIST_OVERSCAN = 50  # rows kept in the Treeview above and below the visible ones
 
 # Dashboard colors
 STAT_TOTAL_COLOR = "#3B82F6"
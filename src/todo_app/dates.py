@@ -0,0 +1,67 @@
+"""Fast parsing of ``DD-MM-YYYY`` deadline strings."""
+
+from datetime import date
+
+_ordinals = {}  # deadline string -> date ordinal (None if not a valid date)
+_years = {}  # "YYYY" -> int (None if not four ASCII digits)
+# "1".."9" and "00".."99" -> int; avoids int() on every day and month
+_DAY_MONTH = {str(n): n for n in range(1, 10)}
+_DAY_MONTH.update((f"{n:02d}", n) for n in range(100))
+
+
+def deadline_ordinal(deadline):
+    """Return the proleptic ordinal of a ``DD-MM-YYYY`` deadline, or None.
+
+    Accepts what ``datetime.strptime(deadline, DATE_FORMAT)`` accepts for
+    ASCII input (day and month may drop their leading zero) without its
+    regular-expression and locale overhead. Results are memoized, since
+    many tasks share a deadline.
+    """
+    try:
+        return _ordinals[deadline]
+    except KeyError:
+        pass
+    except TypeError:  # unhashable value
+        return None
+
+    ordinal = None
+    parts = deadline.split("-") if type(deadline) is str else ()
+    if len(parts) == 3:
+        day = _DAY_MONTH.get(parts[0])
+        month = _DAY_MONTH.get(parts[1])
+        year = _year(parts[2])
+        if day and month and year:
+            try:
+                ordinal = date(year, month, day).toordinal()
+            except ValueError:
+                pass
+    _ordinals[deadline] = ordinal
+    return ordinal
+
+
+def _year(text):
+    try:
+        return _years[text]
+    except KeyError:
+        year = None
+        if len(text) == 4 and text.isascii() and text.isdigit():
+            year = int(text)
+        _years[text] = year
+        return year
+
+
+def remember_deadline_ordinals(ordinals):
+    """Seed the :func:`deadline_ordinal` memo from deadline -> ordinal pairs."""
+    _ordinals.update(ordinals)
+
+
+def canonical_deadline_ordinal(deadline):
+    """Return the ordinal of a zero-padded ``DD-MM-YYYY`` string, else None.
+
+    Only canonical strings qualify: formatting the ordinal back with
+    ``DATE_FORMAT`` gives exactly ``deadline`` (e.g. not "1-3-2026").
+    """
+    ordinal = deadline_ordinal(deadline)
+    if ordinal is None or len(deadline) != 10 or deadline[6] == "0":
+        return None
+    return ordinal
@@ -0,0 +1,226 @@
+"""Trigram index for typo-tolerant, ranked task search."""
+
+import heapq
+import math
+import re
+from collections import Counter
+
+from .constants import FUZZY_MIN_SIMILARITY, FUZZY_RESULT_LIMIT
+
+_WORD = re.compile(r"\w+")
+_NO_TASKS = frozenset()
+
+
+def trigrams(text):
+    """Return the set of trigrams of the words in ``text``.
+
+    Words are lowercased and padded with two spaces in front and one
+    behind, so "milk" gives "  m", " mi", "mil", "ilk" and "lk ": word
+    starts weigh more than word ends, and one-letter words still count.
+    """
+    grams = set()
+    for word in _WORD.findall(text.lower()):
+        padded = f"  {word} "
+        grams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+class TrigramIndex:
+    """Inverted index from trigrams to tasks for fuzzy search.
+
+    A task matches a query when its description shares at least
+    ``min_similarity`` of the query's trigrams, which tolerates typos,
+    missing letters and swapped words. Matches are ranked by how many
+    query trigrams they share, then by trigram (Jaccard) similarity.
+
+    The postings are only built on the first search, or adopted from the
+    startup cache (see :meth:`dump` and :meth:`restore`); until then adds
+    and edits just record the task text. A search only takes candidates
+    from the rarest query trigrams, as many as a match cannot miss all of,
+    and counts shared trigrams for those candidates alone. Tasks are
+    tracked by identity; call :meth:`update` after changing one.
+    """
+
+    def __init__(self, tasks=(), min_similarity=FUZZY_MIN_SIMILARITY):
+        """Create an index over ``tasks``.
+
+        Args:
+            tasks: Tasks to index.
+            min_similarity: Share (0-1] of the query trigrams a task must
+                contain to match.
+        """
+        self.min_similarity = min_similarity
+        self.reset(tasks)
+
+    def __len__(self):
+        return len(self._texts)
+
+    def reset(self, tasks=()):
+        """Replace the indexed tasks with ``tasks``."""
+        self._texts = {}  # task -> the text it is indexed under
+        self._sizes = {}  # task -> number of its trigrams, once in the postings
+        self._postings = None  # trigram -> set of tasks; None until built
+        self._restored = None  # (tasks, texts, data) handed to restore()
+        self.extend(tasks)
+
+    def add(self, task):
+        """Index a new task."""
+        if task in self._texts:
+            self.update(task)
+            return
+        self._texts[task] = task.text
+        if self._postings is not None:
+            self._index(task)
+
+    def extend(self, tasks):
+        """Index several new tasks."""
+        for task in tasks:
+            self.add(task)
+
+    def update(self, task):
+        """Re-index ``task`` after its fields changed."""
+        if task in self._texts and self._texts[task] == task.text:
+            return  # only the text is indexed
+        self.remove(task)
+        self.add(task)
+
+    def replace(self, old, new):
+        """Index ``new`` in place of ``old``."""
+        self.remove(old)
+        self.add(new)
+
+    def remove(self, task):
+        """Stop indexing ``task``, if it is indexed."""
+        text = self._texts.pop(task, None)
+        if self._sizes.pop(task, None) is None:
+            return
+        for gram in trigrams(text):
+            posting = self._postings[gram]
+            posting.discard(task)
+            if not posting:
+                del self._postings[gram]
+
+    def search(self, query, limit=FUZZY_RESULT_LIMIT, where=None):
+        """Return the tasks most similar to ``query``, best match first.
+
+        Args:
+            query: Search text; an empty query matches nothing.
+            limit: Maximum number of tasks returned.
+            where: Optional predicate a task must also satisfy.
+
+        Returns:
+            list: Up to ``limit`` matching tasks in ranked order.
+        """
+        grams = trigrams(query)
+        if not grams:
+            return []
+        if self._postings is None:
+            self._build()
+
+        need = max(1, math.ceil(self.min_similarity * len(grams)))
+        postings = sorted(
+            (self._postings.get(gram, _NO_TASKS) for gram in grams), key=len
+        )
+        # A task sharing `need` of the query trigrams shares at least one
+        # of any len(grams) - need + 1 of them: take the rarest ones.
+        candidates = set().union(*postings[: len(grams) - need + 1])
+        if where is not None:
+            candidates = set(filter(where, candidates))
+        if not candidates:
+            return []
+
+        shared = Counter()
+        for posting in postings:
+            shared.update(candidates & posting)
+        sizes = self._sizes
+        total = len(grams)
+        return heapq.nsmallest(
+            limit,
+            (task for task, n in shared.items() if n >= need),
+            key=lambda task: (
+                -shared[task],
+                -shared[task] / (total + sizes[task] - shared[task]),
+                task.text.lower(),
+                str(task.id),
+            ),
+        )
+
+    def dump(self, tasks):
+        """Return the postings as plain data for the startup cache.
+
+        Args:
+            tasks: The task list stored alongside; postings refer to tasks
+                by their position in it.
+
+        Returns:
+            dict or None: None when the index was never needed, so there
+            is nothing worth caching.
+        """
+        if self._postings is None:
+            if self._restored is None:
+                return None
+            self._build()
+        positions = {task: i for i, task in enumerate(tasks)}
+        postings = {}
+        for gram, posting in self._postings.items():
+            indexes = [positions[task] for task in posting if task in positions]
+            if indexes:
+                postings[gram] = indexes
+        return {
+            "postings": postings,
+            "sizes": [self._sizes.get(task) for task in tasks],
+        }
+
+    def restore(self, tasks, data):
+        """Adopt postings saved by :meth:`dump` for the indexed ``tasks``.
+
+        The data is only read on the first search. Tasks edited or removed
+        in the meantime are left out of it and indexed afresh, and data
+        that does not fit ``tasks`` is ignored.
+        """
+        tasks = list(tasks)
+        self._restored = (tasks, [task.text for task in tasks], data)
+
+    def _build(self):
+        self._postings = {}
+        self._sizes = {}
+        if self._restored is not None:
+            self._adopt(*self._restored)
+            self._restored = None
+        for task in self._texts:
+            if task not in self._sizes:
+                self._index(task)
+
+    def _adopt(self, tasks, texts, data):
+        """Fill the empty postings from restored data, if it is usable."""
+        try:
+            sizes = data["sizes"]
+            if len(sizes) != len(tasks):
+                return
+            current = [
+                task
+                if type(size) is int and self._texts.get(task) == text
+                else None
+                for task, text, size in zip(tasks, texts, sizes)
+            ]
+            postings = {}
+            for gram, indexes in data["postings"].items():
+                posting = set(map(current.__getitem__, indexes))
+                posting.discard(None)
+                if posting:
+                    postings[gram] = posting
+        except (KeyError, IndexError, TypeError, AttributeError):
+            return
+        self._postings = postings
+        self._sizes = {
+            task: size for task, size in zip(current, sizes) if task is not None
+        }
+
+    def _index(self, task):
+        grams = trigrams(self._texts[task])
+        self._sizes[task] = len(grams)
+        for gram in grams:
+            posting = self._postings.get(gram)
+            if posting is None:
+                posting = self._postings[gram] = set()
+            posting.add(task)
@@ -0,0 +1,139 @@
+"""In-memory task record type."""
+
+from .constants import DEFAULT_CATEGORY, DEFAULT_PRIORITY
+from .dates import deadline_ordinal
+
+_ABSENT = object()  # marks a key missing from the source dictionary
+_TEXT_FIELDS = (
+    ("task", "text", ""),
+    ("deadline", "deadline", ""),
+    ("priority", "priority", DEFAULT_PRIORITY),
+    ("category", "category", DEFAULT_CATEGORY),
+)
+_KNOWN_KEYS = frozenset(("id", "task", "deadline", "priority", "category", "completed"))
+
+
+class Task:
+    """A single task, stored in slots with typed fields.
+
+    Fields hold display-ready values: a field missing from the source
+    dictionary, or holding a value of the wrong type, gets the default the
+    UI shows for it. :meth:`from_dict` remembers such originals and
+    :meth:`to_dict` restores them as long as the field still holds that
+    default, so dictionaries from storage round-trip exactly. Unknown keys
+    are kept in :attr:`extra`.
+
+    ``due_ordinal`` is the ``deadline`` as a date ordinal (None if it is
+    not a valid date), so deadlines compare as integers; change the
+    deadline with :meth:`set_deadline` so both stay in step.
+    """
+
+    __slots__ = (
+        "id",
+        "text",
+        "deadline",
+        "due_ordinal",
+        "priority",
+        "category",
+        "completed",
+        "extra",
+        "_originals",
+    )
+
+    def __init__(
+        self,
+        id,
+        text="",
+        deadline="",
+        priority=DEFAULT_PRIORITY,
+        category=DEFAULT_CATEGORY,
+        completed=False,
+        extra=None,
+    ):
+        self.id = id
+        self.text = text
+        self.deadline = deadline
+        self.due_ordinal = deadline_ordinal(deadline)
+        self.priority = priority
+        self.category = category
+        self.completed = completed
+        self.extra = extra  # dict of unknown keys, or None
+        self._originals = None  # key -> (source value, field value it became)
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build a task from its dictionary form (as stored on disk)."""
+        task = cls.__new__(cls)
+        originals = None
+
+        task.id = data.get("id")
+        if "id" not in data:
+            originals = {"id": (_ABSENT, None)}
+
+        for key, attr, default in _TEXT_FIELDS:
+            value = data.get(key, _ABSENT)
+            if type(value) is str:
+                setattr(task, attr, value)
+            else:
+                setattr(task, attr, default)
+                if originals is None:
+                    originals = {}
+                originals[key] = (value, default)
+
+        completed = data.get("completed", _ABSENT)
+        if completed is True or completed is False:
+            task.completed = completed
+        else:
+            task.completed = completed is not _ABSENT and bool(completed)
+            if originals is None:
+                originals = {}
+            originals["completed"] = (completed, task.completed)
+
+        task.due_ordinal = deadline_ordinal(task.deadline)
+        task._originals = originals
+        if _KNOWN_KEYS.issuperset(data):
+            task.extra = None
+        else:
+            task.extra = {k: v for k, v in data.items() if k not in _KNOWN_KEYS}
+        return task
+
+    def to_dict(self):
+        """Return the dictionary form, restoring any original raw values."""
+        data = {
+            "id": self.id,
+            "task": self.text,
+            "deadline": self.deadline,
+            "priority": self.priority,
+            "category": self.category,
+            "completed": self.completed,
+        }
+        if self._originals is not None:
+            for key, (original, converted) in self._originals.items():
+                current = data[key]
+                if type(current) is type(converted) and current == converted:
+                    if original is _ABSENT:
+                        del data[key]
+                    else:
+                        data[key] = original
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+    def copy(self):
+        """Return a shallow copy of the task."""
+        task = Task.__new__(Task)
+        for name in self.__slots__:
+            setattr(task, name, getattr(self, name))
+        return task
+
+    def set_deadline(self, deadline):
+        """Change the deadline string and its ``due_ordinal``."""
+        self.deadline = deadline
+        self.due_ordinal = deadline_ordinal(deadline)
+
+    def search_text(self):
+        """Return the lowercase text that the search box is matched against."""
+        return " ".join((self.text, self.deadline, self.priority, self.category)).lower()
+
+    def __repr__(self):
+        return f"Task({self.id!r}, {self.text!r}, completed={self.completed!r})"
@@ -0,0 +1,353 @@
+"""Search box query language, compiled to index lookups.
+
+A query is a list of whitespace-separated terms, all of which a task must
+satisfy::
+
+    milk "bob about"        words starting words of the task's search text
+    priority:high  p:low,medium
+    category:work  cat:"home office"
+    due:today  due:<=today  due:>15-06-2026  due:none
+    id:<task id>
+    done  pending           (also is:done, is:pending)
+    -<term>                 negates any term, e.g. -done or -cat:work
+
+Field names and values are case-insensitive; quote a word such as "done"
+to search for it as text. Terms with an unknown field name are searched
+as text, and a field with no value yet (``due:``) is ignored, so queries
+can be typed a character at a time.
+"""
+
+import re
+from datetime import date
+
+from .dates import deadline_ordinal
+from .search_index import matches_terms, query_terms, tokenize
+from .table import NO_DUE
+
+# field name (and aliases) -> clause field
+_FIELDS = {
+    "priority": "priority",
+    "p": "priority",
+    "category": "category",
+    "cat": "category",
+    "due": "due",
+    "deadline": "due",
+    "id": "id",
+    "is": "completed",
+    "status": "completed",
+}
+_STATUS = {
+    "done": True,
+    "completed": True,
+    "complete": True,
+    "pending": False,
+    "open": False,
+}
+_RELATIVE_DAYS = {"yesterday": -1, "today": 0, "tomorrow": 1}
+_TERM = re.compile(r'(-?)(?:([A-Za-z]+):)?("[^"]*"?|\S*)')
+_DUE = re.compile(r"(<=|>=|<|>|=)?(.*)")
+# Below this share of the table, candidates are tested one by one rather
+# than through a whole-column mask or another index lookup
+_SCAN_FRACTION = 8
+
+
+class QueryError(ValueError):
+    """Raised when a search query cannot be parsed."""
+
+
+class Clause:
+    """One condition of a :class:`Query`.
+
+    Attributes:
+        field: "text", "id", "completed", "priority", "category" or "due".
+        value: Tuple of terms for "text", a bool for "completed", a
+            frozenset of lowercase names for "priority" and "category", a
+            ``(first, last)`` pair of date ordinals (either may be None)
+            for "due", and the task ID for "id".
+        negated: The clause matches the tasks the condition rejects.
+    """
+
+    __slots__ = ("field", "value", "negated")
+
+    def __init__(self, field, value, negated=False):
+        self.field = field
+        self.value = value
+        self.negated = negated
+
+    def __repr__(self):
+        return f"Clause({self.field!r}, {self.value!r}, negated={self.negated})"
+
+    def __eq__(self, other):
+        if not isinstance(other, Clause):
+            return NotImplemented
+        return (self.field, self.value, self.negated) == (
+            other.field,
+            other.value,
+            other.negated,
+        )
+
+    def test(self, task, search_index=None):
+        """Check whether ``task`` satisfies the clause.
+
+        Args:
+            task: The task to test.
+            search_index: Optional :class:`SearchIndex` holding ``task``,
+                whose stored tokens spare re-tokenizing its text.
+        """
+        field, value = self.field, self.value
+        if field == "text":
+            if search_index is not None:
+                result = search_index.matches(task, " ".join(value))
+            else:
+                result = matches_terms(tokenize(task.search_text()), value)
+        elif field == "id":
+            result = task.id == value
+        elif field == "completed":
+            result = bool(task.completed) == value
+        elif field == "priority":
+            result = str(task.priority).lower() in value
+        elif field == "category":
+            result = str(task.category).lower() in value
+        else:
+            first, last = value
+            due = task.due_ordinal
+            result = (
+                due is not None
+                and (first is None or due >= first)
+                and (last is None or due <= last)
+            )
+        return result != self.negated
+
+    def table_filters(self, table):
+        """Return the :meth:`TaskTable.mask` filters of a column clause."""
+        if self.field == "completed":
+            return {"completed": self.value}
+        if self.field == "due":
+            first, last = self.value
+            return {
+                "due_on_or_after": first,
+                "due_on_or_before": NO_DUE - 1 if last is None else last,
+            }
+        names = {name for name in table.values() if name.lower() in self.value}
+        return {self.field: names}
+
+
+class Query:
+    """A parsed search query (see the module docstring for the syntax).
+
+    :meth:`select` answers the query from the app's indexes: an ``id:``
+    term is a direct lookup, text words go through the search index's
+    postings and the field terms through :class:`TaskTable` column masks,
+    and each step only tests the remaining tasks one by one once they are
+    few. :meth:`matches` and :meth:`filter` test tasks without indexes.
+    """
+
+    def __init__(self, clauses=()):
+        """Create a query requiring every one of ``clauses``."""
+        self.clauses = list(clauses)
+
+    def __repr__(self):
+        return f"Query({self.clauses!r})"
+
+    def __bool__(self):
+        return bool(self.clauses)
+
+    def __and__(self, other):
+        return Query(self.clauses + other.clauses)
+
+    def text_terms(self):
+        """Return the words of the non-negated text terms."""
+        terms = []
+        for clause in self.clauses:
+            if clause.field == "text" and not clause.negated:
+                terms.extend(t for t in clause.value if t not in terms)
+        return terms
+
+    def without_text(self):
+        """Return the query minus its non-negated text terms."""
+        return Query(
+            c for c in self.clauses if c.field != "text" or c.negated
+        )
+
+    def completed(self):
+        """Return True/False if the query requires that completed flag, else None."""
+        for clause in self.clauses:
+            if clause.field == "completed":
+                return clause.value != clause.negated
+        return None
+
+    def matches(self, task, search_index=None):
+        """Check whether ``task`` satisfies every clause (see :meth:`Clause.test`)."""
+        return all(clause.test(task, search_index) for clause in self.clauses)
+
+    def filter(self, tasks):
+        """Return the tasks of ``tasks`` that match, scanning them in order."""
+        return [task for task in tasks if self.matches(task)]
+
+    def select(self, table, search_index=None, find=None):
+        """Return the set of tasks in ``table`` that match the query.
+
+        Args:
+            table: :class:`TaskTable` holding the tasks to search.
+            search_index: Optional :class:`SearchIndex` (or anything with
+                its ``search`` method) over the same tasks.
+            find: Optional function returning the task with a given ID,
+                or None.
+
+        Returns:
+            set: The matching tasks.
+        """
+        positive = [c for c in self.clauses if not c.negated]
+        rest = []  # clauses left to test task by task
+        tasks = None  # None stands for every task in the table
+
+        for clause in positive:
+            if clause.field == "id" and find is not None:
+                task = find(clause.value)
+                found = set() if task is None else {task}
+                tasks = found if tasks is None else tasks & found
+
+        terms = self.text_terms()
+        if terms and search_index is not None:
+            found = search_index.search(" ".join(terms))
+            tasks = found if tasks is None else tasks & found
+
+        columns = [c for c in positive if c.field in _COLUMN_FIELDS]
+        if columns and self._few(tasks, table):
+            rest.extend(columns)
+        elif columns:
+            filters = _merge_filters(c.table_filters(table) for c in columns)
+            found = set() if filters is None else set(table.select(**filters))
+            tasks = found if tasks is None else tasks & found
+
+        for clause in positive:
+            if clause.field == "id" and find is None:
+                rest.append(clause)
+            elif clause.field == "text" and search_index is None:
+                rest.append(clause)
+
+        for clause in self.clauses:
+            if not clause.negated:
+                continue
+            if self._few(tasks, table) or clause.field == "text" and search_index is None:
+                rest.append(clause)
+                continue
+            if tasks is None:
+                tasks = set(table.tasks())
+            if clause.field == "text":
+                tasks -= search_index.search(" ".join(clause.value))
+            elif clause.field == "id":
+                tasks = {task for task in tasks if task.id != clause.value}
+            else:
+                tasks.difference_update(table.select(**clause.table_filters(table)))
+
+        if tasks is None:
+            tasks = set(table.tasks())
+        if rest:
+            tasks = {
+                task
+                for task in tasks
+                if all(clause.test(task) for clause in rest)
+            }
+        return tasks
+
+    @staticmethod
+    def _few(tasks, table):
+        return tasks is not None and len(tasks) * _SCAN_FRACTION <= len(table)
+
+
+_COLUMN_FIELDS = ("completed", "priority", "category", "due")
+
+
+def _merge_filters(filters):
+    """AND together several mask filter dicts, or return None if they conflict."""
+    merged = {}
+    for clause_filters in filters:
+        for key, value in clause_filters.items():
+            if value is None:
+                continue
+            if key not in merged:
+                merged[key] = value
+            elif key == "completed":
+                if merged[key] != value:
+                    return None
+            elif key == "due_on_or_after":
+                merged[key] = max(merged[key], value)
+            elif key == "due_on_or_before":
+                merged[key] = min(merged[key], value)
+            else:
+                merged[key] = merged[key] & value
+    return merged
+
+
+def parse_query(text, today=None):
+    """Parse a search box query into a :class:`Query`.
+
+    Args:
+        text: The query text.
+        today: Date that "today", "tomorrow" and "yesterday" refer to;
+            defaults to the current date.
+
+    Raises:
+        QueryError: If a field value is invalid, e.g. an unknown status
+            or a malformed deadline.
+    """
+    clauses = []
+    for match in _TERM.finditer(text):
+        negated, name, value = match.groups()
+        negated = bool(negated)
+        quoted = value.startswith('"')
+        if quoted:
+            value = value[1:].rstrip('"')
+        field = _FIELDS.get(name.lower()) if name else None
+        if name and field is None:  # not a field name: search for it
+            value = f"{name}:{value}"
+
+        if field is not None:
+            if value:
+                clauses.append(_field_clause(field, value, negated, today))
+        elif not quoted and value.lower() in _STATUS:
+            clauses.append(Clause("completed", _STATUS[value.lower()], negated))
+        else:
+            terms = tuple(query_terms(value))
+            if terms:
+                clauses.append(Clause("text", terms, negated))
+    return Query(clauses)
+
+
+def _field_clause(field, value, negated, today):
+    if field == "id":
+        return Clause("id", value, negated)
+    if field == "completed":
+        status = _STATUS.get(value.lower())
+        if status is None:
+            raise QueryError(f"Unknown status in query: {value!r}")
+        return Clause("completed", status, negated)
+    if field in ("priority", "category"):
+        names = frozenset(v.strip().lower() for v in value.split(",") if v.strip())
+        return Clause(field, names, negated)
+    operator, when = _DUE.fullmatch(value.lower()).groups()
+    if when == "none" and not operator:
+        # "no deadline" is the negation of "has a deadline"
+        return Clause("due", (None, None), not negated)
+    ordinal = _day_ordinal(when, today)
+    if ordinal is None:
+        raise QueryError(f"Invalid deadline in query: {value!r}")
+    if operator == "<":
+        span = (None, ordinal - 1)
+    elif operator == "<=":
+        span = (None, ordinal)
+    elif operator == ">":
+        span = (ordinal + 1, None)
+    elif operator == ">=":
+        span = (ordinal, None)
+    else:
+        span = (ordinal, ordinal)
+    return Clause("due", span, negated)
+
+
+def _day_ordinal(text, today):
+    days = _RELATIVE_DAYS.get(text)
+    if days is not None:
+        return (today or date.today()).toordinal() + days
+    return deadline_ordinal(text)
@@ -0,0 +1,80 @@
+"""Coalesces view refreshes into one pass per event-loop turn."""
+
+
+class RefreshScheduler:
+    """Repaints each dirty view at most once per idle pass.
+
+    Code that changes the tasks marks the views it affects with
+    :meth:`mark` instead of repainting them. The first mark schedules one
+    ``after_idle`` callback, which calls the repaint function of each
+    dirty view once, in the order the views were registered. Marking a
+    view that is already dirty only counts as a suppressed refresh, so an
+    action that touches the list, status bar and dashboard several times
+    over repaints each of them once, just before Tk redraws the window.
+
+    The ``requested``, ``repainted`` and ``suppressed`` dicts count, per
+    view, the refreshes asked for, the ones actually run and the
+    redundant ones dropped.
+    """
+
+    def __init__(self, root, views):
+        """Create a scheduler with nothing dirty.
+
+        Args:
+            root: The Tkinter root window used for scheduling.
+            views: Mapping of view name to the function repainting it, in
+                the order the views are repainted.
+        """
+        self.root = root
+        self.views = dict(views)
+        self.requested = dict.fromkeys(self.views, 0)
+        self.repainted = dict.fromkeys(self.views, 0)
+        self.suppressed = dict.fromkeys(self.views, 0)
+        self._dirty = set()
+        self._after_id = None
+
+    @property
+    def pending(self):
+        """Names of the views waiting to be repainted."""
+        return [name for name in self.views if name in self._dirty]
+
+    def mark(self, *names):
+        """Schedule a repaint of the named views.
+
+        Raises:
+            KeyError: If a name is not a registered view.
+        """
+        for name in names:
+            self.requested[name] += 1
+            if name in self._dirty:
+                self.suppressed[name] += 1
+            else:
+                self._dirty.add(name)
+        if self._dirty and self._after_id is None:
+            self._after_id = self.root.after_idle(self.flush)
+
+    def discard(self, name):
+        """Drop a pending repaint of ``name``, which was just painted directly."""
+        if name in self._dirty:
+            self._dirty.discard(name)
+            self.suppressed[name] += 1
+        if not self._dirty:
+            self.cancel()
+
+    def flush(self):
+        """Repaint the dirty views now.
+
+        Views marked while this runs are repainted in the next pass.
+        """
+        self.cancel()
+        dirty = self.pending
+        self._dirty.clear()
+        for name in dirty:
+            self.repainted[name] += 1
+            self.views[name]()
+
+    def cancel(self):
+        """Unschedule the pending pass, keeping the views marked dirty."""
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
@@ -0,0 +1,199 @@
+"""Inverted index for the search box."""
+
+import bisect
+import re
+
+_TOKEN = re.compile(r"\w+")
+_MAX_CHAR = "\U0010ffff"
+
+
+def tokenize(text):
+    """Split lowercase search text into word tokens."""
+    return _TOKEN.findall(text)
+
+
+def query_terms(query):
+    """Return the distinct terms of a search query, longest first."""
+    return sorted(set(tokenize(query.lower())), key=len, reverse=True)
+
+
+def matches_terms(tokens, terms):
+    """Check that every term is a prefix of one of ``tokens``."""
+    return all(any(token.startswith(term) for token in tokens) for term in terms)
+
+
+class SearchIndex:
+    """Token and prefix inverted index over the tasks' search text.
+
+    A task matches a query when every word of the query is the start of a
+    word in its description, deadline, priority or category (so "mil"
+    finds "Buy milk" and "06 2026" finds a deadline of 15-06-2026).
+
+    Postings map each token to the tasks containing it, and a sorted
+    vocabulary turns a prefix into a range of tokens with :mod:`bisect`.
+    A query resolves the rarest term through the postings and checks the
+    other terms against the candidates' tokens or intersects their
+    postings, whichever is less work. Tasks are tracked by identity; call
+    :meth:`update` after changing one.
+    """
+
+    def __init__(self, tasks=()):
+        """Create an index over ``tasks``."""
+        self.reset(tasks)
+
+    def __len__(self):
+        return len(self._tokens)
+
+    def reset(self, tasks=()):
+        """Replace the indexed tasks with ``tasks``."""
+        self._tokens = {}  # task -> tuple of its distinct tokens
+        self._postings = {}  # token -> set of tasks
+        self._vocabulary = []  # sorted tokens; None until rebuilt after bulk adds
+        self.version = 0  # changes whenever the indexed tasks do
+        self.extend(tasks)
+
+    def add(self, task):
+        """Index a new task."""
+        if task in self._tokens:
+            self.update(task)
+            return
+        tokens = tuple(set(tokenize(task.search_text())))
+        self._tokens[task] = tokens
+        self.version += 1
+        for token in tokens:
+            posting = self._postings.get(token)
+            if posting is None:
+                posting = self._postings[token] = set()
+                if self._vocabulary is not None:
+                    bisect.insort(self._vocabulary, token)
+            posting.add(task)
+
+    def extend(self, tasks):
+        """Index several new tasks."""
+        tasks = list(tasks)
+        if len(tasks) > 1:
+            self._vocabulary = None  # sorted once on the next search
+        for task in tasks:
+            self.add(task)
+
+    def update(self, task):
+        """Re-index ``task`` after its fields changed."""
+        self.remove(task)
+        self.add(task)
+
+    def replace(self, old, new):
+        """Index ``new`` in place of ``old``."""
+        self.remove(old)
+        self.add(new)
+
+    def remove(self, task):
+        """Stop indexing ``task``, if it is indexed."""
+        tokens = self._tokens.pop(task, None)
+        if tokens is None:
+            return
+        self.version += 1
+        for token in tokens:
+            posting = self._postings[token]
+            posting.discard(task)
+            if not posting:
+                del self._postings[token]
+                if self._vocabulary is not None:
+                    index = bisect.bisect_left(self._vocabulary, token)
+                    del self._vocabulary[index]
+
+    def matches(self, task, query):
+        """Check whether an indexed task matches ``query``."""
+        return matches_terms(self._tokens.get(task, ()), query_terms(query))
+
+    def narrow(self, tasks, query):
+        """Return the tasks of ``tasks`` (all indexed) that match ``query``."""
+        terms = query_terms(query)
+        return {task for task in tasks if matches_terms(self._tokens[task], terms)}
+
+    def search(self, query):
+        """Return the set of tasks matching ``query``.
+
+        An empty query (or one without any word characters) matches every
+        task.
+        """
+        terms = query_terms(query)
+        if not terms:
+            return set(self._tokens)
+
+        # Pick the term with the fewest postings to seed the candidates
+        ranges = [(self._matching_tokens(term), term) for term in terms]
+        sizes = [
+            sum(len(self._postings[token]) for token in tokens) for tokens, _ in ranges
+        ]
+        order = sorted(range(len(terms)), key=sizes.__getitem__)
+        candidates = self._union(ranges[order[0]][0])
+
+        for i in order[1:]:
+            if not candidates:
+                break
+            tokens, term = ranges[i]
+            if len(tokens) == 1 and sizes[i] == len(self._tokens):
+                continue  # a token every task has
+            if sizes[i] > 4 * len(candidates):
+                candidates = {
+                    task
+                    for task in candidates
+                    if any(token.startswith(term) for token in self._tokens[task])
+                }
+            else:
+                candidates = candidates & self._union(tokens)
+        # Never hand out a posting set itself
+        return set(candidates) if len(ranges[order[0]][0]) == 1 else candidates
+
+    def _matching_tokens(self, prefix):
+        """Return the indexed tokens starting with ``prefix``."""
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self._postings)
+        start = bisect.bisect_left(self._vocabulary, prefix)
+        end = bisect.bisect_left(self._vocabulary, prefix + _MAX_CHAR, start)
+        return self._vocabulary[start:end]
+
+    def _union(self, tokens):
+        """Return the tasks having any of ``tokens`` (a posting itself if one)."""
+        if len(tokens) == 1:
+            return self._postings[tokens[0]]
+        return set().union(*(self._postings[token] for token in tokens))
+
+
+class SearchSession:
+    """Answers successive queries typed into the search box.
+
+    When a query extends the previous one (more characters typed), its
+    matches are a subset of the previous matches, so a small previous
+    result is narrowed down instead of searching the index again. The
+    remembered result is dropped as soon as the index changes.
+    """
+
+    NARROW_LIMIT = 5000  # largest previous result worth narrowing
+
+    def __init__(self, index):
+        """Create a session over a :class:`SearchIndex`."""
+        self.index = index
+        self._query = None
+        self._results = None
+        self._version = None
+
+    def search(self, query):
+        """Return the set of indexed tasks matching ``query``."""
+        if (
+            self._results is not None
+            and self._version == self.index.version
+            and query.startswith(self._query)
+        ):
+            if query == self._query:
+                return set(self._results)
+            if len(self._results) <= self.NARROW_LIMIT:
+                results = self.index.narrow(self._results, query)
+            else:
+                results = self.index.search(query)
+        else:
+            results = self.index.search(query)
+        self._query = query
+        self._results = results
+        self._version = self.index.version
+        return set(results)
@@ -0,0 +1,170 @@
+"""Incrementally maintained sort orders of the task list."""
+
+import bisect
+import itertools
+from datetime import date
+
+from .constants import PRIORITY_ORDER
+
+_NO_DEADLINE = date.max.toordinal()
+
+
+def _deadline_key(task):
+    return _NO_DEADLINE if task.due_ordinal is None else task.due_ordinal
+
+
+def _priority_key(task):
+    return PRIORITY_ORDER.get(task.priority, 2)
+
+
+def _completed_key(task):
+    return task.completed
+
+
+# column -> primary key; ties fall back to the lowercased text, then to the
+# order in which tasks were added. Other columns sort by text.
+_PRIMARY_KEYS = {
+    "deadline": _deadline_key,
+    "priority": _priority_key,
+    "completed": _completed_key,
+}
+
+
+class SortIndex:
+    """Keeps the tasks sorted by each column, updated as tasks change.
+
+    Each column's order is a sorted list of keys with a parallel list of
+    tasks, maintained with :mod:`bisect` on every add, update and remove,
+    so switching the sort column or direction needs no sorting. A
+    column's order is only built the first time it is asked for, and bulk
+    additions drop the built orders rather than inserting one by one.
+
+    Every key ends with a sequence number unique to the task, so ties are
+    broken deterministically and each key locates exactly one task.
+    Tasks are tracked by identity; call :meth:`update` after changing one.
+    """
+
+    def __init__(self, tasks=()):
+        """Create an index over ``tasks``."""
+        self.reset(tasks)
+
+    def __len__(self):
+        return len(self._seq)
+
+    def reset(self, tasks=()):
+        """Replace the indexed tasks with ``tasks``."""
+        self._counter = itertools.count()
+        self._seq = {}  # task -> sequence number
+        self._orders = {}  # column -> (sorted keys, tasks in that order)
+        self._keys = {}  # column -> {task: its key in that column}
+        self.extend(tasks)
+
+    def add(self, task):
+        """Index a new task."""
+        if task in self._seq:
+            self.update(task)
+            return
+        self._seq[task] = next(self._counter)
+        for column in self._orders:
+            self._insert(column, task)
+
+    def extend(self, tasks):
+        """Index several new tasks."""
+        tasks = [task for task in tasks if task not in self._seq]
+        if len(tasks) > 1:
+            self._orders.clear()  # rebuilt on demand with a single sort
+            self._keys.clear()
+        for task in tasks:
+            self.add(task)
+
+    def update(self, task):
+        """Re-position ``task`` after its fields changed."""
+        if task not in self._seq:
+            self.add(task)
+            return
+        for column in self._orders:
+            self._delete(column, task)
+            self._insert(column, task)
+
+    def replace(self, old, new):
+        """Put ``new`` where ``old`` was, keeping its tie-break position."""
+        seq = self._seq.get(old)
+        if seq is None:
+            self.add(new)
+            return
+        self.remove(old)
+        self._seq[new] = seq
+        for column in self._orders:
+            self._insert(column, new)
+
+    def remove(self, task):
+        """Stop indexing ``task``, if it is indexed."""
+        if self._seq.pop(task, None) is None:
+            return
+        for column in self._orders:
+            self._delete(column, task)
+
+    def ordered(self, column, reverse=False):
+        """Return the tasks sorted by ``column``.
+
+        Args:
+            column: Treeview column name; "deadline", "priority" and
+                "completed" sort by that field, any other by task text.
+                None gives the order the tasks were added in, where a
+                replaced task keeps the place of the one it replaced.
+            reverse: Return the descending order instead. Tasks with equal
+                keys keep the order they were added in, as with
+                ``sorted(..., reverse=True)``.
+
+        Returns:
+            list: The tasks in sorted order.
+        """
+        if column is not None and column not in _PRIMARY_KEYS:
+            column = "task"
+        if column not in self._orders:
+            self._build(column)
+        keys, tasks = self._orders[column]
+        if not reverse:
+            return list(tasks)
+        if column is None:
+            return tasks[::-1]
+        # Walk the groups of equal keys (ignoring the sequence number) from
+        # the last one back, keeping each group in ascending order.
+        result = []
+        end = len(tasks)
+        while end:
+            start = end - 1
+            tie = keys[start][:-1]
+            while start and keys[start - 1][:-1] == tie:
+                start -= 1
+            result.extend(tasks[start:end])
+            end = start
+        return result
+
+    def _key(self, column, task):
+        if column is None:
+            return (self._seq[task],)
+        primary = _PRIMARY_KEYS.get(column)
+        if primary is None:
+            return (task.text.lower(), self._seq[task])
+        return (primary(task), task.text.lower(), self._seq[task])
+
+    def _build(self, column):
+        keys = {task: self._key(column, task) for task in self._seq}
+        tasks = sorted(keys, key=keys.__getitem__)
+        self._keys[column] = keys
+        self._orders[column] = ([keys[task] for task in tasks], tasks)
+
+    def _insert(self, column, task):
+        key = self._keys[column][task] = self._key(column, task)
+        keys, tasks = self._orders[column]
+        index = bisect.bisect_left(keys, key)
+        keys.insert(index, key)
+        tasks.insert(index, task)
+
+    def _delete(self, column, task):
+        key = self._keys[column].pop(task)
+        keys, tasks = self._orders[column]
+        index = bisect.bisect_left(keys, key)
+        del keys[index]
+        del tasks[index]
@@ -1,28 +1,106 @@
 """Task persistence layer - handles loading and saving tasks to JSON."""
 
+import atexit
 import json
 import os
+import sqlite3
+import tempfile
+import threading
 import uuid
 
+from . import binary_format
+from .constants import (
+    DEFAULT_STORAGE_BACKEND,
+    FILE_FORMATS,
+    JOURNAL_COMPACT_THRESHOLD,
+    SQLITE_FILENAME,
+    TASKS_FILENAME,
+)
+from .dates import deadline_ordinal
+from .streaming import LoadedTaskStream, TaskStream
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locks, single-writer behaviour
+    fcntl = None
+
 
 class TaskStorage:
-    """Manages task data persistence using a JSON file."""
+    """Manages task data persistence using a JSON file.
+
+    The file may also use the compact binary encoding from
+    :mod:`todo_app.binary_format`; the format is detected from its magic
+    header on load, and saves keep the format already on disk unless
+    ``file_format`` says otherwise.
+
+    Writes are crash-safe: data goes to a temporary file in the same
+    directory, is fsynced, and then atomically renamed over the target.
 
-    def __init__(self, filepath):
+    Several processes may share one file. Every write holds an advisory
+    :class:`FileLock` on the data directory, and if the file changed since
+    this instance last read or wrote it, the on-disk tasks are three-way
+    merged by ID with the tasks being saved (see :func:`merge_tasks`), so
+    concurrent edits to different tasks are all kept.
+    With a non-zero ``coalesce_window`` saves are deferred and a burst of
+    calls within the window results in a single write of the latest state.
+    Pending writes are flushed by :meth:`flush`, :meth:`close`, or at
+    interpreter exit.
+    """
+
+    default_filename = TASKS_FILENAME
+    supports_deltas = False
+    cacheable = True  # whether a StartupCache may stand in for load()
+    supports_external_changes = True  # see poll_external_changes()
+
+    def __init__(self, filepath, coalesce_window=0, file_format=None):
         """Initialize storage with the given file path.
 
         Args:
             filepath: Absolute path to the tasks JSON file.
+            coalesce_window: Seconds to wait for further saves before
+                writing. Zero writes synchronously on every save.
+            file_format: "json" or "binary" to force the on-disk format,
+                or None to keep whatever the existing file uses.
         """
+        if file_format is not None and file_format not in FILE_FORMATS:
+            raise ValueError(f"Unknown file format: {file_format}")
         self.filepath = filepath
+        self.file_format = file_format
+        self.coalesce_window = coalesce_window
+        self.last_error = None
+        self._pending = None
+        self._timer = None
+        self._dirty = {}  # task id -> task copy, or None when deleted
+        self._lock = threading.RLock()
+        self._file_lock = FileLock(os.path.dirname(filepath))
+        self._base = {}  # task id -> record the caller's tasks derive from
+        self._disk = {}  # task id -> record as last read or written
+        self._disk_stat = None  # identity of the file behind self._disk
+        self._external = {}  # task id -> record (None if deleted) from other writers
+        if coalesce_window:
+            atexit.register(self.flush)
 
     @property
     def exists(self):
         """Check if the storage file already exists."""
         return os.path.exists(self.filepath)
 
+    @property
+    def source_paths(self):
+        """Files whose contents fully determine the loaded tasks."""
+        return [self.filepath]
+
+    def detect_format(self):
+        """Return the format of the file on disk ("json" if it doesn't exist)."""
+        try:
+            with open(self.filepath, "rb") as f:
+                header = f.read(len(binary_format.MAGIC))
+        except FileNotFoundError:
+            return "json"
+        return "binary" if binary_format.is_binary(header) else "json"
+
     def load(self):
-        """Load tasks from the JSON file.
+        """Load tasks from the JSON (or binary) file.
 
         Returns:
             tuple: (tasks_list, was_updated) where was_updated indicates
@@ -31,9 +109,10 @@ class TaskStorage:
         Raises:
             FileNotFoundError: If the storage file doesn't exist.
             json.JSONDecodeError: If the file contains invalid JSON.
+            binary_format.BinaryFormatError: If a binary file is corrupt.
         """
-        with open(self.filepath, "r") as f:
-            loaded_tasks = json.load(f)
+        with self._lock:
+            loaded_tasks, stat = self._read_file()
 
         tasks = []
         updated = False
@@ -45,24 +124,892 @@ class TaskStorage:
                     updated = True
                 tasks.append(item)
 
+        self._loaded(tasks, stat)
         return tasks, updated
 
+    def assume_loaded(self, tasks):
+        """Record ``tasks`` as the current file contents without reading it.
+
+        Call this when the tasks were restored from elsewhere (e.g. a
+        :class:`~todo_app.cache.StartupCache` validated against the file),
+        so later saves merge against the right base.
+        """
+        self._loaded(tasks, self._current_identity())
+
+    def stream_cached(self, tasks):
+        """Return a stream handing out ``tasks`` restored from elsewhere.
+
+        Like :meth:`assume_loaded`, but the tasks are recorded as the file
+        contents as the stream is consumed, so a large list is not
+        serialized in one go.
+        """
+        return _AssumedTaskStream(self, tasks, self._current_identity())
+
+    def poll_external_changes(self):
+        """Return the changes other programs made to the file since the last call.
+
+        Changes found (and merged) while saving are included, so nothing is
+        missed when another writer and this instance write close together.
+        A missing or unreadable file (e.g. one being rewritten in place) is
+        reported as no change and looked at again on the next call.
+
+        Returns:
+            dict: Task ID -> the task as now on disk, or None if deleted.
+        """
+        with self._lock, self._file_lock:
+            try:
+                stat = _file_identity(os.stat(self.filepath))
+            except FileNotFoundError:
+                stat = None
+            if stat is not None and stat != self._disk_stat:
+                try:
+                    theirs, stat = self._read_records()
+                except (OSError, ValueError):
+                    theirs = None
+                if theirs is not None:
+                    self._note_external(theirs, theirs)
+                    self._disk = theirs
+                    self._disk_stat = stat
+            changes, self._external = self._external, {}
+
+        return {
+            task_id: None if record is None else dict(record)
+            for task_id, record in changes.items()
+        }
+
+    def disk_tasks(self, tasks):
+        """Return the task list as this instance last read or wrote the file.
+
+        Saves merge in other writers' tasks, so the file can hold more
+        than the caller's list. Dicts from ``tasks`` are reused where they
+        match the file; other records are copied.
+
+        Args:
+            tasks: The caller's current task dictionaries.
+
+        Returns:
+            list or None: The tasks in file order, or None if the file was
+            changed by someone else since it was last read or written.
+        """
+        with self._lock:
+            if self._current_identity() != self._disk_stat:
+                return None
+            by_id = {task.get("id"): task for task in tasks}
+            result = []
+            for task_id, record in self._disk.items():
+                task = by_id.get(task_id)
+                if task is None or task != record:
+                    task = dict(record)
+                result.append(task)
+            return result
+
+    def stream(self, on_progress=None):
+        """Return an iterator that parses tasks from the file one at a time.
+
+        Use this instead of :meth:`load` for very large files; see
+        :class:`~todo_app.streaming.TaskStream`.
+
+        Binary files are compact enough to decode in one go and are
+        returned as an already-loaded stream.
+
+        Args:
+            on_progress: Optional callable receiving (bytes_read, total_bytes).
+        """
+        if self.detect_format() == "binary":
+            return LoadedTaskStream(*self.load())
+        return _TrackedTaskStream(self, on_progress=on_progress)
+
     def save(self, tasks):
-        """Save tasks to the JSON file.
+        """Save tasks, immediately or once the coalescing window closes.
 
         Args:
             tasks: List of task dictionaries to persist.
 
         Raises:
-            IOError: If the file cannot be written.
+            IOError: If the file cannot be written (synchronous saves only;
+                deferred failures are kept in ``last_error`` and re-raised
+                by :meth:`flush`).
         """
-        # Ensure the data directory exists
-        os.makedirs(os.path.dirname(self.filepath), exist_ok=True)
-
         # Ensure all tasks have valid IDs
         for task in tasks:
             if "id" not in task or not task["id"]:
                 task["id"] = str(uuid.uuid4())
 
-        with open(self.filepath, "w") as f:
-            json.dump(tasks, f, indent=4)
+        if not self.coalesce_window:
+            with self._lock:
+                self._write(tasks)
+            return
+
+        with self._lock:
+            self._pending = [dict(task) for task in tasks]
+            if self._timer is None:
+                self._timer = threading.Timer(self.coalesce_window, self._flush_pending)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def mark_dirty(self, task):
+        """Record that ``task`` was created or changed since the last save.
+
+        A copy is taken, so the caller may keep mutating its own dict.
+        """
+        if "id" not in task or not task["id"]:
+            task["id"] = str(uuid.uuid4())
+        with self._lock:
+            self._dirty[task["id"]] = dict(task)
+
+    def mark_deleted(self, task_id):
+        """Record that the task with ``task_id`` was deleted."""
+        with self._lock:
+            self._dirty[task_id] = None
+
+    @property
+    def has_changes(self):
+        """Whether tasks were marked dirty or deleted since the last save."""
+        return bool(self._dirty)
+
+    def save_changes(self):
+        """Persist only the tasks marked dirty or deleted since the last save.
+
+        The work done is proportional to the number of changed tasks.
+        Changes stay marked if the write fails, so the next call retries.
+
+        Raises:
+            NotImplementedError: If the backend can only write full lists
+                (check :attr:`supports_deltas`).
+            IOError: If the changes cannot be written.
+        """
+        if not self.supports_deltas:
+            raise NotImplementedError(
+                f"{type(self).__name__} can only save the full task list"
+            )
+        with self._lock:
+            changes, self._dirty = self._dirty, {}
+            if not changes:
+                return
+            try:
+                self._write_changes(changes)
+            except BaseException:
+                for task_id, task in changes.items():
+                    self._dirty.setdefault(task_id, task)
+                raise
+
+    def flush(self):
+        """Write any deferred save now.
+
+        Raises:
+            IOError: If the pending write fails.
+        """
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if self._pending is not None:
+                self._write(self._pending)
+                self._pending = None
+                self.last_error = None
+
+    def close(self):
+        """Flush pending writes and release resources."""
+        self.flush()
+
+    def _flush_pending(self):
+        """Timer callback: flush, keeping the snapshot pending on failure."""
+        with self._lock:
+            self._timer = None
+            try:
+                self.flush()
+            except (IOError, OSError) as e:
+                self.last_error = e
+
+    def _current_identity(self):
+        try:
+            return _file_identity(os.stat(self.filepath))
+        except FileNotFoundError:
+            return None
+
+    def _loaded(self, tasks, stat):
+        """Remember ``tasks`` as read from the file identified by ``stat``."""
+        self._loaded_records(_records(tasks), stat)
+
+    def _loaded_records(self, records, stat):
+        """Like :meth:`_loaded`, given the tasks' :func:`_records`."""
+        with self._lock:
+            self._base = records
+            self._disk = records
+            self._disk_stat = stat
+            self._external = {}
+
+    def _read_file(self):
+        """Read the raw task list; return it with the identity of the file read."""
+        with open(self.filepath, "rb") as f:
+            stat = _file_identity(os.fstat(f.fileno()))
+            data = f.read()
+        if binary_format.is_binary(data):
+            return binary_format.loads(data), stat
+        return json.loads(data), stat
+
+    def _read_records(self):
+        """Read the file as ID -> record; return it with the file identity."""
+        tasks, stat = self._read_file()
+        return _records(t for t in tasks if isinstance(t, dict) and t.get("id")), stat
+
+    def _note_external(self, theirs, merged):
+        """Queue other writers' changes (relative to ``_disk``) that survive in ``merged``."""
+        for task_id, record in theirs.items():
+            if self._disk.get(task_id) != record and merged.get(task_id) == record:
+                self._external[task_id] = record
+        for task_id in self._disk:
+            if task_id not in theirs and task_id not in merged:
+                self._external[task_id] = None
+
+    def _write(self, tasks):
+        """Merge with external changes, then write the full task list."""
+        with self._file_lock:
+            ours = _records(tasks)
+            try:
+                stat = _file_identity(os.stat(self.filepath))
+            except FileNotFoundError:
+                stat = None
+            if stat == self._disk_stat:
+                theirs = self._disk
+            elif stat is None:
+                theirs = {}
+            else:
+                theirs = self._read_records()[0]
+
+            merged = merge_tasks(self._base, ours, theirs)
+            if theirs is not self._disk:
+                self._note_external(theirs, merged)
+            by_id = {task["id"]: task for task in tasks}
+            merged_tasks = [
+                by_id[task_id] if record is ours.get(task_id) else dict(record)
+                for task_id, record in merged.items()
+            ]
+
+            if (self.file_format or self.detect_format()) == "binary":
+                atomic_write(self.filepath, binary_format.dumps(merged_tasks))
+            else:
+                atomic_write(self.filepath, json.dumps(merged_tasks, indent=4))
+            self._base = ours
+            self._disk = merged
+            self._disk_stat = _file_identity(os.stat(self.filepath))
+
+    def _write_changes(self, changes):
+        """Write the given id -> task (or None) changes; see :meth:`save_changes`."""
+        raise NotImplementedError
+
+
+class FileLock:
+    """Advisory, re-entrant cross-process lock on a directory (``fcntl.flock``).
+
+    The directory itself is locked rather than a lock file, so no extra
+    files are left behind and atomic renames inside it do not matter.
+    Without ``fcntl`` (Windows) only threads of this process are excluded.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory or "."
+        self._thread_lock = threading.RLock()
+        self._fd = None
+        self._depth = 0
+
+    def __enter__(self):
+        self._thread_lock.acquire()
+        if self._depth == 0:
+            try:
+                os.makedirs(self.directory, exist_ok=True)
+                if fcntl is not None:
+                    self._fd = os.open(self.directory, os.O_RDONLY)
+                    fcntl.flock(self._fd, fcntl.LOCK_EX)
+            except BaseException:
+                if self._fd is not None:
+                    os.close(self._fd)
+                    self._fd = None
+                self._thread_lock.release()
+                raise
+        self._depth += 1
+        return self
+
+    def __exit__(self, *exc_info):
+        self._depth -= 1
+        if self._depth == 0 and self._fd is not None:
+            try:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+            finally:
+                os.close(self._fd)
+                self._fd = None
+        self._thread_lock.release()
+
+
+def merge_tasks(base, ours, theirs):
+    """Three-way merge of task records keyed by ID.
+
+    Each argument maps task ID to its record (see :func:`_record`):
+    ``base`` is the state both sides started from, ``ours`` the state being
+    saved and ``theirs`` the state found on disk. A task changed on only one side
+    takes that side's version; a task changed on both sides takes ours. A
+    deletion only wins over an unchanged task, so no edit is ever lost.
+
+    Returns:
+        dict: The merged ID -> record mapping, in ours order followed by
+            tasks that only exist on disk.
+    """
+    merged = {}
+    for task_id, record in ours.items():
+        unchanged_here = task_id in base and base[task_id] == record
+        if task_id not in theirs:
+            if not unchanged_here:  # else: deleted on disk, untouched here
+                merged[task_id] = record
+        elif unchanged_here:
+            merged[task_id] = theirs[task_id]
+        else:
+            merged[task_id] = record
+    for task_id, record in theirs.items():
+        if task_id in ours:
+            continue
+        if task_id in base and base[task_id] == record:
+            continue  # deleted here, untouched on disk
+        merged[task_id] = record
+    return merged
+
+
+def _records(tasks):
+    """Map each task's ID to its :func:`_record`."""
+    return {task["id"]: _record(task) for task in tasks}
+
+
+def _record(task):
+    """Return the merge record of a task: a private shallow copy.
+
+    Records are compared with ``==``, which for dicts ignores key order,
+    so no canonical serialization is needed. Nested values are shared
+    with ``task`` and must not be changed in place.
+    """
+    return dict(task)
+
+
+def _file_identity(st):
+    """Reduce a stat result to the fields that change when a file is rewritten."""
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+class _TrackedTaskStream(TaskStream):
+    """A :class:`TaskStream` that reports what it read back to its storage."""
+
+    def __init__(self, storage, on_progress=None):
+        super().__init__(storage.filepath, on_progress=on_progress)
+        self._storage = storage
+
+    def __iter__(self):
+        records = {}  # built as tasks are read, not all at the end
+        for task in super().__iter__():
+            records[task["id"]] = _record(task)
+            yield task
+        self._storage._loaded_records(records, _file_identity(self.stat))
+
+
+class _AssumedTaskStream(LoadedTaskStream):
+    """A :class:`LoadedTaskStream` recorded as its storage's file contents."""
+
+    def __init__(self, storage, tasks, stat):
+        super().__init__(tasks)
+        self._storage = storage
+        self._stat = stat
+
+    def __iter__(self):
+        records = {}
+        for task in super().__iter__():
+            records[task["id"]] = _record(task)
+            yield task
+        self._storage._loaded_records(records, self._stat)
+
+
+def atomic_write(path, data):
+    """Write ``data`` (str or bytes) to ``path`` via an fsynced temp file and rename.
+
+    Readers see either the old file or the complete new one, never a
+    partially written file.
+    """
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+
+    fd, tmp_path = tempfile.mkstemp(
+        prefix=os.path.basename(path) + ".", suffix=".tmp", dir=directory
+    )
+    try:
+        with os.fdopen(fd, "wb" if isinstance(data, bytes) else "w") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+    # Persist the rename itself (not supported on every platform)
+    try:
+        dir_fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(dir_fd)
+    except OSError:
+        pass
+    finally:
+        os.close(dir_fd)
+
+
+class _IncrementalStorage(TaskStorage):
+    """Base for backends that persist per-task changes instead of the full list.
+
+    Remembers the serialized form of every task as last written. Full saves
+    diff against it; :meth:`save_changes` skips the diff and writes only the
+    tasks marked with :meth:`mark_dirty` / :meth:`mark_deleted`. Subclasses
+    implement :meth:`_apply`.
+    """
+
+    supports_deltas = True
+    cacheable = False  # load() also rebuilds the per-record state below
+    supports_external_changes = False
+
+    def __init__(self, filepath, coalesce_window=0, file_format=None):
+        super().__init__(filepath, coalesce_window, file_format)
+        self._persisted = {}  # task id -> serialized record on disk
+
+    def stream(self, on_progress=None):
+        """Load everything up front and hand tasks out as a stream.
+
+        The on-disk state is only known after replaying all changes, so
+        this backend cannot parse incrementally.
+        """
+        tasks, updated = self.load()
+        return LoadedTaskStream(tasks, updated)
+
+    def poll_external_changes(self):
+        """Not tracked for this backend; always returns an empty dict."""
+        return {}
+
+    def _remember(self, tasks):
+        """Record ``tasks`` as the state currently on disk."""
+        self._persisted = {task["id"]: self._serialize(task) for task in tasks}
+
+    def _write(self, tasks):
+        """Diff the full task list against disk and apply the differences."""
+        current = {}
+        changed = []
+        for task in tasks:
+            if "id" not in task or not task["id"]:
+                task["id"] = str(uuid.uuid4())
+            record = self._serialize(task)
+            current[task["id"]] = record
+            if self._persisted.get(task["id"]) != record:
+                changed.append((task, record))
+        deleted_ids = [task_id for task_id in self._persisted if task_id not in current]
+
+        self._apply(changed, deleted_ids)
+        self._persisted = current
+
+    def _write_changes(self, changes):
+        """Apply marked changes without looking at unchanged tasks."""
+        changed = []
+        deleted_ids = []
+        for task_id, task in changes.items():
+            if task is None:
+                if task_id in self._persisted:
+                    deleted_ids.append(task_id)
+            else:
+                record = self._serialize(task)
+                if self._persisted.get(task_id) != record:
+                    changed.append((task, record))
+
+        self._apply(changed, deleted_ids)
+        for task, record in changed:
+            self._persisted[task["id"]] = record
+        for task_id in deleted_ids:
+            del self._persisted[task_id]
+
+    def _apply(self, changed, deleted_ids):
+        """Persist changed (task, record) pairs and remove deleted ids."""
+        raise NotImplementedError
+
+    @staticmethod
+    def _serialize(task):
+        """Return the canonical encoding of a single task."""
+        return json.dumps(task, sort_keys=True)
+
+
+class JournalTaskStorage(_IncrementalStorage):
+    """Task persistence using a JSON snapshot plus an append-only journal.
+
+    Each save appends only the tasks that were added, changed, or deleted
+    since the previous save to ``<filepath>.journal`` (one JSON object per
+    line). Once the journal holds ``compact_threshold`` entries it is folded
+    into a fresh snapshot at ``filepath``, which keeps the plain JSON
+    layout so the file stays readable by :class:`TaskStorage`.
+    """
+
+    def __init__(
+        self,
+        filepath,
+        coalesce_window=0,
+        file_format=None,
+        compact_threshold=JOURNAL_COMPACT_THRESHOLD,
+    ):
+        """Initialize storage with the given snapshot path.
+
+        Args:
+            filepath: Absolute path to the snapshot file.
+            coalesce_window: See :class:`TaskStorage`.
+            file_format: Snapshot format; see :class:`TaskStorage`.
+            compact_threshold: Number of journal entries that triggers
+                a snapshot rewrite.
+        """
+        super().__init__(filepath, coalesce_window, file_format)
+        self.journal_path = filepath + ".journal"
+        self.compact_threshold = compact_threshold
+        self._journal_entries = 0
+
+    @property
+    def exists(self):
+        """Check if a snapshot or journal already exists."""
+        return os.path.exists(self.filepath) or os.path.exists(self.journal_path)
+
+    @property
+    def source_paths(self):
+        """The snapshot and the journal replayed on top of it."""
+        return [self.filepath, self.journal_path]
+
+    def load(self):
+        """Load the snapshot and replay the journal on top of it.
+
+        Journal lines that are not valid JSON, such as a torn final line
+        left by a crash mid-append, are skipped.
+
+        Returns:
+            tuple: (tasks_list, was_updated) where was_updated indicates
+                   if any tasks were assigned new IDs.
+
+        Raises:
+            FileNotFoundError: If neither snapshot nor journal exists.
+            json.JSONDecodeError: If the snapshot contains invalid JSON.
+        """
+        with self._lock, self._file_lock:  # same order as saves take them
+            tasks_by_id, updated, entries = self._replay()
+        tasks = list(tasks_by_id.values())
+        self._remember(tasks)
+        self._journal_entries = entries
+        return tasks, updated
+
+    def _replay(self):
+        """Read the snapshot and journal; return (tasks_by_id, updated, entries)."""
+        if not self.exists:
+            raise FileNotFoundError(self.filepath)
+
+        tasks_by_id = {}
+        updated = False
+
+        if os.path.exists(self.filepath):
+            snapshot, updated = TaskStorage.load(self)
+            for task in snapshot:
+                tasks_by_id[task["id"]] = task
+
+        entries = 0
+        if os.path.exists(self.journal_path):
+            with open(self.journal_path, "r") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    if not isinstance(entry, dict):
+                        continue
+                    if entry.get("op") == "put" and isinstance(entry.get("task"), dict):
+                        task = entry["task"]
+                        tasks_by_id[task["id"]] = task
+                    elif entry.get("op") == "del":
+                        tasks_by_id.pop(entry.get("id"), None)
+                    entries += 1
+        return tasks_by_id, updated, entries
+
+    def _apply(self, changed, deleted_ids):
+        """Append put/del entries to the journal, compacting when it is full."""
+        lines = ['{"op": "put", "task": %s}\n' % record for _, record in changed]
+        lines.extend(
+            json.dumps({"op": "del", "id": task_id}) + "\n" for task_id in deleted_ids
+        )
+        if not lines:
+            return
+
+        # Journal first: if compaction is interrupted, replaying the
+        # journal over the new snapshot still yields the same state.
+        with self._file_lock:
+            self._drop_torn_tail()
+            with open(self.journal_path, "a") as f:
+                f.writelines(lines)
+                f.flush()
+                os.fsync(f.fileno())  # a saved change survives a power cut
+            self._journal_entries += len(lines)
+
+            if self._journal_entries >= self.compact_threshold:
+                self._compact()
+
+    def _drop_torn_tail(self):
+        """Truncate a journal that does not end in a newline after its last one.
+
+        A crash mid-append leaves a partial last line; appending straight
+        after it would glue the next entry onto the fragment and lose it.
+        Must be called with the file lock held.
+        """
+        try:
+            f = open(self.journal_path, "rb+")
+        except FileNotFoundError:
+            return
+        with f:
+            end = f.seek(0, os.SEEK_END)
+            position = end
+            while position > 0:
+                start = max(0, position - 4096)
+                f.seek(start)
+                chunk = f.read(position - start)
+                newline = chunk.rfind(b"\n")
+                if newline != -1:
+                    position = start + newline + 1
+                    break
+                position = start
+            if position != end:
+                f.truncate(position)
+
+    def compact(self):
+        """Fold the journal into a fresh snapshot and truncate it."""
+        with self._lock, self._file_lock:
+            self._compact()
+
+    def _compact(self):
+        """Rewrite the snapshot from disk, including other writers' entries.
+
+        Must be called with the file lock held.
+        """
+        try:
+            tasks_by_id, _, _ = self._replay()
+        except FileNotFoundError:
+            tasks_by_id = {}
+        tasks = list(tasks_by_id.values())
+
+        if (self.file_format or self.detect_format()) == "binary":
+            atomic_write(self.filepath, binary_format.dumps(tasks))
+        else:
+            atomic_write(
+                self.filepath,
+                "[\n" + ",\n".join(json.dumps(task) for task in tasks) + "\n]",
+            )
+        if os.path.exists(self.journal_path):
+            os.remove(self.journal_path)
+        self._journal_entries = 0
+
+
+class SqliteTaskStorage(_IncrementalStorage):
+    """Task persistence in an SQLite database with indexed lookups.
+
+    Saves issue per-row upserts and deletes for the tasks that changed.
+    The full task record is kept as JSON alongside indexed columns for
+    deadline, category, and completion status, so round-trips are lossless.
+    On first load an existing ``tasks.json`` next to the database is imported.
+    """
+
+    default_filename = SQLITE_FILENAME
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS tasks (
+            seq INTEGER PRIMARY KEY AUTOINCREMENT,
+            id TEXT NOT NULL UNIQUE,
+            deadline_ordinal INTEGER,
+            category TEXT,
+            completed INTEGER NOT NULL DEFAULT 0,
+            data TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_tasks_deadline ON tasks (deadline_ordinal);
+        CREATE INDEX IF NOT EXISTS idx_tasks_category ON tasks (category);
+        CREATE INDEX IF NOT EXISTS idx_tasks_completed ON tasks (completed);
+    """
+
+    def __init__(self, filepath, coalesce_window=0, file_format=None):
+        """Initialize storage with the given database path.
+
+        Args:
+            filepath: Absolute path to the SQLite database file.
+            coalesce_window: See :class:`TaskStorage`.
+            file_format: Unused; accepted for a uniform constructor.
+        """
+        super().__init__(filepath, coalesce_window)
+        self.legacy_json_path = os.path.join(os.path.dirname(filepath), TASKS_FILENAME)
+        self._conn = None
+
+    @property
+    def exists(self):
+        """Check if the database or a JSON file to import already exists."""
+        return os.path.exists(self.filepath) or os.path.exists(self.legacy_json_path)
+
+    def _connect(self):
+        """Open the database on first use and ensure the schema exists."""
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.filepath) or ".", exist_ok=True)
+            self._conn = sqlite3.connect(self.filepath, check_same_thread=False)
+            self._conn.executescript(self._SCHEMA)
+        return self._conn
+
+    def close(self):
+        """Flush pending writes and close the database connection."""
+        super().close()
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def load(self):
+        """Load all tasks from the database, importing ``tasks.json`` if needed.
+
+        Returns:
+            tuple: (tasks_list, was_updated) where was_updated indicates
+                   if any tasks were assigned new IDs.
+
+        Raises:
+            FileNotFoundError: If neither the database nor tasks.json exists.
+            json.JSONDecodeError: If the imported JSON file is invalid.
+        """
+        if not os.path.exists(self.filepath):
+            if not os.path.exists(self.legacy_json_path):
+                raise FileNotFoundError(self.filepath)
+            tasks, updated = TaskStorage(self.legacy_json_path).load()
+            self.save(tasks)
+            return tasks, updated
+
+        tasks = self._select("")
+        self._remember(tasks)
+        return tasks, False
+
+    def _apply(self, changed, deleted_ids):
+        """Write changed tasks as row upserts and remove deleted ones."""
+        conn = self._connect()
+        with conn:
+            conn.executemany(
+                "INSERT INTO tasks (id, deadline_ordinal, category, completed, data) "
+                "VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(id) DO UPDATE SET "
+                "deadline_ordinal = excluded.deadline_ordinal, "
+                "category = excluded.category, "
+                "completed = excluded.completed, "
+                "data = excluded.data",
+                [self._row(task, record) for task, record in changed],
+            )
+            conn.executemany(
+                "DELETE FROM tasks WHERE id = ?", [(task_id,) for task_id in deleted_ids]
+            )
+
+    # ------------------------------------------------------------------ #
+    #  Indexed queries                                                    #
+    # ------------------------------------------------------------------ #
+
+    def get_task(self, task_id):
+        """Return the task with ``task_id``, or None if it doesn't exist."""
+        tasks = self._select("WHERE id = ?", (task_id,))
+        return tasks[0] if tasks else None
+
+    def tasks_due_between(self, start=None, end=None):
+        """Return tasks whose deadline falls within ``[start, end]``.
+
+        Args:
+            start: Earliest ``date`` to include, or None for no lower bound.
+            end: Latest ``date`` to include, or None for no upper bound.
+        """
+        low = start.toordinal() if start else -1
+        high = end.toordinal() if end else 2 ** 31
+        return self._select(
+            "WHERE deadline_ordinal BETWEEN ? AND ?", (low, high)
+        )
+
+    def tasks_in_category(self, category):
+        """Return all tasks in ``category``."""
+        return self._select("WHERE category = ?", (category,))
+
+    def tasks_by_status(self, completed):
+        """Return all completed (True) or pending (False) tasks."""
+        return self._select("WHERE completed = ?", (int(bool(completed)),))
+
+    def _select(self, where, params=()):
+        """Fetch task records matching ``where`` in insertion order."""
+        rows = self._connect().execute(
+            f"SELECT data FROM tasks {where} ORDER BY seq", params
+        )
+        return [json.loads(data) for (data,) in rows]
+
+    @staticmethod
+    def _row(task, record):
+        """Build the column values stored for ``task``."""
+        return (
+            task["id"],
+            deadline_ordinal(task.get("deadline", "")),
+            task.get("category"),
+            int(bool(task.get("completed", False))),
+            record,
+        )
+
+
+STORAGE_BACKENDS = {
+    "json": TaskStorage,
+    "journal": JournalTaskStorage,
+    "sqlite": SqliteTaskStorage,
+}
+
+
+def create_storage(data_dir, backend=DEFAULT_STORAGE_BACKEND, **options):
+    """Create the task storage for ``data_dir`` using the named backend.
+
+    Args:
+        data_dir: Directory holding the task data files.
+        backend: Key into :data:`STORAGE_BACKENDS`.
+        **options: Extra keyword arguments for the backend class,
+            e.g. ``coalesce_window``.
+
+    Returns:
+        TaskStorage: The configured storage instance.
+
+    Raises:
+        ValueError: If the backend name is unknown.
+    """
+    try:
+        storage_class = STORAGE_BACKENDS[backend]
+    except KeyError:
+        raise ValueError(f"Unknown storage backend: {backend}") from None
+    return storage_class(
+        os.path.join(data_dir, storage_class.default_filename), **options
+    )
+
+
+def convert_file(src, dst, file_format=None):
+    """Copy a task file into the given format.
+
+    ``dst`` is overwritten with exactly the tasks read from ``src``; tasks
+    already in an existing ``dst`` are not merged in.
+
+    Args:
+        src: Path of an existing JSON or binary task file.
+        dst: Path to write; may equal ``src`` to convert in place.
+        file_format: Target format ("json" or "binary"). Defaults to the
+            opposite of the source format.
+
+    Returns:
+        tuple: (number_of_tasks, target_format)
+    """
+    source = TaskStorage(src)
+    if file_format is None:
+        file_format = "json" if source.detect_format() == "binary" else "binary"
+    tasks, _ = source.load()
+    if file_format == "binary":
+        data = binary_format.dumps(tasks)
+    else:
+        data = json.dumps(tasks, indent=4)
+    with FileLock(os.path.dirname(dst)):
+        atomic_write(dst, data)
+    return len(tasks), file_format
@@ -0,0 +1,155 @@
+"""Incremental parsing of large task files, one record at a time."""
+
+import codecs
+import json
+import os
+import uuid
+
+from .constants import STREAM_CHUNK_SIZE
+
+_WHITESPACE = " \t\n\r"
+
+
+class TaskStream:
+    """Iterates over the tasks in a JSON array file without loading it whole.
+
+    The file is read in ``chunk_size`` byte blocks and each array element is
+    decoded as soon as it is complete, so peak memory stays close to one
+    chunk plus one record. Items that are not objects are skipped and tasks
+    without an ID are assigned one (setting :attr:`updated`).
+
+    Progress is exposed through :attr:`bytes_read`, :attr:`total_bytes` and
+    :attr:`progress`, and an optional ``on_progress(bytes_read, total_bytes)``
+    callback is invoked after each chunk.
+    """
+
+    def __init__(self, filepath, chunk_size=STREAM_CHUNK_SIZE, on_progress=None):
+        """Prepare a stream over ``filepath``; the file is opened on iteration.
+
+        Args:
+            filepath: Path to a JSON file holding an array of tasks.
+            chunk_size: Number of bytes to read at a time.
+            on_progress: Optional callable receiving (bytes_read, total_bytes).
+        """
+        self.filepath = filepath
+        self.chunk_size = chunk_size
+        self.on_progress = on_progress
+        self.updated = False
+        self.bytes_read = 0
+        self.total_bytes = 0
+        self.stat = None  # os.fstat() of the file being read
+
+    @property
+    def progress(self):
+        """Fraction of the file consumed so far, between 0.0 and 1.0."""
+        if not self.total_bytes:
+            return 1.0 if self.bytes_read else 0.0
+        return min(self.bytes_read / self.total_bytes, 1.0)
+
+    def __iter__(self):
+        """Yield validated task dictionaries in file order.
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist.
+            json.JSONDecodeError: If the file is not a valid JSON array.
+        """
+        decoder = json.JSONDecoder()
+        utf8 = codecs.getincrementaldecoder("utf-8")()
+
+        with open(self.filepath, "rb") as f:
+            self.stat = os.fstat(f.fileno())
+            self.total_bytes = self.stat.st_size
+            self.bytes_read = 0
+            buf = ""
+            pos = 0
+            eof = False
+
+            def fill():
+                """Append the next chunk to the buffer; return False at EOF."""
+                nonlocal buf, pos, eof
+                raw = f.read(self.chunk_size)
+                self.bytes_read += len(raw)
+                if self.on_progress:
+                    self.on_progress(self.bytes_read, self.total_bytes)
+                buf = buf[pos:] + utf8.decode(raw, final=not raw)
+                pos = 0
+                eof = not raw
+                return bool(raw)
+
+            def skip_whitespace():
+                """Advance past whitespace, reading more input as needed."""
+                nonlocal pos
+                while True:
+                    while pos < len(buf) and buf[pos] in _WHITESPACE:
+                        pos += 1
+                    if pos < len(buf) or not fill():
+                        return
+
+            def expect(chars):
+                """Consume one of ``chars`` and return it."""
+                nonlocal pos
+                skip_whitespace()
+                if pos >= len(buf) or buf[pos] not in chars:
+                    found = buf[pos] if pos < len(buf) else "end of file"
+                    raise json.JSONDecodeError(
+                        f"Expected one of {chars!r}, found {found!r}", buf, pos
+                    )
+                pos += 1
+                return buf[pos - 1]
+
+            expect("[")
+            skip_whitespace()
+            if pos < len(buf) and buf[pos] == "]":
+                return
+
+            while True:
+                skip_whitespace()
+                while True:
+                    try:
+                        item, end = decoder.raw_decode(buf, pos)
+                    except json.JSONDecodeError:
+                        if eof or not fill():
+                            raise
+                        continue
+                    # A value touching the end of the buffer (e.g. a number)
+                    # may continue in the next chunk.
+                    if end == len(buf) and not eof and fill():
+                        continue
+                    break
+                pos = end
+
+                if isinstance(item, dict):
+                    if "id" not in item or not item["id"]:
+                        item["id"] = str(uuid.uuid4())
+                        self.updated = True
+                    yield item
+
+                if expect(",]") == "]":
+                    return
+
+
+class LoadedTaskStream:
+    """A :class:`TaskStream`-compatible wrapper around an already-loaded list.
+
+    Used by backends that must read everything before the first task is
+    known (e.g. journal replay), so callers can consume any backend the
+    same way.
+    """
+
+    def __init__(self, tasks, updated=False):
+        self._tasks = tasks
+        self.updated = updated
+        self.total_bytes = len(tasks)
+        self.bytes_read = 0
+
+    @property
+    def progress(self):
+        """Fraction of the tasks handed out so far."""
+        if not self.total_bytes:
+            return 1.0
+        return self.bytes_read / self.total_bytes
+
+    def __iter__(self):
+        for task in self._tasks:
+            self.bytes_read += 1
+            yield task
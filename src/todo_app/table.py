@@ -0,0 +1,269 @@
+"""Columnar table of task fields for fast aggregate statistics."""
+
+import operator
+from array import array
+from collections import Counter
+from itertools import compress
+
+try:
+    import numpy
+except ImportError:  # optional: the array module alone is used instead
+    numpy = None
+
+NO_DUE = 2**31 - 1  # due column value for tasks without a valid deadline
+_COLUMNS = ("completed", "due", "priority", "category")
+# bytes.translate tables turning a 0/1 flag column into "equals 0" / "equals 1"
+_FLAG_EQUALS = {value: bytes(int(i == value) for i in range(256)) for value in (0, 1)}
+# comparison -> function of the value giving "column element <comparison> value"
+_VALUE_TESTS = {
+    operator.eq: lambda value: value.__eq__,
+    operator.le: lambda value: value.__ge__,
+    operator.ge: lambda value: value.__le__,
+    operator.contains: lambda value: value.__contains__,
+}
+
+
+class TaskTable:
+    """Keeps the fields used by statistics in one typed array per column.
+
+    Columns hold the completed flag, the deadline as a date ordinal, and
+    the priority and category as codes into a shared string table. Counts,
+    masks and group-bys run over whole columns, vectorized with NumPy when
+    it is installed and with C-level ``array``/``map`` passes otherwise.
+
+    Rows are unordered: :meth:`remove` moves the last row into the gap.
+    Tasks are tracked by identity, so the owner calls :meth:`update` after
+    changing a task's fields.
+    """
+
+    def __init__(self, tasks=()):
+        """Create a table holding ``tasks``."""
+        self.reset(tasks)
+
+    def __len__(self):
+        return len(self._tasks)
+
+    def reset(self, tasks=()):
+        """Replace the contents of the table with ``tasks``."""
+        self._tasks = []  # row -> task
+        self._rows = {}  # task -> row
+        self._completed = array("b")
+        self._due = array("i")
+        self._priority = array("I")
+        self._category = array("I")
+        self._codes = {}  # string -> code
+        self._strings = []  # code -> string
+        self.extend(tasks)
+
+    def add(self, task):
+        """Append a row for ``task``."""
+        if task in self._rows:
+            self.update(task)
+            return
+        self._rows[task] = len(self._tasks)
+        self._tasks.append(task)
+        self._completed.append(bool(task.completed))
+        self._due.append(_due(task))
+        self._priority.append(self._code(task.priority))
+        self._category.append(self._code(task.category))
+
+    def extend(self, tasks):
+        """Append rows for several tasks."""
+        for task in tasks:
+            self.add(task)
+
+    def update(self, task):
+        """Re-read the fields of ``task`` (adding it if it has no row)."""
+        row = self._rows.get(task)
+        if row is None:
+            self.add(task)
+            return
+        self._completed[row] = bool(task.completed)
+        self._due[row] = _due(task)
+        self._priority[row] = self._code(task.priority)
+        self._category[row] = self._code(task.category)
+
+    def replace(self, old, new):
+        """Put ``new`` in the row of ``old`` (or add it if ``old`` has none)."""
+        row = self._rows.pop(old, None)
+        if row is None:
+            self.add(new)
+            return
+        self._tasks[row] = new
+        self._rows[new] = row
+        self.update(new)
+
+    def remove(self, task):
+        """Drop the row of ``task``, if it has one."""
+        row = self._rows.pop(task, None)
+        if row is None:
+            return
+        last = len(self._tasks) - 1
+        if row != last:
+            moved = self._tasks[last]
+            self._tasks[row] = moved
+            self._rows[moved] = row
+            for column in self._columns():
+                column[row] = column[last]
+        self._tasks.pop()
+        for column in self._columns():
+            column.pop()
+
+    def tasks(self):
+        """Return the tasks in row order (the order masks refer to)."""
+        return list(self._tasks)
+
+    def count(self, **filters):
+        """Count the rows matching ``filters`` (see :meth:`mask`)."""
+        if not filters:
+            return len(self._tasks)
+        if list(filters) == ["completed"] and filters["completed"] is not None:
+            return self._completed.count(bool(filters["completed"]))
+        mask = self.mask(**filters)
+        if numpy is not None:
+            return int(numpy.count_nonzero(mask))
+        return mask.count(1)
+
+    def mask(
+        self,
+        completed=None,
+        due_on_or_before=None,
+        due_on_or_after=None,
+        priority=None,
+        category=None,
+    ):
+        """Return a per-row flag telling which rows match every filter.
+
+        Args:
+            completed: Keep rows whose completed flag equals this.
+            due_on_or_before: Keep rows with a deadline on or before this
+                date ordinal.
+            due_on_or_after: Keep rows with a deadline on or after this
+                date ordinal (tasks without a deadline never match).
+            priority: Keep rows with this priority, or with any of a
+                set of priorities.
+            category: Keep rows with this category, or any of a set.
+
+        Returns:
+            A NumPy bool array if NumPy is installed, else ``bytes`` of
+            0/1 values, one per row in :meth:`tasks` order.
+        """
+        if not self._tasks:
+            return self._filled(False)
+        tests = []  # (column, comparison, value)
+        if completed is not None:
+            tests.append((self._completed, operator.eq, int(bool(completed))))
+        if due_on_or_before is not None:
+            tests.append((self._due, operator.le, due_on_or_before))
+        if due_on_or_after is not None:
+            tests.append((self._due, operator.ge, due_on_or_after))
+            if due_on_or_before is None:
+                tests.append((self._due, operator.le, NO_DUE - 1))
+        for column, value in ((self._priority, priority), (self._category, category)):
+            if value is None:
+                continue
+            if isinstance(value, str):
+                value = (value,)
+            codes = {self._codes[v] for v in value if v in self._codes}
+            if not codes:
+                return self._filled(False)
+            if len(codes) == 1:
+                tests.append((column, operator.eq, codes.pop()))
+            else:
+                tests.append((column, operator.contains, codes))
+
+        if numpy is not None:
+            mask = numpy.ones(len(self._tasks), dtype=bool)
+            for column, compare, value in tests:
+                if compare is operator.contains:
+                    mask &= numpy.isin(_view(column), list(value))
+                else:
+                    mask &= compare(_view(column), value)
+            return mask
+
+        mask = None
+        for column, compare, value in tests:
+            if column is self._completed:
+                matches = column.tobytes().translate(_FLAG_EQUALS[value])
+            else:
+                # Bound methods of the value keep the whole pass in C
+                test = _VALUE_TESTS[compare](value)
+                matches = bytes(map(test, column))
+            mask = matches if mask is None else _both(mask, matches)
+        return self._filled(True) if mask is None else mask
+
+    def select(self, **filters):
+        """Return the tasks matching ``filters`` (see :meth:`mask`)."""
+        return list(compress(self._tasks, self.mask(**filters)))
+
+    def group_counts(self, column, **filters):
+        """Count matching rows per distinct value of a column.
+
+        Args:
+            column: "completed", "due" (date ordinal, None for no
+                deadline), "priority" or "category".
+            **filters: Restrict the rows counted (see :meth:`mask`).
+
+        Returns:
+            dict: value -> number of rows, for values that occur.
+        """
+        if column not in _COLUMNS:
+            raise ValueError(f"Unknown column: {column}")
+        if not self._tasks:
+            return {}
+        values = getattr(self, "_" + column)
+        if numpy is not None:
+            values = _view(values)
+            if filters:
+                values = values[self.mask(**filters)]
+            codes, counts = numpy.unique(values, return_counts=True)
+            counts = zip(codes.tolist(), counts.tolist())
+        elif filters:
+            counts = Counter(compress(values, self.mask(**filters))).items()
+        else:
+            counts = Counter(values).items()
+
+        if column in ("priority", "category"):
+            return {self._strings[code]: n for code, n in counts}
+        if column == "completed":
+            return {bool(flag): n for flag, n in counts}
+        return {(None if due == NO_DUE else due): n for due, n in counts}
+
+    def values(self):
+        """Return the distinct priority and category strings seen so far."""
+        return list(self._strings)
+
+    def _code(self, value):
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self._strings)
+            self._strings.append(value)
+        return code
+
+    def _columns(self):
+        return (self._completed, self._due, self._priority, self._category)
+
+    def _filled(self, value):
+        if numpy is not None:
+            return numpy.full(len(self._tasks), value, dtype=bool)
+        return bytes([value]) * len(self._tasks)
+
+
+def _due(task):
+    """Return the due column value of a task."""
+    return task.due_ordinal if task.due_ordinal is not None else NO_DUE
+
+
+def _both(mask, other):
+    """AND two bytes masks, as big integers."""
+    both = int.from_bytes(mask, "little") & int.from_bytes(other, "little")
+    return both.to_bytes(len(mask), "little")
+
+
+def _view(column):
+    """Return a NumPy array sharing memory with an ``array`` column.
+
+    Views must not outlive the call that made them: an array cannot grow
+    while a view of it exists.
+    """
+    return numpy.frombuffer(column, dtype=column.typecode)
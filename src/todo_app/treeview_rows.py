@@ -0,0 +1,156 @@
+"""Applies changes to a Treeview's rows as a minimal set of Tk calls."""
+
+import bisect
+import tkinter as tk
+
+# Above this many moved rows, the new order is set with a single
+# ``children`` call rather than one ``move`` per row
+_MOVE_LIMIT = 16
+
+
+class TreeviewRows:
+    """Keeps the top-level rows of a ``ttk.Treeview`` in step with the app.
+
+    The ID, values and tags of every row are mirrored here, so
+    :meth:`reconcile` works out what differs from the wanted rows without
+    querying Tk, then issues one ``delete`` for all vanished rows and an
+    ``insert`` or ``item`` call only for each row that is new or changed.
+    Rows that keep their relative order (the longest such run) stay put;
+    a few others are moved one by one, and a larger reordering (such as a
+    new sort column) is applied with one ``children`` call. Toggling one
+    task thus costs a single call rather than rebuilding the list.
+
+    The mirror is only correct while every row change goes through this
+    class.
+    """
+
+    def __init__(self, tree):
+        """Manage the rows of ``tree``, which must start out empty."""
+        self.tree = tree
+        self._order = []  # row IDs, top to bottom
+        self._rows = {}  # row ID -> (values, tags)
+
+    def __len__(self):
+        return len(self._order)
+
+    def __contains__(self, iid):
+        return iid in self._rows
+
+    def ids(self):
+        """Return the row IDs in display order."""
+        return list(self._order)
+
+    def reconcile(self, rows):
+        """Make the tree show exactly ``rows``, in that order.
+
+        Args:
+            rows: Iterable of ``(iid, values, tags)`` tuples; only the
+                first row with a given ID is shown.
+        """
+        wanted = {}
+        for iid, values, tags in rows:
+            if iid not in wanted:
+                wanted[iid] = (tuple(values), tuple(tags))
+
+        gone = [iid for iid in self._order if iid not in wanted]
+        if gone:
+            self.tree.delete(*gone)
+            for iid in gone:
+                del self._rows[iid]
+        kept = [iid for iid in self._order if iid in wanted]
+        target = [iid for iid in wanted if iid in self._rows]
+        stable = set(kept) if kept == target else _in_order(kept, target)
+        movers = [iid for iid in target if iid not in stable]
+        reorder = len(movers) > _MOVE_LIMIT
+        if movers and not reorder:
+            # Detached rows have no position, so move() indexes are exact
+            self.tree.detach(*movers)
+        movers = set(movers)
+
+        order = []
+        for iid, row in wanted.items():
+            old = self._rows.get(iid)
+            if old is None:
+                try:
+                    self.tree.insert(
+                        "",
+                        "end" if reorder else len(order),
+                        iid=iid,
+                        values=row[0],
+                        tags=row[1],
+                    )
+                except tk.TclError as e:
+                    print(f"Error inserting task {iid}: {e}")
+                    continue
+            else:
+                if iid in movers and not reorder:
+                    self.tree.move(iid, "", len(order))
+                if old != row:
+                    self.tree.item(iid, values=row[0], tags=row[1])
+            self._rows[iid] = row
+            order.append(iid)
+        if reorder:
+            self.tree.set_children("", *order)
+        self._order = order
+
+    def append(self, iid, values, tags=()):
+        """Add a row at the bottom (or update it if it is already shown)."""
+        if iid in self._rows:
+            self.update(iid, values, tags)
+            return
+        try:
+            self.tree.insert("", "end", iid=iid, values=values, tags=tags)
+        except tk.TclError as e:
+            print(f"Error inserting task {iid}: {e}")
+            return
+        self._rows[iid] = (tuple(values), tuple(tags))
+        self._order.append(iid)
+
+    def update(self, iid, values, tags=()):
+        """Change the values and tags of a shown row, if they differ."""
+        row = (tuple(values), tuple(tags))
+        if self._rows.get(iid, row) != row:
+            self.tree.item(iid, values=values, tags=tags)
+            self._rows[iid] = row
+
+    def delete(self, iids):
+        """Remove the shown rows among ``iids``."""
+        iids = [iid for iid in dict.fromkeys(iids) if iid in self._rows]
+        if not iids:
+            return
+        self.tree.delete(*iids)
+        for iid in iids:
+            del self._rows[iid]
+        if len(iids) == 1:
+            self._order.remove(iids[0])
+        else:
+            gone = set(iids)
+            self._order = [iid for iid in self._order if iid not in gone]
+
+
+def _in_order(old, new):
+    """Return the largest set of items whose order is the same in both lists.
+
+    ``old`` and ``new`` hold the same distinct items. This is the longest
+    increasing subsequence of the items' old positions, taken in new order.
+    """
+    position = {item: i for i, item in enumerate(old)}
+    tails = []  # tails[k]: smallest old position ending a run of length k + 1
+    tail_items = []  # the item at each tails entry
+    previous = {}  # item -> the item before it in its run
+    for item in new:
+        p = position[item]
+        k = bisect.bisect_left(tails, p)
+        previous[item] = tail_items[k - 1] if k else None
+        if k == len(tails):
+            tails.append(p)
+            tail_items.append(item)
+        else:
+            tails[k] = p
+            tail_items[k] = item
+    run = set()
+    item = tail_items[-1] if tail_items else None
+    while item is not None:
+        run.add(item)
+        item = previous[item]
+    return run
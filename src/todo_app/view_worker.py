@@ -0,0 +1,318 @@
+"""Background worker that filters, searches and sorts the task list."""
+
+import queue
+import threading
+
+from .fuzzy_index import TrigramIndex
+from .search_index import SearchIndex, SearchSession
+from .sort_index import SortIndex
+from .table import TaskTable
+
+_STOP = object()
+
+
+class ViewWorker:
+    """Works out which tasks the task list shows, on a background thread.
+
+    The worker keeps a replica of the task list: a copy of every task and
+    its own sort orders, word and trigram indexes and column table over
+    those copies. The replica is fed through the same ``reset``/``add``/
+    ``extend``/``update``/``replace``/``remove`` calls as the app's other
+    derived indexes. The calls copy the tasks they are given and queue a
+    message holding the copies, so the worker never reads a task that the
+    Tk thread may still be changing.
+
+    :meth:`submit` queues a view spec (query, search mode and sort). The
+    worker answers only the newest spec waiting in its queue, and it
+    abandons a computation once a newer spec has been submitted. The
+    result is the ordered list of the original tasks to show.
+    :meth:`poll` is called from ``root.after`` on the Tk thread and
+    returns that list. A result computed before later changes to the
+    tasks is dropped, and the spec is resubmitted.
+    """
+
+    def __init__(self):
+        """Start the worker thread with an empty replica."""
+        self._queue = queue.Queue()
+        self._results = queue.SimpleQueue()
+        self._version = 0  # data messages sent
+        self._generation = 0  # newest spec; older ones are abandoned
+        self._spec = None  # the newest spec, while its answer is pending
+        self._closed = False
+        # Replica, only touched by the worker thread
+        self._applied = 0  # data messages applied
+        self._copies = {}  # original task -> copy
+        self._originals = {}  # copy -> original task
+        self.table = TaskTable()
+        self.sort_index = SortIndex()
+        self.search_index = SearchIndex()
+        self.search_session = SearchSession(self.search_index)
+        self.fuzzy_index = TrigramIndex()
+        self._indexes = (
+            self.table, self.sort_index, self.search_index, self.fuzzy_index
+        )
+        self._thread = threading.Thread(
+            target=self._run, name="todo-view-worker", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def busy(self):
+        """Whether the answer to the newest spec is still pending."""
+        return self._spec is not None
+
+    # Derived-index interface, called on the Tk thread
+
+    def reset(self, tasks=()):
+        """Replace the replicated tasks with ``tasks``."""
+        self._send("reset", _copies(tasks))
+
+    def add(self, task):
+        """Replicate a new task."""
+        self._send("extend", _copies([task]))
+
+    def extend(self, tasks):
+        """Replicate several new tasks."""
+        self._send("extend", _copies(tasks))
+
+    def update(self, task):
+        """Replicate the current fields of ``task``."""
+        self._send("update", task, task.copy())
+
+    def replace(self, old, new):
+        """Replicate ``new`` in place of ``old``."""
+        self._send("replace", old, new, new.copy())
+
+    def remove(self, task):
+        """Stop replicating ``task``."""
+        self._send("remove", task)
+
+    def restore_trigrams(self, tasks, data):
+        """Hand trigram postings from the startup cache to the fuzzy index.
+
+        See :meth:`TrigramIndex.restore`; ``tasks`` are the original tasks.
+        """
+        self._put(("restore", list(tasks), data))
+
+    def dump_trigrams(self, tasks):
+        """Return the fuzzy index postings for the startup cache.
+
+        Blocks until the worker has caught up. See :meth:`TrigramIndex.dump`.
+        """
+        reply = queue.SimpleQueue()
+        self._put(("dump", list(tasks), reply))
+        result = reply.get()
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    # Views
+
+    def submit(self, query, search_mode, sort=None):
+        """Ask for the tasks to show, abandoning any earlier request.
+
+        Args:
+            query: Compiled :class:`~todo_app.query.Query` to match.
+            search_mode: "Fuzzy" ranks the text terms by similarity,
+                best match first; any other mode matches them exactly.
+            sort: ``(column, reverse)`` as for :meth:`SortIndex.ordered`,
+                or None for the order the tasks were added in.
+        """
+        self._generation += 1
+        self._spec = (query, search_mode, sort)
+        self._put(("view", self._generation, self._spec))
+
+    def cancel(self):
+        """Abandon the pending request, if any."""
+        self._generation += 1
+        self._spec = None
+
+    def poll(self):
+        """Return the answer to the newest request, once it is ready.
+
+        Returns:
+            list or None: The tasks to show in order (tasks without an ID
+            left out), or None while the answer is pending or if nothing
+            was requested.
+
+        Raises:
+            Exception: Whatever computing the answer raised.
+        """
+        result = None
+        while True:
+            try:
+                item = self._results.get_nowait()
+            except queue.Empty:
+                break
+            if item[0] == self._generation:
+                result = item
+        if result is None or self._spec is None:
+            return None
+        _, version, tasks, error = result
+        if error is not None:
+            self._spec = None
+            raise error
+        if version != self._version:
+            self.submit(*self._spec)  # the tasks changed meanwhile
+            return None
+        self._spec = None
+        return tasks
+
+    def drain(self):
+        """Block until every queued message and request has been handled."""
+        self._queue.join()
+
+    def close(self):
+        """Stop the worker thread."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_STOP)
+        self._thread.join()
+
+    def _send(self, *message):
+        self._version += 1
+        self._put(message)
+
+    def _put(self, item):
+        if self._closed:
+            raise RuntimeError("View worker is closed")
+        self._queue.put(item)
+
+    # Worker thread
+
+    def _run(self):
+        """Worker loop: apply changes in order, answer the newest request."""
+        while True:
+            items = [self._queue.get()]
+            while True:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            request = None
+            stop = False
+            for item in items:
+                if item is _STOP:
+                    stop = True
+                elif item[0] == "view":
+                    request = item
+                else:
+                    try:
+                        self._handle(item)
+                    except Exception as e:
+                        print(f"View worker could not apply a change: {e}")
+            if request is not None and not stop:
+                self._answer(*request[1:])
+            for _ in items:
+                self._queue.task_done()
+            if stop:
+                return
+
+    def _handle(self, item):
+        kind = item[0]
+        if kind == "dump":
+            _, tasks, reply = item
+            try:
+                reply.put(self.fuzzy_index.dump(self._replicas(tasks)))
+            except Exception as e:
+                reply.put(e)
+            return
+        if kind == "restore":
+            _, tasks, data = item
+            copies = self._replicas(tasks)
+            if None not in copies:
+                self.fuzzy_index.restore(copies, data)
+            return
+
+        self._applied += 1
+        if kind == "reset":
+            self._copies = {}
+            self._originals = {}
+            for index in self._indexes:
+                index.reset()
+            self._extend(item[1])
+        elif kind == "extend":
+            self._extend(item[1])
+        elif kind == "update":
+            _, task, copy = item
+            self._replace(task, task, copy)
+        elif kind == "replace":
+            _, old, new, copy = item
+            self._replace(old, new, copy)
+        elif kind == "remove":
+            copy = self._copies.pop(item[1], None)
+            if copy is not None:
+                del self._originals[copy]
+                for index in self._indexes:
+                    index.remove(copy)
+
+    def _extend(self, pairs):
+        """Replicate ``(original, copy)`` pairs made by :func:`_copies`."""
+        added = []
+        for task, copy in pairs:
+            if task in self._copies:
+                self._replace(task, task, copy)
+                continue
+            self._copies[task] = copy
+            self._originals[copy] = task
+            added.append(copy)
+        for index in self._indexes:
+            index.extend(added)
+
+    def _replace(self, old, new, copy):
+        """Swap the copy of ``old`` for ``copy``, a copy of ``new``."""
+        previous = self._copies.pop(old, None)
+        if previous is not None:
+            del self._originals[previous]
+        self._copies[new] = copy
+        self._originals[copy] = new
+        for index in self._indexes:
+            if previous is None:
+                index.add(copy)
+            else:
+                index.replace(previous, copy)
+
+    def _replicas(self, tasks):
+        """Return the copies of ``tasks`` (None for unknown tasks)."""
+        return [self._copies.get(task) for task in tasks]
+
+    def _answer(self, generation, spec):
+        try:
+            tasks = self._compute(generation, *spec)
+        except Exception as e:
+            self._results.put((generation, self._applied, None, e))
+            return
+        if tasks is not None:
+            self._results.put((generation, self._applied, tasks, None))
+
+    def _compute(self, generation, query, search_mode, sort):
+        """Return the original tasks matching ``query`` in display order.
+
+        Returns None as soon as a newer request has been submitted.
+        """
+        terms = query.text_terms()
+        if search_mode == "Fuzzy" and terms:
+            rest = query.without_text()
+            copies = self.fuzzy_index.search(
+                " ".join(terms),
+                where=lambda task: bool(task.id)
+                and rest.matches(task, self.search_index),
+            )
+        else:
+            column, reverse = sort or (None, False)
+            copies = self.sort_index.ordered(column, reverse=reverse)
+            if query:
+                if generation != self._generation:
+                    return None
+                found = query.select(self.table, self.search_session)
+                copies = [task for task in copies if task in found]
+        if generation != self._generation:
+            return None
+        originals = self._originals
+        return [originals[task] for task in copies if task.id]
+
+
+def _copies(tasks):
+    """Pair each task with a copy taken now, on the calling thread."""
+    return [(task, task.copy()) for task in tasks]
@@ -0,0 +1,258 @@
+"""Virtualized task list: a Treeview that only holds the rows in view."""
+
+from .constants import TREEVIEW_ROW_HEIGHT, VIRTUAL_LIST_OVERSCAN
+from .treeview_rows import TreeviewRows
+
+_EXTEND_SELECTION = 0x0001 | 0x0004  # Shift or Control held (event.state)
+
+
+class VirtualTaskList:
+    """Shows a long list of rows through a Treeview holding only a window.
+
+    The full (logical) list is a sequence of row IDs with a source object
+    each; ``row(source)`` renders a source as ``(values, tags)`` and is
+    only called for rows entering the window. The Treeview holds the rows
+    in view plus ``overscan`` rows above and below, so it scrolls, takes
+    wheel and keyboard input and selects rows natively, and the window is
+    moved (through :class:`TreeviewRows`, so only the rows entering and
+    leaving it change) when the view nears either edge.
+
+    The scrollbar is driven here and maps to the logical list, and the
+    selection is kept as logical IDs, so rows selected and then scrolled
+    out of the window stay selected. A click or key press without Shift
+    or Control replaces the whole selection, as in a plain Treeview.
+    """
+
+    def __init__(self, tree, scrollbar, row, overscan=VIRTUAL_LIST_OVERSCAN):
+        """Take over the rows and scrolling of ``tree``.
+
+        Args:
+            tree: An empty ``ttk.Treeview``.
+            scrollbar: Vertical scrollbar to drive; its command is set to
+                :meth:`yview`.
+            row: Function returning the ``(values, tags)`` of a source.
+            overscan: Rows kept above and below the visible ones.
+        """
+        self.tree = tree
+        self.scrollbar = scrollbar
+        self.row = row
+        self.overscan = overscan
+        self.rows = TreeviewRows(tree)
+        self._ids = []  # logical row IDs, top to bottom
+        self._sources = []  # parallel to _ids
+        self._positions = None  # row ID -> index in _ids, built on demand
+        self._start = 0  # logical index of the first row in the Treeview
+        self._top = 0  # logical index of the first visible row
+        self._visible = 1  # rows that fit in the Treeview
+        self._selected = {}  # selected row IDs, in selection order
+        self._applied = set()  # selection last pushed to the Treeview
+        self._extend = False  # the last click/key press extends the selection
+        self._page_pending = False
+
+        scrollbar.configure(command=self.yview)
+        tree.configure(yscrollcommand=self._on_tree_scroll)
+        tree.bind("<<TreeviewSelect>>", self._on_select, add="+")
+        tree.bind("<ButtonPress-1>", self._on_press, add="+")
+        tree.bind("<KeyPress>", self._on_press, add="+")
+        tree.bind("<Configure>", self._on_configure, add="+")
+
+    def __len__(self):
+        return len(self._ids)
+
+    def ids(self):
+        """Return the logical row IDs, top to bottom."""
+        return list(self._ids)
+
+    def set_items(self, items):
+        """Replace the logical list, keeping the scroll position if it can.
+
+        Args:
+            items: Iterable of ``(iid, source)`` pairs in display order.
+                Only the first pair with a given ID is kept.
+        """
+        self._ids = []
+        self._sources = []
+        self._positions = {}
+        for iid, source in items:
+            if iid not in self._positions:
+                self._positions[iid] = len(self._ids)
+                self._ids.append(iid)
+                self._sources.append(source)
+        self._selected = {
+            iid: None for iid in self._selected if iid in self._positions
+        }
+        self._show(self._top)
+
+    def append(self, iid, source):
+        """Add a row at the bottom, or re-render it if it is listed."""
+        self.extend([(iid, source)])
+
+    def extend(self, items):
+        """Add rows at the bottom, as :meth:`append` does for each.
+
+        The window and scrollbar are brought up to date once at the end,
+        so adding a large batch costs Tk calls only for rows in view.
+        """
+        first = len(self._ids)
+        for iid, source in items:
+            if self._index(iid) is not None:
+                self.update(iid, source)
+                continue
+            self._positions[iid] = len(self._ids)
+            self._ids.append(iid)
+            self._sources.append(source)
+        if len(self._ids) == first:
+            return
+        if first < self._start + self._window_size():
+            self._show(self._top)  # some rows were added inside the window
+        else:
+            self._update_scrollbar()
+
+    def update(self, iid, source):
+        """Replace the source of a listed row and re-render it if shown."""
+        index = self._index(iid)
+        if index is None:
+            return
+        self._sources[index] = source
+        if iid in self.rows:
+            self.rows.update(iid, *self.row(source))
+
+    def remove(self, iid):
+        """Drop a row from the list, if it is listed."""
+        self.remove_many((iid,))
+
+    def remove_many(self, iids):
+        """Drop the listed rows among ``iids``.
+
+        The list is filtered and the window redrawn once, however many
+        rows go, so removing a batch costs one pass over the list.
+        """
+        gone = {iid for iid in iids if self._index(iid) is not None}
+        if not gone:
+            return
+        kept = [i for i, iid in enumerate(self._ids) if iid not in gone]
+        self._ids = [self._ids[i] for i in kept]
+        self._sources = [self._sources[i] for i in kept]
+        self._positions = {iid: i for i, iid in enumerate(self._ids)}
+        for iid in gone:
+            self._selected.pop(iid, None)
+        self._show(self._top)
+
+    def selection(self):
+        """Return the selected row IDs, including rows scrolled out of view."""
+        return tuple(self._selected)
+
+    def selection_set(self, iids):
+        """Select exactly the listed rows among ``iids``."""
+        if isinstance(iids, str):
+            iids = (iids,)
+        self._selected = {iid: None for iid in iids if self._index(iid) is not None}
+        self._apply_selection()
+
+    def see(self, iid):
+        """Scroll so that the row with ``iid`` is visible."""
+        index = self._index(iid)
+        if index is None:
+            return
+        if index < self._top:
+            self._show(index)
+        elif index >= self._top + self._visible:
+            self._show(index - self._visible + 1)
+
+    def yview(self, *args):
+        """Scroll the logical list; the scrollbar's command."""
+        if not args:
+            return self._fractions()
+        if args[0] == "moveto":
+            top = round(float(args[1]) * len(self._ids))
+        elif args[0] == "scroll":
+            step = int(args[1]) * (self._visible if args[2] == "pages" else 1)
+            top = self._top + step
+        else:
+            return None
+        self._show(top)
+        return None
+
+    def _show(self, top):
+        """Fill the Treeview with the window around ``top`` and scroll to it."""
+        count = len(self._ids)
+        top = max(0, min(top, count - self._visible))
+        start = max(0, top - self.overscan)
+        end = min(count, top + self._visible + self.overscan)
+        self._top = top
+        self._start = start
+        self.rows.reconcile(
+            (self._ids[i], *self.row(self._sources[i])) for i in range(start, end)
+        )
+        self._apply_selection()
+        if end > start:
+            self.tree.yview_moveto((top - start) / (end - start))
+        self._update_scrollbar()
+
+    def _window_size(self):
+        return self._visible + 2 * self.overscan
+
+    def _index(self, iid):
+        if self._positions is None:
+            self._positions = {iid: i for i, iid in enumerate(self._ids)}
+        return self._positions.get(iid)
+
+    def _fractions(self):
+        count = len(self._ids)
+        if not count:
+            return 0.0, 1.0
+        return self._top / count, min(1.0, (self._top + self._visible) / count)
+
+    def _update_scrollbar(self):
+        self.scrollbar.set(*self._fractions())
+
+    def _apply_selection(self):
+        shown = [iid for iid in self.rows.ids() if iid in self._selected]
+        self._applied = set(shown)
+        if set(self.tree.selection()) != self._applied:
+            self.tree.selection_set(shown)
+
+    def _on_tree_scroll(self, first, last):
+        """Follow the Treeview's own scrolling (wheel, keys, focus moves)."""
+        first, last = float(first), float(last)
+        window = len(self.rows)
+        if not window:
+            self._update_scrollbar()
+            return
+        if last - first < 1.0:
+            self._visible = max(1, round((last - first) * window))
+        self._top = self._start + round(first * window)
+        self._update_scrollbar()
+        margin = self.overscan // 2
+        near_start = self._start > 0 and self._top - self._start < margin
+        near_end = (
+            self._start + window < len(self._ids)
+            and self._start + window - (self._top + self._visible) < margin
+        )
+        if (near_start or near_end) and not self._page_pending:
+            self._page_pending = True
+            self.tree.after_idle(self._page)
+
+    def _page(self):
+        self._page_pending = False
+        self._show(self._top)
+
+    def _on_configure(self, event):
+        rows = -(-event.height // TREEVIEW_ROW_HEIGHT)
+        if rows > self._visible:
+            self._visible = rows
+            self._show(self._top)
+
+    def _on_press(self, event):
+        self._extend = bool(event.state & _EXTEND_SELECTION)
+
+    def _on_select(self, event=None):
+        current = self.tree.selection()
+        if set(current) == self._applied:
+            return  # the selection pushed by _apply_selection
+        shown = set(self.rows.ids())
+        hidden = (
+            [iid for iid in self._selected if iid not in shown] if self._extend else []
+        )
+        self._selected = dict.fromkeys([*current, *hidden])
+        self._applied = set(current)
@@ -0,0 +1,198 @@
+"""Watches task files for modifications made by other programs."""
+
+import ctypes
+import ctypes.util
+import os
+import struct
+import tkinter
+
+from .constants import WATCH_DEBOUNCE_MS, WATCH_POLL_INTERVAL_MS
+
+# inotify(7) constants
+_IN_MODIFY = 0x002
+_IN_CLOSE_WRITE = 0x008
+_IN_MOVED_TO = 0x080
+_IN_CREATE = 0x100
+_IN_DELETE = 0x200
+_IN_Q_OVERFLOW = 0x4000
+_WATCH_MASK = _IN_MODIFY | _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+_EVENT = struct.Struct("iIII")  # wd, mask, cookie, len
+_READ_SIZE = 64 * 1024
+
+
+class FileWatcher:
+    """Calls ``callback`` on the Tk thread when any watched file changes.
+
+    On Linux the files' directories are watched with inotify and Tk is
+    told to wake up when events arrive. Elsewhere (or if inotify cannot be
+    set up) the files are polled with ``os.stat`` from ``root.after``.
+    Bursts of events (e.g. the temp-file write and rename of one atomic
+    save) are coalesced into a single callback.
+
+    The callback also fires for this process's own writes; callers are
+    expected to tell those apart (see
+    :meth:`~todo_app.storage.TaskStorage.poll_external_changes`).
+    """
+
+    def __init__(
+        self,
+        root,
+        paths,
+        callback,
+        poll_interval_ms=WATCH_POLL_INTERVAL_MS,
+        use_inotify=True,
+    ):
+        """Create a watcher; call :meth:`start` to begin watching.
+
+        Args:
+            root: The Tkinter root window used for scheduling.
+            paths: Files to watch (they need not exist yet).
+            callback: Called with no arguments after changes are seen.
+            poll_interval_ms: Polling period when inotify is unavailable.
+            use_inotify: Set to False to force stat polling.
+        """
+        self.root = root
+        self.paths = [os.path.abspath(path) for path in paths]
+        self.callback = callback
+        self.poll_interval_ms = poll_interval_ms
+        self._names = {}  # directory -> basenames of watched files in it
+        for path in self.paths:
+            self._names.setdefault(os.path.dirname(path), set()).add(
+                os.path.basename(path)
+            )
+        self._fd, self._wd_dirs = (
+            _inotify_init(self._names) if use_inotify else (None, {})
+        )
+        self._identities = {path: _identity(path) for path in self.paths}
+        self._after_id = None
+        self._pending_id = None
+        self._running = False
+
+    @property
+    def uses_inotify(self):
+        """Whether changes are detected with inotify rather than polling."""
+        return self._fd is not None
+
+    def start(self):
+        """Begin watching."""
+        if self._running:
+            return
+        self._running = True
+        if self._fd is not None:
+            try:
+                self.root.tk.createfilehandler(
+                    self._fd, tkinter.READABLE, lambda fd, mask: self._on_readable()
+                )
+                return
+            except (AttributeError, RuntimeError):
+                pass  # Tk without file handlers (Windows): fall back to polling
+        self._after_id = self.root.after(self.poll_interval_ms, self._poll)
+
+    def stop(self):
+        """Stop watching and release the inotify descriptor."""
+        self._running = False
+        for ident in (self._after_id, self._pending_id):
+            if ident is not None:
+                self.root.after_cancel(ident)
+        self._after_id = self._pending_id = None
+        if self._fd is not None:
+            try:
+                self.root.tk.deletefilehandler(self._fd)
+            except (AttributeError, RuntimeError):
+                pass
+            os.close(self._fd)
+            self._fd = None
+
+    def check(self):
+        """Return True if a watched file changed since the previous check."""
+        if self._fd is not None:
+            return self._read_events()
+        changed = False
+        for path in self.paths:
+            identity = _identity(path)
+            if identity != self._identities[path]:
+                self._identities[path] = identity
+                changed = True
+        return changed
+
+    def _on_readable(self):
+        """Tk file handler: coalesce inotify events into one callback."""
+        if self._read_events() and self._pending_id is None:
+            self._pending_id = self.root.after(WATCH_DEBOUNCE_MS, self._fire)
+
+    def _fire(self):
+        self._pending_id = None
+        if self._running:
+            self.callback()
+
+    def _poll(self):
+        """Polling fallback: stat the files and reschedule."""
+        self._after_id = None
+        if not self._running:
+            return
+        if self.check():
+            self.callback()
+        self._after_id = self.root.after(self.poll_interval_ms, self._poll)
+
+    def _read_events(self):
+        """Drain pending inotify events; True if one concerns a watched file."""
+        data = b""
+        while True:
+            try:
+                chunk = os.read(self._fd, _READ_SIZE)
+            except BlockingIOError:
+                break
+            if not chunk:
+                break
+            data += chunk
+        changed = False
+        pos = 0
+        while pos + _EVENT.size <= len(data):
+            wd, mask, _, length = _EVENT.unpack_from(data, pos)
+            name = data[pos + _EVENT.size : pos + _EVENT.size + length]
+            pos += _EVENT.size + length
+            if mask & _IN_Q_OVERFLOW:
+                changed = True
+                continue
+            name = os.fsdecode(name.rstrip(b"\0"))
+            if name in self._names.get(self._wd_dirs.get(wd), ()):
+                changed = True
+        return changed
+
+
+def _identity(path):
+    """Return (inode, mtime_ns, size) of ``path``, or None if it is missing."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def _inotify_init(names):
+    """Create a non-blocking inotify fd watching the given directories.
+
+    Returns:
+        tuple: (fd, {watch descriptor: directory}), or (None, {}) if
+            inotify is unavailable.
+    """
+    if not hasattr(os, "O_NONBLOCK"):
+        return None, {}
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        init = libc.inotify_init1
+        add_watch = libc.inotify_add_watch
+    except (OSError, AttributeError, TypeError):
+        return None, {}
+
+    fd = init(os.O_NONBLOCK | getattr(os, "O_CLOEXEC", 0))
+    if fd < 0:
+        return None, {}
+    wd_dirs = {}
+    for directory in names:
+        wd = add_watch(fd, os.fsencode(directory), _WATCH_MASK)
+        if wd < 0:
+            os.close(fd)
+            return None, {}
+        wd_dirs[wd] = directory
+    return fd, wd_dirs
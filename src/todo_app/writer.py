@@ -0,0 +1,215 @@
+"""Background write-behind worker so saving never blocks the UI thread."""
+
+import queue
+import threading
+import time
+
+from .constants import SAVE_COALESCE_WINDOW, WRITE_QUEUE_SIZE
+from .models import Task
+
+_STOP = object()
+_CHANGES = object()  # marker: persist the storage's dirty set
+_POLL = object()  # marker: look for other programs' changes
+
+
+class WriteBehindWriter:
+    """Persists task snapshots on a background thread.
+
+    :meth:`submit` copies the task list and returns immediately. The worker
+    waits ``coalesce_window`` seconds for further snapshots, keeps only the
+    newest one, and hands it to the storage. For backends that support
+    deltas, :meth:`submit_changes` instead asks the worker to write only the
+    tasks marked dirty on the storage. Write failures are queued and can be
+    collected on the UI thread with :meth:`pop_errors`.
+
+    The worker also reads other programs' edits to the file, so the UI
+    thread never waits on the file for them: :meth:`request_external_changes`
+    asks for a :meth:`~todo_app.storage.TaskStorage.poll_external_changes`
+    after the writes queued so far, and :meth:`pop_external_changes`
+    collects the result.
+    """
+
+    def __init__(
+        self, storage, coalesce_window=SAVE_COALESCE_WINDOW, maxsize=WRITE_QUEUE_SIZE
+    ):
+        """Start the writer thread.
+
+        Args:
+            storage: A TaskStorage instance used to perform the writes.
+            coalesce_window: Seconds to wait for newer snapshots before writing.
+            maxsize: Maximum number of snapshots waiting in the queue.
+        """
+        self.storage = storage
+        self.coalesce_window = coalesce_window
+        self._queue = queue.Queue(maxsize)
+        self._errors = queue.SimpleQueue()
+        self._external = queue.SimpleQueue()  # poll_external_changes() results
+        self._polls_requested = 0  # request_external_changes() calls
+        self._polls_started = 0  # requests covered by a poll begun (worker)
+        self._polls_answered = 0  # requests covered by a popped result
+        self.last_error = None  # exception from the most recent write, if any
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run, name="todo-write-behind", daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, tasks):
+        """Queue a snapshot of ``tasks`` to be written.
+
+        Each snapshot holds the complete state (and a change marker is
+        covered by any later one), so when the queue is full the oldest
+        waiting item is dropped instead of blocking.
+
+        Args:
+            tasks: List of Task objects or task dictionaries to persist.
+
+        Raises:
+            RuntimeError: If the writer has been closed.
+        """
+        self._put(
+            [task.to_dict() if isinstance(task, Task) else dict(task) for task in tasks]
+        )
+
+    def submit_changes(self):
+        """Queue a write of the changes marked on the storage.
+
+        Raises:
+            RuntimeError: If the writer has been closed.
+        """
+        self._put(_CHANGES)
+
+    def request_external_changes(self):
+        """Ask the worker to look for changes made by other programs.
+
+        Raises:
+            RuntimeError: If the writer has been closed.
+        """
+        if self._closed:
+            raise RuntimeError("Writer is closed")
+        # Counted first: the request survives its marker being dropped
+        # from a full queue
+        self._polls_requested += 1
+        self._put(_POLL)
+
+    @property
+    def external_changes_pending(self):
+        """Whether a requested look for external changes is still running."""
+        return self._polls_answered < self._polls_requested
+
+    def pop_external_changes(self):
+        """Return the external changes found since the last call, if any.
+
+        Returns:
+            dict or None: Task ID -> task (None if deleted), later results
+            overriding earlier ones; None if no request has been answered.
+        """
+        changes = None
+        while True:
+            try:
+                covered, found = self._external.get_nowait()
+            except queue.Empty:
+                return changes
+            self._polls_answered = covered
+            if changes is None:
+                changes = {}
+            changes.update(found)
+
+    def _put(self, item):
+        """Enqueue ``item``, dropping the oldest waiting item if full."""
+        if self._closed:
+            raise RuntimeError("Writer is closed")
+        while True:
+            try:
+                self._queue.put_nowait(item)
+                return
+            except queue.Full:
+                try:
+                    self._queue.get_nowait()
+                    self._queue.task_done()
+                except queue.Empty:
+                    pass
+
+    def drain(self):
+        """Block until every submitted snapshot has been written (or failed)."""
+        self._queue.join()
+
+    def close(self):
+        """Drain outstanding writes, stop the thread, and close the storage."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_STOP)
+        self._thread.join()
+        self.storage.close()
+
+    def pop_errors(self):
+        """Return and clear the exceptions raised by writes so far."""
+        errors = []
+        while True:
+            try:
+                errors.append(self._errors.get_nowait())
+            except queue.Empty:
+                return errors
+
+    def _run(self):
+        """Worker loop: coalesce queued snapshots and write the newest."""
+        while True:
+            latest = None
+            changes = False
+            item = self._queue.get()
+            taken = 1
+            stop = item is _STOP
+            if item is _CHANGES:
+                changes = True
+            elif not stop and item is not _POLL:
+                latest = item
+
+            deadline = time.monotonic() + self.coalesce_window
+            while not stop:
+                remaining = deadline - time.monotonic()
+                try:
+                    if remaining > 0:
+                        item = self._queue.get(timeout=remaining)
+                    else:
+                        item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                taken += 1
+                if item is _STOP:
+                    stop = True
+                elif item is _CHANGES:
+                    changes = True
+                elif item is not _POLL:
+                    latest = item
+
+            if latest is not None:
+                self._write(self.storage.save, latest)
+            if changes:
+                self._write(self.storage.save_changes)
+            if self._polls_started < self._polls_requested:
+                self._poll()
+            for _ in range(taken):
+                self._queue.task_done()
+            if stop:
+                return
+
+    def _poll(self):
+        """Answer every outstanding external-changes request with one poll."""
+        self._polls_started = self._polls_requested
+        try:
+            changes = self.storage.poll_external_changes()
+        except Exception as e:
+            self._errors.put(e)
+            changes = {}
+        self._external.put((self._polls_started, changes))
+
+    def _write(self, method, *args):
+        """Run one storage write, recording any failure."""
+        try:
+            method(*args)
+            self.storage.flush()
+            self.last_error = None
+        except Exception as e:
+            self.last_error = e
+            self._errors.put(e)
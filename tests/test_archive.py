@@ -0,0 +1,131 @@
+"""Tests for the memory-mapped completed-task archive."""
+
+import os
+import shutil
+import tempfile
+import unittest
+import uuid
+
+from todo_app.archive import (
+    ArchiveFormatError,
+    CompletedArchive,
+    is_archivable,
+    searchable_text,
+)
+
+
+def make_task(text, **fields):
+    task = {
+        "id": str(uuid.uuid4()),
+        "task": text,
+        "deadline": "15-06-2026",
+        "priority": "Medium",
+        "category": "Work",
+        "completed": True,
+    }
+    task.update(fields)
+    return task
+
+
+class TestCompletedArchive(unittest.TestCase):
+    """Unit tests for CompletedArchive."""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.test_dir, "tasks.archive")
+        self.archive = CompletedArchive(self.path)
+
+    def tearDown(self):
+        self.archive.close()
+        shutil.rmtree(self.test_dir)
+
+    def test_missing_file_is_empty(self):
+        self.assertEqual(len(self.archive), 0)
+        self.assertEqual(self.archive.search("x"), [])
+        self.assertIsNone(self.archive.index_of("x"))
+
+    def test_round_trip_is_lossless(self):
+        tasks = [
+            make_task("Write report ✓"),
+            make_task("", deadline="1-3-2026", priority=3, notes={"a": [1]}),
+            {"id": "bare", "completed": True},
+        ]
+        self.archive.update(added=tasks)
+
+        reopened = CompletedArchive(self.path)
+        try:
+            self.assertEqual([reopened.get(i) for i in range(len(reopened))], tasks)
+        finally:
+            reopened.close()
+
+    def test_row_reads_display_values(self):
+        self.archive.update(added=[make_task("Pay rent", category="Finance")])
+        self.assertEqual(
+            self.archive.row(0), ("Pay rent", "Finance", "15-06-2026", "Medium")
+        )
+
+    def test_search_matches_search_text(self):
+        tasks = [
+            make_task("Buy milk"),
+            make_task("Call Bob", category="Personal"),
+            make_task("Milkshake"),
+        ]
+        self.archive.update(added=tasks)
+        self.assertEqual(self.archive.search("milk"), [0, 2])
+        self.assertEqual(self.archive.search("personal"), [1])
+        self.assertEqual(self.archive.search("06-2026"), [0, 1, 2])
+        self.assertEqual(self.archive.search(""), [0, 1, 2])
+        self.assertEqual(self.archive.search("nothing"), [])
+        self.assertEqual(searchable_text(tasks[1]), "call bob 15-06-2026 medium personal")
+
+    def test_index_of_requires_whole_id(self):
+        self.archive.update(added=[make_task("a", id="abc"), make_task("b", id="bc")])
+        self.assertEqual(self.archive.index_of("bc"), 1)
+        self.assertEqual(self.archive.index_of("abc"), 0)
+        self.assertIsNone(self.archive.index_of("b"))
+
+    def test_index_of_follows_updates(self):
+        first = make_task("first")
+        second = make_task("second")
+        self.archive.update(added=[first])
+        self.assertIsNone(self.archive.index_of(second["id"]))
+        self.archive.update(added=[second], removed=[first["id"]])
+        self.assertEqual(self.archive.index_of(second["id"]), 0)
+        self.assertIsNone(self.archive.index_of(first["id"]))
+
+    def test_update_replaces_and_removes(self):
+        first = make_task("first")
+        second = make_task("second")
+        self.archive.update(added=[first, second])
+        self.archive.update(added=[dict(first, task="renamed")], removed=[second["id"]])
+        self.assertEqual(self.archive.ids(), [first["id"]])
+        self.assertEqual(self.archive.row(0)[0], "renamed")
+
+    def test_rejects_tasks_that_are_not_completed(self):
+        with self.assertRaises(ValueError):
+            self.archive.update(added=[make_task("open", completed=False)])
+        self.assertFalse(is_archivable({"completed": True}))
+        self.assertFalse(is_archivable(make_task("x", completed="yes")))
+
+    def test_sort_key_orders_like_the_task_list(self):
+        self.archive.update(
+            added=[
+                make_task("b", deadline="bad", priority="Low"),
+                make_task("C", deadline="02-01-2026", priority="High"),
+                make_task("a", deadline="01-01-2026"),
+            ]
+        )
+        indexes = range(len(self.archive))
+        self.assertEqual(sorted(indexes, key=self.archive.sort_key("deadline")), [2, 1, 0])
+        self.assertEqual(sorted(indexes, key=self.archive.sort_key("priority")), [0, 2, 1])
+        self.assertEqual(sorted(indexes, key=self.archive.sort_key("task")), [2, 0, 1])
+
+    def test_corrupt_file_raises(self):
+        with open(self.path, "wb") as f:
+            f.write(b"not an archive at all, just some bytes")
+        with self.assertRaises(ArchiveFormatError):
+            CompletedArchive(self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
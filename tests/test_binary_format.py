@@ -0,0 +1,131 @@
+"""Tests for the compact binary task format."""
+
+import io
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+import uuid
+from contextlib import redirect_stdout
+
+from todo_app import binary_format
+from todo_app.__main__ import main
+from todo_app.storage import TaskStorage
+
+
+class TestBinaryFormat(unittest.TestCase):
+    """Unit tests for encoding and decoding."""
+
+    def test_round_trip_is_lossless(self):
+        tasks = [
+            {
+                "id": str(uuid.uuid4()),
+                "task": "Write report ✓",
+                "deadline": "01-03-2026",
+                "priority": "High",
+                "category": "Work",
+                "completed": True,
+            },
+            {"id": "custom-id", "task": "No deadline", "completed": False},
+            {
+                "id": "odd",
+                "deadline": "1-3-2026",
+                "priority": 3,
+                "completed": "yes",
+                "notes": {"nested": [1, 2]},
+            },
+            {"id": str(uuid.uuid4()).upper(), "task": ""},
+        ]
+        data = binary_format.dumps(tasks)
+        self.assertTrue(binary_format.is_binary(data))
+        self.assertEqual(binary_format.loads(data), tasks)
+
+    def test_smaller_than_indented_json(self):
+        tasks = [
+            {
+                "id": str(uuid.uuid4()),
+                "task": f"Task {i}",
+                "deadline": "15-06-2026",
+                "priority": "Medium",
+                "category": "Personal",
+                "completed": i % 2 == 0,
+            }
+            for i in range(200)
+        ]
+        self.assertLess(
+            len(binary_format.dumps(tasks)), len(json.dumps(tasks, indent=4)) / 2
+        )
+
+    def test_truncated_data_raises(self):
+        data = binary_format.dumps([{"id": "a", "task": "Truncate me"}])
+        with self.assertRaises(binary_format.BinaryFormatError):
+            binary_format.loads(data[:-3])
+        with self.assertRaises(binary_format.BinaryFormatError):
+            binary_format.loads(b"[]")
+
+
+class TestBinaryStorage(unittest.TestCase):
+    """Format detection in TaskStorage and the convert command."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.json_path = os.path.join(self.tmp_dir, "tasks.json")
+        self.bin_path = os.path.join(self.tmp_dir, "tasks.bin")
+        self.tasks = [{"id": "a", "task": "Convert me", "completed": False}]
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_storage_detects_and_keeps_format(self):
+        TaskStorage(self.json_path, file_format="binary").save(self.tasks)
+        storage = TaskStorage(self.json_path)
+        self.assertEqual(storage.detect_format(), "binary")
+
+        loaded, _ = storage.load()
+        self.assertEqual(loaded, self.tasks)
+        self.assertEqual(list(storage.stream()), self.tasks)
+
+        storage.save(loaded + [{"id": "b", "task": "Added"}])
+        self.assertEqual(storage.detect_format(), "binary")
+
+    def test_convert_command_both_directions(self):
+        TaskStorage(self.json_path).save(self.tasks)
+        with redirect_stdout(io.StringIO()):
+            self.assertEqual(main(["convert", self.json_path, self.bin_path]), 0)
+        self.assertEqual(TaskStorage(self.bin_path).detect_format(), "binary")
+
+        back = os.path.join(self.tmp_dir, "back.json")
+        with redirect_stdout(io.StringIO()):
+            self.assertEqual(main(["convert", self.bin_path, back, "--to", "json"]), 0)
+        with open(back) as f:
+            self.assertEqual(json.load(f), self.tasks)
+
+    def test_convert_replaces_existing_destination(self):
+        TaskStorage(self.json_path).save(self.tasks)
+        TaskStorage(self.bin_path).save([{"id": "old", "task": "Stale"}])
+        with redirect_stdout(io.StringIO()):
+            self.assertEqual(main(["convert", self.json_path, self.bin_path]), 0)
+        loaded, _ = TaskStorage(self.bin_path).load()
+        self.assertEqual(loaded, self.tasks)
+
+    def test_convert_bare_filenames(self):
+        TaskStorage(self.json_path).save(self.tasks)
+        cwd = os.getcwd()
+        os.chdir(self.tmp_dir)
+        try:
+            with redirect_stdout(io.StringIO()):
+                self.assertEqual(main(["convert", "tasks.json", "tasks.bin"]), 0)
+        finally:
+            os.chdir(cwd)
+        loaded, _ = TaskStorage(self.bin_path).load()
+        self.assertEqual(loaded, self.tasks)
+
+    def test_convert_missing_source_fails(self):
+        with mock.patch("sys.stderr", io.StringIO()):
+            self.assertEqual(main(["convert", self.json_path, self.bin_path]), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
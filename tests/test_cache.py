@@ -0,0 +1,74 @@
+"""Tests for the StartupCache class."""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from todo_app.cache import StartupCache, deadline_ordinal
+
+
+class TestStartupCache(unittest.TestCase):
+    """Unit tests for the binary startup cache."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.source = os.path.join(self.tmp_dir, "tasks.json")
+        self.tasks = [
+            {"id": "a", "task": "Report", "deadline": "01-03-2026", "completed": False},
+            {"id": "b", "task": "Gym", "deadline": "bad", "completed": True},
+        ]
+        with open(self.source, "w") as f:
+            json.dump(self.tasks, f)
+        self.cache = StartupCache(self.tmp_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_round_trip_with_derived_fields(self):
+        self.cache.store([self.source], self.tasks)
+        cached = self.cache.load([self.source])
+
+        self.assertEqual(cached.tasks, self.tasks)
+        self.assertEqual(
+            cached.deadline_ordinals,
+            {"01-03-2026": deadline_ordinal("01-03-2026"), "bad": None},
+        )
+
+    def test_missing_cache_returns_none(self):
+        self.assertIsNone(self.cache.load([self.source]))
+
+    def test_modified_source_invalidates(self):
+        self.cache.store([self.source], self.tasks)
+        with open(self.source, "a") as f:
+            f.write(" ")
+        self.assertIsNone(self.cache.load([self.source]))
+
+    def test_same_size_and_mtime_but_different_content_invalidates(self):
+        self.cache.store([self.source], self.tasks)
+        st = os.stat(self.source)
+        with open(self.source, "r+") as f:
+            content = f.read()
+            f.seek(0)
+            f.write(content.replace("Report", "Rep0rt"))
+        os.utime(self.source, ns=(st.st_atime_ns, st.st_mtime_ns))
+        self.assertIsNone(self.cache.load([self.source]))
+
+    def test_missing_optional_source(self):
+        journal = os.path.join(self.tmp_dir, "tasks.json.journal")
+        self.cache.store([self.source, journal], self.tasks)
+        self.assertIsNotNone(self.cache.load([self.source, journal]))
+
+        with open(journal, "w") as f:
+            f.write("{}\n")
+        self.assertIsNone(self.cache.load([self.source, journal]))
+
+    def test_corrupt_cache_returns_none(self):
+        with open(self.cache.filepath, "wb") as f:
+            f.write(b"\x00garbage")
+        self.assertIsNone(self.cache.load([self.source]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+"""Tests for the deadline parser."""
+
+import unittest
+from datetime import date, datetime
+
+from todo_app.constants import DATE_FORMAT
+from todo_app.dates import canonical_deadline_ordinal, deadline_ordinal
+
+
+def strptime_ordinal(value):
+    try:
+        return datetime.strptime(value, DATE_FORMAT).toordinal()
+    except (ValueError, TypeError):
+        return None
+
+
+class TestDeadlineOrdinal(unittest.TestCase):
+    """Unit tests for deadline_ordinal and canonical_deadline_ordinal."""
+
+    def test_agrees_with_strptime(self):
+        values = [
+            "15-06-2026",
+            "1-3-2026",
+            "01-3-2026",
+            "29-02-2024",
+            "29-02-2025",
+            "31-04-2026",
+            "00-01-2026",
+            "01-13-2026",
+            "01-01-0001",
+            "01-01-0000",
+            "01-01-26",
+            "001-01-2026",
+            "01-01-20266",
+            "15/06/2026",
+            "15-06-2026 ",
+            "+1-06-2026",
+            "-15-06-2026",
+            "",
+            "bad",
+        ]
+        for value in values:
+            with self.subTest(value=value):
+                self.assertEqual(deadline_ordinal(value), strptime_ordinal(value))
+
+    def test_non_strings(self):
+        self.assertIsNone(deadline_ordinal(None))
+        self.assertIsNone(deadline_ordinal(20260615))
+        self.assertIsNone(deadline_ordinal(["15-06-2026"]))
+
+    def test_canonical(self):
+        self.assertEqual(
+            canonical_deadline_ordinal("05-03-2026"), date(2026, 3, 5).toordinal()
+        )
+        self.assertIsNone(canonical_deadline_ordinal("5-3-2026"))
+        self.assertIsNone(canonical_deadline_ordinal("05-03-0999"))
+        self.assertIsNone(canonical_deadline_ordinal("bad"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+"""Tests for the fuzzy search trigram index."""
+
+import marshal
+import unittest
+
+from todo_app.fuzzy_index import TrigramIndex, trigrams
+from todo_app.models import Task
+
+
+def ids(tasks):
+    return [task.id for task in tasks]
+
+
+class TestTrigrams(unittest.TestCase):
+    """Unit tests for trigrams()."""
+
+    def test_padded_word_trigrams(self):
+        self.assertEqual(trigrams("Milk"), {"  m", " mi", "mil", "ilk", "lk "})
+        self.assertEqual(trigrams("a"), {"  a", " a "})
+
+    def test_words_are_split_and_lowercased(self):
+        self.assertEqual(trigrams("Go, GO!"), {"  g", " go", "go "})
+        self.assertEqual(trigrams(" -- "), set())
+
+
+class TestTrigramIndex(unittest.TestCase):
+    """Unit tests for TrigramIndex."""
+
+    def setUp(self):
+        self.tasks = [
+            Task("1", "Buy milk"),
+            Task("2", "Milkshake recipe"),
+            Task("3", "Call Bob about the milk", completed=True),
+            Task("4", "File taxes"),
+        ]
+        self.index = TrigramIndex(self.tasks)
+
+    def test_tolerates_typos(self):
+        self.assertEqual(ids(self.index.search("milc")), ["1", "2", "3"])
+        self.assertEqual(ids(self.index.search("texes")), ["4"])
+        self.assertEqual(ids(self.index.search("bye milk")), ["1", "3", "2"])
+
+    def test_ranks_closest_match_first(self):
+        self.assertEqual(ids(self.index.search("milkshake")), ["2", "1", "3"])
+        self.assertEqual(ids(self.index.search("call about milk")), ["3", "1"])
+
+    def test_threshold_and_limit(self):
+        self.assertEqual(self.index.search("zebra"), [])
+        self.assertEqual(self.index.search(""), [])
+        self.assertEqual(ids(self.index.search("milk", limit=2)), ["1", "3"])
+        strict = TrigramIndex(self.tasks, min_similarity=1.0)
+        self.assertEqual(ids(strict.search("milc")), [])
+        self.assertEqual(ids(strict.search("milk")), ["1", "3"])
+
+    def test_where_filters_candidates(self):
+        pending = self.index.search("milk", where=lambda t: not t.completed)
+        self.assertEqual(ids(pending), ["1", "2"])
+
+    def test_built_lazily(self):
+        self.assertIsNone(self.index._postings)
+        self.index.search("milk")
+        self.assertIsNotNone(self.index._postings)
+
+    def test_incremental_changes(self):
+        for built in (False, True):
+            with self.subTest(built=built):
+                index = TrigramIndex(self.tasks)
+                if built:
+                    index.search("x")
+                index.add(Task("5", "Buy bread"))
+                self.tasks[0].text = "Walk dog"
+                index.update(self.tasks[0])
+                index.remove(self.tasks[2])
+                index.replace(self.tasks[3], Task("6", "File reports"))
+                self.assertEqual(len(index), 4)
+                self.assertEqual(ids(index.search("bread")), ["5"])
+                self.assertEqual(ids(index.search("milk")), ["2"])
+                self.assertEqual(ids(index.search("wlak dog")), ["1"])
+                self.assertEqual(ids(index.search("file")), ["6"])
+                self.tasks[0].text = "Buy milk"
+
+    def test_dump_is_none_until_needed(self):
+        self.assertIsNone(self.index.dump(self.tasks))
+
+    def test_dump_and_restore(self):
+        self.index.search("milk")
+        data = marshal.loads(marshal.dumps(self.index.dump(self.tasks)))
+        tasks = [Task(t.id, t.text, completed=t.completed) for t in self.tasks]
+        index = TrigramIndex(tasks)
+        index.restore(tasks, data)
+        self.assertEqual(ids(index.search("milc")), ["1", "2", "3"])
+        self.assertEqual(index._sizes, {t: len(trigrams(t.text)) for t in tasks})
+
+    def test_restore_skips_tasks_changed_before_the_build(self):
+        self.index.search("milk")
+        data = self.index.dump(self.tasks)
+        tasks = [Task(t.id, t.text) for t in self.tasks]
+        index = TrigramIndex(tasks)
+        index.restore(tasks, data)
+        tasks[0].text = "Sell bike"
+        index.update(tasks[0])
+        index.remove(tasks[1])
+        self.assertEqual(ids(index.search("milk")), ["3"])
+        self.assertEqual(ids(index.search("bike")), ["1"])
+
+    def test_malformed_restore_data_is_ignored(self):
+        for data in ({}, {"postings": {}, "sizes": [1]}, {"postings": [], "sizes": []}):
+            with self.subTest(data=data):
+                index = TrigramIndex(self.tasks)
+                index.restore(self.tasks, data)
+                self.assertEqual(ids(index.search("milk")), ["1", "3", "2"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+"""Tests for the Task model."""
+
+import sys
+import unittest
+from datetime import date
+
+from todo_app.models import Task
+
+
+class TestTask(unittest.TestCase):
+    """Unit tests for Task."""
+
+    def test_from_dict_reads_fields(self):
+        task = Task.from_dict(
+            {
+                "id": "abc",
+                "task": "Pay rent",
+                "deadline": "01-07-2026",
+                "priority": "High",
+                "category": "Finance",
+                "completed": True,
+            }
+        )
+        self.assertEqual(task.id, "abc")
+        self.assertEqual(task.text, "Pay rent")
+        self.assertEqual(task.due_ordinal, date(2026, 7, 1).toordinal())
+        self.assertEqual(task.priority, "High")
+        self.assertEqual(task.category, "Finance")
+        self.assertTrue(task.completed)
+        self.assertIsNone(task.extra)
+
+    def test_missing_and_invalid_fields_get_defaults(self):
+        task = Task.from_dict({"id": "abc", "task": 7, "completed": "yes"})
+        self.assertEqual(task.text, "")
+        self.assertEqual(task.deadline, "")
+        self.assertIsNone(task.due_ordinal)
+        self.assertEqual(task.priority, "Medium")
+        self.assertEqual(task.category, "General")
+        self.assertTrue(task.completed)
+
+    def test_round_trip_is_lossless(self):
+        cases = [
+            {
+                "id": "1",
+                "task": "a",
+                "deadline": "15-06-2026",
+                "priority": "Low",
+                "category": "Work",
+                "completed": False,
+            },
+            {"id": "2"},
+            {"id": "3", "task": None, "deadline": 20260615, "completed": 1},
+            {"id": "4", "task": "b", "notes": {"x": [1, 2]}, "completed": "no"},
+            {"task": "no id", "priority": ""},
+        ]
+        for data in cases:
+            with self.subTest(data=data):
+                self.assertEqual(Task.from_dict(data).to_dict(), data)
+
+    def test_edited_fields_replace_originals(self):
+        task = Task.from_dict({"id": "1", "task": None, "completed": 0})
+        task.text = "written"
+        task.completed = True
+        self.assertEqual(task.to_dict()["task"], "written")
+        self.assertIs(task.to_dict()["completed"], True)
+
+    def test_set_deadline_updates_due_ordinal(self):
+        task = Task("1", "a", deadline="bad")
+        self.assertIsNone(task.due_ordinal)
+        task.set_deadline("02-01-2026")
+        self.assertEqual(task.due_ordinal, date(2026, 1, 2).toordinal())
+
+    def test_copy_is_independent(self):
+        task = Task.from_dict({"id": "1", "task": "a", "deadline": 5, "x": 1})
+        copy = task.copy()
+        task.completed = True
+        task.set_deadline("02-01-2026")
+        self.assertFalse(copy.completed)
+        self.assertIsNone(copy.due_ordinal)
+        self.assertEqual(copy.to_dict(), {"id": "1", "task": "a", "deadline": 5, "x": 1})
+
+    def test_search_text(self):
+        task = Task("1", "Buy Milk", "01-01-2026", "High", "Personal")
+        self.assertEqual(task.search_text(), "buy milk 01-01-2026 high personal")
+
+    def test_uses_less_memory_than_a_dict(self):
+        data = {
+            "id": "1",
+            "task": "a",
+            "deadline": "",
+            "priority": "Medium",
+            "category": "General",
+            "completed": False,
+        }
+        task = Task.from_dict(data)
+        self.assertFalse(hasattr(task, "__dict__"))
+        self.assertLess(sys.getsizeof(task), sys.getsizeof(data))
+
+
+if __name__ == "__main__":
+    unittest.main()
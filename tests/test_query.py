@@ -0,0 +1,144 @@
+"""Tests for the search box query language."""
+
+import unittest
+from datetime import date
+
+from todo_app.models import Task
+from todo_app.query import Clause, Query, QueryError, parse_query
+from todo_app.search_index import SearchIndex
+from todo_app.table import TaskTable
+
+TODAY = date(2026, 6, 15)
+
+
+def make_tasks():
+    return [
+        Task("1", "Write report", "10-06-2026", "High", "Work"),
+        Task("2", "Buy milk", "15-06-2026", "Low", "Personal"),
+        Task("3", "Quarterly report", "30-06-2026", "High", "Work", completed=True),
+        Task("4", "Gym", "", "Medium", "Health"),
+        Task("5", "Report taxes", "14-06-2026", "medium", "Finance"),
+    ]
+
+
+class TestParseQuery(unittest.TestCase):
+    """Unit tests for parse_query()."""
+
+    def parse(self, text):
+        return parse_query(text, today=TODAY).clauses
+
+    def test_fields(self):
+        today = TODAY.toordinal()
+        self.assertEqual(
+            self.parse('priority:High cat:"Home office" due:<=today -done "report"'),
+            [
+                Clause("priority", frozenset({"high"})),
+                Clause("category", frozenset({"home office"})),
+                Clause("due", (None, today)),
+                Clause("completed", True, negated=True),
+                Clause("text", ("report",)),
+            ],
+        )
+        self.assertEqual(
+            self.parse("p:low,medium due:>tomorrow due:=01-07-2026 id:AbC is:pending"),
+            [
+                Clause("priority", frozenset({"low", "medium"})),
+                Clause("due", (today + 2, None)),
+                Clause("due", (date(2026, 7, 1).toordinal(),) * 2),
+                Clause("id", "AbC"),
+                Clause("completed", False),
+            ],
+        )
+
+    def test_example_from_the_query_docs(self):
+        self.assertEqual(
+            self.parse('priority:high category:work due:<=today -done "report"'),
+            [
+                Clause("priority", frozenset({"high"})),
+                Clause("category", frozenset({"work"})),
+                Clause("due", (None, TODAY.toordinal())),
+                Clause("completed", True, negated=True),
+                Clause("text", ("report",)),
+            ],
+        )
+
+    def test_due_none_is_negated_range(self):
+        self.assertEqual(self.parse("due:none"), [Clause("due", (None, None), True)])
+        self.assertEqual(self.parse("-due:none"), [Clause("due", (None, None))])
+
+    def test_text_terms(self):
+        self.assertEqual(
+            self.parse('Milk -"bob about" "done" note:x'),
+            [
+                Clause("text", ("milk",)),
+                Clause("text", ("about", "bob"), negated=True),
+                Clause("text", ("done",)),
+                Clause("text", ("note", "x")),
+            ],
+        )
+
+    def test_incomplete_terms_are_ignored(self):
+        self.assertEqual(self.parse('due: p: - "'), [])
+
+    def test_invalid_values(self):
+        for text in ("due:<=32-13-2026", "due:soon", "is:maybe", "due:<none"):
+            with self.subTest(text=text):
+                with self.assertRaises(QueryError):
+                    parse_query(text)
+
+
+class TestQuery(unittest.TestCase):
+    """Unit tests for Query."""
+
+    def setUp(self):
+        self.tasks = make_tasks()
+        self.table = TaskTable(self.tasks)
+        self.index = SearchIndex(self.tasks)
+        self.by_id = {task.id: task for task in self.tasks}
+
+    def check(self, text, expected):
+        query = parse_query(text, today=TODAY)
+        self.assertEqual([t.id for t in query.filter(self.tasks)], expected)
+        variants = {
+            "indexes": (self.index, self.by_id.get),
+            "table only": (None, None),
+        }
+        for name, (index, find) in variants.items():
+            with self.subTest(text=text, variant=name):
+                found = query.select(self.table, index, find)
+                self.assertEqual(sorted(t.id for t in found), expected)
+
+    def test_select_matches_filter(self):
+        self.check("", ["1", "2", "3", "4", "5"])
+        self.check('priority:high category:work due:<=today -done "report"', ["1"])
+        self.check("report", ["1", "3", "5"])
+        self.check("report -p:high", ["5"])
+        self.check("p:medium", ["4", "5"])
+        self.check("due:none", ["4"])
+        self.check("-due:none due:<today", ["1", "5"])
+        self.check("due:>=today", ["2", "3"])
+        self.check("done", ["3"])
+        self.check("pending -report -milk", ["4"])
+        self.check("id:2", ["2"])
+        self.check("id:2 id:3", [])
+        self.check("-id:2 cat:work,personal", ["1", "3"])
+        self.check("is:done is:pending", [])
+        self.check("cat:home", [])
+
+    def test_helpers(self):
+        query = parse_query("done report -milk p:high")
+        self.assertEqual(query.text_terms(), ["report"])
+        self.assertTrue(query.completed())
+        self.assertEqual(
+            [c.field for c in query.without_text().clauses],
+            ["completed", "text", "priority"],
+        )
+        self.assertFalse(Query())
+        self.assertIsNone(Query().completed())
+        self.assertFalse(parse_query("-done").completed())
+        combined = Query([Clause("completed", True)]) & parse_query("gym")
+        self.assertEqual(len(combined.clauses), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
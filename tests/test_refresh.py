@@ -0,0 +1,89 @@
+"""Tests for the coalescing refresh scheduler."""
+
+import unittest
+
+from todo_app.refresh import RefreshScheduler
+
+
+class FakeRoot:
+    """Records ``after_idle`` callbacks instead of running a Tk event loop."""
+
+    def __init__(self):
+        self.scheduled = {}
+        self.count = 0
+
+    def after_idle(self, callback):
+        self.count += 1
+        ident = f"after#{self.count}"
+        self.scheduled[ident] = callback
+        return ident
+
+    def after_cancel(self, ident):
+        self.scheduled.pop(ident, None)
+
+    def run(self):
+        while self.scheduled:
+            self.scheduled.pop(next(iter(self.scheduled)))()
+
+
+class TestRefreshScheduler(unittest.TestCase):
+    """Unit tests for RefreshScheduler."""
+
+    def setUp(self):
+        self.root = FakeRoot()
+        self.painted = []
+        self.scheduler = RefreshScheduler(
+            self.root,
+            {
+                "tasks": lambda: self.painted.append("tasks"),
+                "status": lambda: self.painted.append("status"),
+                "dashboard": lambda: self.painted.append("dashboard"),
+            },
+        )
+
+    def test_marks_are_coalesced_into_one_pass(self):
+        self.scheduler.mark("status")
+        self.scheduler.mark("dashboard", "tasks")
+        self.scheduler.mark("tasks", "status", "dashboard")
+        self.assertEqual(self.painted, [])
+        self.assertEqual(len(self.root.scheduled), 1)
+        self.root.run()
+        self.assertEqual(self.painted, ["tasks", "status", "dashboard"])
+        self.assertEqual(self.scheduler.requested, {"tasks": 2, "status": 2, "dashboard": 2})
+        self.assertEqual(self.scheduler.repainted, {"tasks": 1, "status": 1, "dashboard": 1})
+        self.assertEqual(self.scheduler.suppressed, {"tasks": 1, "status": 1, "dashboard": 1})
+
+    def test_marks_after_a_pass_schedule_another(self):
+        self.scheduler.mark("status")
+        self.root.run()
+        self.scheduler.mark("status")
+        self.root.run()
+        self.assertEqual(self.painted, ["status", "status"])
+        self.assertEqual(self.scheduler.suppressed["status"], 0)
+
+    def test_mark_during_flush_runs_next_pass(self):
+        self.scheduler.views["tasks"] = lambda: self.scheduler.mark("status")
+        self.scheduler.mark("tasks")
+        self.scheduler.flush()
+        self.assertEqual(self.painted, [])
+        self.assertEqual(self.scheduler.pending, ["status"])
+        self.root.run()
+        self.assertEqual(self.painted, ["status"])
+
+    def test_discard_drops_a_view_painted_directly(self):
+        self.scheduler.mark("tasks")
+        self.scheduler.discard("tasks")
+        self.assertEqual(self.root.scheduled, {})
+        self.scheduler.mark("tasks", "status")
+        self.scheduler.discard("tasks")
+        self.root.run()
+        self.assertEqual(self.painted, ["status"])
+        self.assertEqual(self.scheduler.suppressed["tasks"], 2)
+
+    def test_unknown_view_is_rejected(self):
+        with self.assertRaises(KeyError):
+            self.scheduler.mark("chart")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+"""Tests for the search box's inverted index."""
+
+import unittest
+
+from todo_app.models import Task
+from todo_app.search_index import (
+    SearchIndex,
+    SearchSession,
+    matches_terms,
+    query_terms,
+    tokenize,
+)
+
+
+def ids(tasks):
+    return sorted(task.id for task in tasks)
+
+
+class TestSearchIndex(unittest.TestCase):
+    """Unit tests for SearchIndex."""
+
+    def setUp(self):
+        self.tasks = [
+            Task("1", "Buy milk", "15-06-2026", "High", "Personal"),
+            Task("2", "Milkshake recipe", "01-07-2026", "Low", "Health"),
+            Task("3", "Call Bob about the milk", "", "Medium", "Work"),
+            Task("4", "File taxes", "15-06-2027", "High", "Finance"),
+        ]
+        self.index = SearchIndex(self.tasks)
+
+    def test_prefix_terms(self):
+        self.assertEqual(ids(self.index.search("milk")), ["1", "2", "3"])
+        self.assertEqual(ids(self.index.search("MIL")), ["1", "2", "3"])
+        self.assertEqual(ids(self.index.search("ilk")), [])
+        self.assertEqual(ids(self.index.search("high")), ["1", "4"])
+
+    def test_all_terms_must_match(self):
+        self.assertEqual(ids(self.index.search("milk work")), ["3"])
+        self.assertEqual(ids(self.index.search("bob milk")), ["3"])
+        self.assertEqual(ids(self.index.search("06-2026")), ["1"])
+        self.assertEqual(ids(self.index.search("15 06")), ["1", "4"])
+        self.assertEqual(ids(self.index.search("milk nothing")), [])
+
+    def test_empty_query_matches_all(self):
+        self.assertEqual(ids(self.index.search("")), ["1", "2", "3", "4"])
+        self.assertEqual(ids(self.index.search(" - ")), ["1", "2", "3", "4"])
+
+    def test_mutations(self):
+        self.tasks[0].text = "Buy bread"
+        self.index.update(self.tasks[0])
+        self.assertEqual(ids(self.index.search("milk")), ["2", "3"])
+        self.assertEqual(ids(self.index.search("bre")), ["1"])
+
+        self.index.remove(self.tasks[1])
+        self.assertEqual(ids(self.index.search("milk")), ["3"])
+        self.assertEqual(ids(self.index.search("recipe")), [])
+
+        new = Task("5", "Milk the cow")
+        self.index.replace(self.tasks[2], new)
+        self.assertEqual(ids(self.index.search("milk")), ["5"])
+        self.index.add(Task("6", "milkman"))
+        self.assertEqual(ids(self.index.search("milk")), ["5", "6"])
+        self.assertEqual(len(self.index), 4)
+
+    def test_matches_agrees_with_search(self):
+        for query in ("milk", "high", "bo mi", "2026", "x", ""):
+            with self.subTest(query=query):
+                self.assertEqual(
+                    ids(t for t in self.tasks if self.index.matches(t, query)),
+                    ids(self.index.search(query)),
+                )
+
+    def test_helpers(self):
+        self.assertEqual(tokenize("buy milk 15-06-2026"), ["buy", "milk", "15", "06", "2026"])
+        self.assertEqual(query_terms("Milk mi milk"), ["milk", "mi"])
+        self.assertTrue(matches_terms(["buy", "milk"], ["mi", "b"]))
+        self.assertFalse(matches_terms(["buy", "milk"], ["ilk"]))
+
+
+class TestSearchSession(unittest.TestCase):
+    """Unit tests for SearchSession."""
+
+    def setUp(self):
+        self.tasks = [Task(str(i), f"item {i}") for i in range(30)]
+        self.index = SearchIndex(self.tasks)
+        self.session = SearchSession(self.index)
+
+    def test_longer_query_narrows_previous_result(self):
+        self.assertEqual(len(self.session.search("item 1")), 11)
+        calls = []
+        search = self.index.search
+        self.index.search = lambda query: calls.append(query) or search(query)
+        self.assertEqual(ids(self.session.search("item 12")), ["12"])
+        self.assertEqual(calls, [])  # narrowed, not searched
+        self.assertEqual(
+            ids(self.session.search("item 2")), ["2"] + [str(i) for i in range(20, 30)]
+        )
+        self.assertEqual(calls, ["item 2"])
+
+    def test_index_changes_drop_the_previous_result(self):
+        self.assertEqual(
+            ids(self.session.search("item 1")), ["1"] + [str(i) for i in range(10, 20)]
+        )
+        self.index.add(Task("new", "item 100"))
+        self.assertIn("new", ids(self.session.search("item 10")))
+
+    def test_results_are_copies(self):
+        self.session.search("item").clear()
+        self.assertEqual(len(self.session.search("item")), 30)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+"""Tests for the incrementally maintained SortIndex."""
+
+import random
+import unittest
+
+from todo_app.models import Task
+from todo_app.sort_index import SortIndex
+
+
+def texts(tasks):
+    return [task.text for task in tasks]
+
+
+class TestSortIndex(unittest.TestCase):
+    """Unit tests for SortIndex."""
+
+    def setUp(self):
+        self.tasks = [
+            Task("1", "b", "01-06-2026", "High"),
+            Task("2", "A", "", "Low", completed=True),
+            Task("3", "c", "01-05-2026", "Medium"),
+            Task("4", "a", "01-06-2026", "Low"),
+        ]
+        self.index = SortIndex(self.tasks)
+
+    def test_orders(self):
+        self.assertEqual(texts(self.index.ordered("task")), ["A", "a", "b", "c"])
+        self.assertEqual(texts(self.index.ordered("deadline")), ["c", "a", "b", "A"])
+        self.assertEqual(texts(self.index.ordered("priority")), ["A", "a", "c", "b"])
+        self.assertEqual(texts(self.index.ordered("completed")), ["a", "b", "c", "A"])
+        self.assertEqual(texts(self.index.ordered("category")), ["A", "a", "b", "c"])
+        self.assertEqual(
+            texts(self.index.ordered("deadline", reverse=True)), ["A", "b", "a", "c"]
+        )
+        self.assertEqual(self.index.ordered(None), self.tasks)
+
+    def test_ties_follow_insertion_order(self):
+        index = SortIndex([Task("x", "same"), Task("y", "same"), Task("z", "same")])
+        self.assertEqual([t.id for t in index.ordered("task")], ["x", "y", "z"])
+        self.assertEqual(
+            [t.id for t in index.ordered("priority", reverse=True)], ["x", "y", "z"]
+        )
+        self.assertEqual([t.id for t in index.ordered(None, reverse=True)], ["z", "y", "x"])
+
+    def test_reverse_matches_a_stable_reverse_sort(self):
+        rng = random.Random(3)
+        tasks = [
+            Task(str(i), rng.choice("aAb"), "", rng.choice(["Low", "High"]))
+            for i in range(200)
+        ]
+        index = SortIndex(tasks)
+        keys = {
+            "task": lambda t: t.text.lower(),
+            "priority": lambda t: (t.priority == "High", t.text.lower()),
+        }
+        for column, key in keys.items():
+            with self.subTest(column=column):
+                self.assertEqual(
+                    index.ordered(column, reverse=True),
+                    sorted(tasks, key=key, reverse=True),
+                )
+
+    def test_incremental_changes_match_a_full_sort(self):
+        columns = ("task", "deadline", "priority", "completed", None)
+        for column in columns:
+            self.index.ordered(column)  # build every order first
+        rng = random.Random(7)
+        live = list(self.tasks)
+        for step in range(300):
+            action = rng.random()
+            if action < 0.4 or not live:
+                task = Task(
+                    str(step),
+                    rng.choice("abcAB"),
+                    f"{rng.randint(1, 28):02d}-06-2026" if rng.random() < 0.8 else "",
+                    rng.choice(["Low", "Medium", "High"]),
+                    completed=rng.random() < 0.3,
+                )
+                live.append(task)
+                self.index.add(task)
+            elif action < 0.7:
+                task = rng.choice(live)
+                task.completed = not task.completed
+                task.set_deadline(f"{rng.randint(1, 28):02d}-07-2026")
+                self.index.update(task)
+            elif action < 0.85:
+                old = rng.choice(live)
+                new = Task(old.id, old.text.upper(), old.deadline, "High")
+                live[live.index(old)] = new
+                self.index.replace(old, new)
+            else:
+                task = live.pop(rng.randrange(len(live)))
+                self.index.remove(task)
+
+        self.assertEqual(self.index.ordered(None), live)
+        for column in columns:
+            with self.subTest(column=column):
+                ordered = self.index.ordered(column)
+                self.assertCountEqual(ordered, live)
+                # rebuilding from scratch gives the same order
+                self.index._orders.pop(column)
+                self.assertEqual(self.index.ordered(column), ordered)
+        self.assertEqual(len(self.index), len(live))
+
+    def test_remove_unknown_task_is_ignored(self):
+        self.index.remove(Task("nope"))
+        self.assertEqual(len(self.index), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,10 +2,24 @@
 
 import json
 import os
+import shutil
+import subprocess
+import sys
 import tempfile
+import threading
+import time
 import unittest
+from datetime import date
+from unittest import mock
 
-from todo_app.storage import TaskStorage
+from todo_app.storage import (
+    FileLock,
+    JournalTaskStorage,
+    SqliteTaskStorage,
+    TaskStorage,
+    create_storage,
+    merge_tasks,
+)
 
 
 class TestTaskStorage(unittest.TestCase):
@@ -67,6 +81,41 @@ class TestTaskStorage(unittest.TestCase):
         with self.assertRaises(FileNotFoundError):
             self.storage.load()
 
+    def test_failed_save_keeps_previous_file(self):
+        self.storage.save([{"id": "a", "task": "Original"}])
+        with self.assertRaises(TypeError):
+            self.storage.save([{"id": "a", "task": object()}])
+
+        loaded, _ = self.storage.load()
+        self.assertEqual(loaded[0]["task"], "Original")
+        self.assertEqual(os.listdir(self.tmp_dir), ["tasks.json"])
+
+    def test_coalesced_saves_write_latest_on_flush(self):
+        storage = TaskStorage(self.filepath, coalesce_window=60)
+        storage.save([{"id": "a", "task": "First"}])
+        storage.save([{"id": "a", "task": "Second"}])
+        self.assertFalse(storage.exists)
+
+        storage.flush()
+        loaded, _ = storage.load()
+        self.assertEqual(loaded, [{"id": "a", "task": "Second"}])
+
+    def test_coalesced_save_written_after_window(self):
+        storage = TaskStorage(self.filepath, coalesce_window=0.01)
+        tasks = [{"task": "Deferred"}]
+        storage.save(tasks)
+        timer = storage._timer
+        self.assertIn("id", tasks[0])  # IDs are assigned immediately
+
+        timer.join()
+        self.assertTrue(storage.exists)
+
+    def test_save_changes_requires_delta_backend(self):
+        self.assertFalse(self.storage.supports_deltas)
+        self.storage.mark_dirty({"id": "a"})
+        with self.assertRaises(NotImplementedError):
+            self.storage.save_changes()
+
     def test_load_corrupt_json_raises(self):
         with open(self.filepath, "w") as f:
             f.write("{invalid json")
@@ -74,6 +123,409 @@ class TestTaskStorage(unittest.TestCase):
         with self.assertRaises(json.JSONDecodeError):
             self.storage.load()
 
+    def test_concurrent_instances_merge_by_id(self):
+        self.storage.save([{"id": "a", "task": "A"}, {"id": "b", "task": "B"}])
+        first = TaskStorage(self.filepath)
+        second = TaskStorage(self.filepath)
+        tasks_1, _ = first.load()
+        tasks_2, _ = second.load()
+
+        tasks_1[0]["task"] = "A edited"
+        first.save(tasks_1)
+        second.save(tasks_2 + [{"id": "c", "task": "C"}])
+        first.save([t for t in tasks_1 if t["id"] != "b"])
+
+        loaded, _ = self.storage.load()
+        self.assertEqual(
+            loaded, [{"id": "a", "task": "A edited"}, {"id": "c", "task": "C"}]
+        )
+
+    def test_assume_loaded_sets_merge_base(self):
+        tasks = [{"id": "a", "task": "A"}, {"id": "b", "task": "B"}]
+        self.storage.save(tasks)
+        storage = TaskStorage(self.filepath)
+        storage.assume_loaded(tasks)
+        storage.save(tasks[:1])
+
+        loaded, _ = storage.load()
+        self.assertEqual([t["id"] for t in loaded], ["a"])
+
+    def test_stream_cached_sets_merge_base(self):
+        tasks = [{"id": "a", "task": "A"}, {"id": "b", "task": "B"}]
+        self.storage.save(tasks)
+        storage = TaskStorage(self.filepath)
+        self.assertEqual(list(storage.stream_cached(tasks)), tasks)
+        storage.save(tasks[:1])
+
+        loaded, _ = storage.load()
+        self.assertEqual([t["id"] for t in loaded], ["a"])
+
+    def test_stream_sets_merge_base(self):
+        self.storage.save([{"id": "a", "task": "A"}, {"id": "b", "task": "B"}])
+        storage = TaskStorage(self.filepath)
+        tasks = list(storage.stream())
+        TaskStorage(self.filepath).save(tasks + [{"id": "c", "task": "C"}])
+        storage.save(tasks[:1])
+
+        loaded, _ = storage.load()
+        self.assertEqual([t["id"] for t in loaded], ["a", "c"])
+
+
+    def test_disk_tasks_include_merged_tasks(self):
+        ours = [{"id": "t1", "task": "Ours"}]
+        self.storage.save(ours)
+        TaskStorage(self.filepath).save(ours + [{"id": "t2", "task": "Theirs"}])
+        self.assertIsNone(self.storage.disk_tasks(ours))
+
+        self.storage.save(ours)
+        tasks = self.storage.disk_tasks(ours)
+        self.assertEqual([t["id"] for t in tasks], ["t1", "t2"])
+        self.assertIs(tasks[0], ours[0])
+        with open(self.filepath) as f:
+            self.assertEqual(tasks, json.load(f))
+
+    def test_poll_external_changes(self):
+        self.storage.save([{"id": "a", "task": "A"}, {"id": "b", "task": "B"}])
+        self.assertEqual(self.storage.poll_external_changes(), {})
+
+        other = TaskStorage(self.filepath)
+        other.load()
+        other.save([{"id": "a", "task": "A2"}, {"id": "c"}])
+        self.assertEqual(
+            self.storage.poll_external_changes(),
+            {"a": {"id": "a", "task": "A2"}, "b": None, "c": {"id": "c"}},
+        )
+        self.assertEqual(self.storage.poll_external_changes(), {})
+
+    def test_changes_merged_while_saving_are_reported(self):
+        tasks = [{"id": "a", "task": "A"}, {"id": "b", "task": "B"}]
+        self.storage.save(tasks)
+        TaskStorage(self.filepath).save(tasks + [{"id": "c"}])
+        self.storage.save(tasks[:1])
+
+        self.assertEqual(self.storage.poll_external_changes(), {"c": {"id": "c"}})
+
+class TestMergeTasks(unittest.TestCase):
+    """Unit tests for the three-way merge."""
+
+    def test_one_sided_changes_are_kept(self):
+        base = {"a": "1", "b": "1", "c": "1"}
+        ours = {"a": "2", "b": "1", "c": "1", "new": "x"}
+        theirs = {"a": "1", "b": "3", "theirs": "y"}
+        self.assertEqual(
+            merge_tasks(base, ours, theirs),
+            {"a": "2", "b": "3", "new": "x", "theirs": "y"},
+        )
+
+    def test_conflicting_edit_prefers_ours(self):
+        self.assertEqual(merge_tasks({"a": "1"}, {"a": "2"}, {"a": "3"}), {"a": "2"})
+
+    def test_edit_beats_delete(self):
+        self.assertEqual(merge_tasks({"a": "1"}, {}, {"a": "3"}), {"a": "3"})
+        self.assertEqual(merge_tasks({"a": "1"}, {"a": "2"}, {}), {"a": "2"})
+
+
+class TestFileLock(unittest.TestCase):
+    """Unit tests for the advisory directory lock."""
+
+    def test_reentrant_and_creates_directory(self):
+        tmp_dir = tempfile.mkdtemp()
+        try:
+            lock = FileLock(os.path.join(tmp_dir, "data"))
+            with lock:
+                with lock:
+                    self.assertTrue(os.path.isdir(lock.directory))
+            self.assertEqual(os.listdir(lock.directory), [])
+        finally:
+            shutil.rmtree(tmp_dir)
+
+
+class TestJournalTaskStorage(unittest.TestCase):
+    """Unit tests for the snapshot + journal backend."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.filepath = os.path.join(self.tmp_dir, "tasks.json")
+        self.storage = JournalTaskStorage(self.filepath, compact_threshold=100)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def _journal_lines(self):
+        with open(self.storage.journal_path) as f:
+            return f.readlines()
+
+    def test_save_appends_only_changes(self):
+        tasks = [
+            {"id": "a", "task": "First", "completed": False},
+            {"id": "b", "task": "Second", "completed": False},
+        ]
+        self.storage.save(tasks)
+        self.assertEqual(len(self._journal_lines()), 2)
+
+        tasks[0]["completed"] = True
+        self.storage.save(tasks)
+        lines = self._journal_lines()
+        self.assertEqual(len(lines), 3)
+        self.assertEqual(json.loads(lines[-1])["task"]["id"], "a")
+
+    def test_load_replays_journal(self):
+        tasks = [
+            {"id": "a", "task": "First", "completed": False},
+            {"id": "b", "task": "Second", "completed": False},
+        ]
+        self.storage.save(tasks)
+        tasks[1]["task"] = "Second (edited)"
+        self.storage.save(tasks)
+        self.storage.save(tasks[1:])
+
+        loaded, updated = JournalTaskStorage(self.filepath).load()
+        self.assertFalse(updated)
+        self.assertEqual(loaded, [{"id": "b", "task": "Second (edited)", "completed": False}])
+
+    def test_compaction_writes_snapshot(self):
+        storage = JournalTaskStorage(self.filepath, compact_threshold=3)
+        tasks = [{"id": str(i), "task": f"Task {i}"} for i in range(3)]
+        storage.save(tasks)
+
+        self.assertFalse(os.path.exists(storage.journal_path))
+        with open(self.filepath) as f:
+            self.assertEqual(json.load(f), tasks)
+
+        loaded, _ = JournalTaskStorage(self.filepath).load()
+        self.assertEqual(loaded, tasks)
+
+    def test_save_changes_writes_only_marked_tasks(self):
+        tasks = [{"id": str(i), "task": f"Task {i}"} for i in range(50)]
+        self.storage.save(tasks)
+
+        tasks[3]["task"] = "Edited"
+        self.storage.mark_dirty(tasks[3])
+        self.storage.mark_dirty({"task": "Brand new"})
+        self.storage.mark_deleted("7")
+        self.storage.mark_deleted("missing")
+        self.assertTrue(self.storage.has_changes)
+        self.storage.save_changes()
+
+        self.assertFalse(self.storage.has_changes)
+        self.assertEqual(len(self._journal_lines()), 53)
+        loaded, _ = JournalTaskStorage(self.filepath).load()
+        by_id = {t["id"]: t for t in loaded}
+        self.assertEqual(len(loaded), 50)
+        self.assertEqual(by_id["3"]["task"], "Edited")
+        self.assertNotIn("7", by_id)
+
+    def test_failed_save_changes_keeps_marks(self):
+        self.storage.journal_path = os.path.join(self.tmp_dir, "missing", "journal")
+        self.storage.mark_dirty({"id": "a", "task": "Retry me"})
+        with self.assertRaises(OSError):
+            self.storage.save_changes()
+        self.assertTrue(self.storage.has_changes)
+
+    def test_compaction_from_changes(self):
+        storage = JournalTaskStorage(self.filepath, compact_threshold=2)
+        storage.mark_dirty({"id": "a", "task": "First"})
+        storage.save_changes()
+        storage.mark_dirty({"id": "b", "task": "Second"})
+        storage.save_changes()
+
+        self.assertFalse(os.path.exists(storage.journal_path))
+        loaded, _ = JournalTaskStorage(self.filepath).load()
+        self.assertEqual([t["id"] for t in loaded], ["a", "b"])
+
+    def test_load_ignores_torn_last_line(self):
+        self.storage.save([{"id": "a", "task": "Kept"}])
+        with open(self.storage.journal_path, "a") as f:
+            f.write('{"op": "put", "task": {"id": "b"')
+
+        loaded, _ = JournalTaskStorage(self.filepath).load()
+        self.assertEqual([t["id"] for t in loaded], ["a"])
+
+    def test_save_after_torn_line_is_kept(self):
+        self.storage.save([{"id": "a", "task": "Kept"}])
+        with open(self.storage.journal_path, "a") as f:
+            f.write('{"op": "put", "task": {"id": "b"')
+
+        storage = JournalTaskStorage(self.filepath, compact_threshold=100)
+        tasks, _ = storage.load()
+        tasks.append({"id": "c", "task": "Added after the crash"})
+        storage.save(tasks)
+
+        loaded, _ = JournalTaskStorage(self.filepath).load()
+        self.assertEqual([t["id"] for t in loaded], ["a", "c"])
+        self.assertEqual(len(self._journal_lines()), 2)
+
+    def test_appends_are_fsynced(self):
+        with mock.patch("todo_app.storage.os.fsync", wraps=os.fsync) as fsync:
+            self.storage.save([{"id": "a", "task": "First"}])
+        self.assertEqual(fsync.call_count, 1)
+
+    def test_recovers_from_crash_mid_append(self):
+        # A separate process saves, then dies halfway through the next append.
+        script = (
+            "import os, sys\n"
+            "from todo_app.storage import JournalTaskStorage\n"
+            "storage = JournalTaskStorage(sys.argv[1], compact_threshold=100)\n"
+            "storage.save([{'id': 'a', 'task': 'Saved'}])\n"
+            "fd = os.open(storage.journal_path, os.O_WRONLY | os.O_APPEND)\n"
+            "os.write(fd, b'{\"op\": \"put\", \"task\": {\"id\": \"b\", \"ta')\n"
+            "os._exit(9)\n"
+        )
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+        result = subprocess.run(
+            [sys.executable, "-c", script, self.filepath], env=env, timeout=30
+        )
+        self.assertEqual(result.returncode, 9)
+
+        storage = JournalTaskStorage(self.filepath, compact_threshold=100)
+        tasks, _ = storage.load()
+        self.assertEqual([t["id"] for t in tasks], ["a"])
+        tasks.append({"id": "c", "task": "After the crash"})
+        storage.save(tasks)
+        loaded, _ = JournalTaskStorage(self.filepath).load()
+        self.assertEqual([t["id"] for t in loaded], ["a", "c"])
+        self.assertTrue(all(line.endswith("\n") for line in self._journal_lines()))
+
+    def test_load_skips_bad_lines(self):
+        self.storage.save([{"id": "a", "task": "First"}])
+        with open(self.storage.journal_path, "a") as f:
+            f.write("garbage\n")
+        self.storage.save(
+            [{"id": "a", "task": "First"}, {"id": "b", "task": "Second"}]
+        )
+
+        loaded, _ = JournalTaskStorage(self.filepath).load()
+        self.assertEqual([t["id"] for t in loaded], ["a", "b"])
+
+    def test_load_nonexistent_raises(self):
+        with self.assertRaises(FileNotFoundError):
+            self.storage.load()
+
+    def test_load_and_compact_on_two_threads_do_not_deadlock(self):
+        self.storage.save([{"id": "a", "task": "First"}])
+        self.storage.compact()  # replaying a snapshot takes the storage lock
+        replaying = threading.Event()
+        replay = self.storage._replay
+
+        def slow_replay():
+            replaying.set()
+            time.sleep(0.2)  # let the other thread go for the locks
+            return replay()
+
+        self.storage._replay = slow_replay
+        loader = threading.Thread(target=self.storage.load, daemon=True)
+        loader.start()
+        replaying.wait(5)
+        self.storage._replay = replay
+        compactor = threading.Thread(target=self.storage.compact, daemon=True)
+        compactor.start()
+
+        loader.join(5)
+        compactor.join(5)
+        self.assertFalse(loader.is_alive() or compactor.is_alive())
+
+    def test_compaction_keeps_other_writers_entries(self):
+        other = JournalTaskStorage(self.filepath)
+        other.save([{"id": "theirs", "task": "From another process"}])
+        storage = JournalTaskStorage(self.filepath, compact_threshold=1)
+        storage.mark_dirty({"id": "ours", "task": "Ours"})
+        storage.save_changes()
+
+        self.assertFalse(os.path.exists(storage.journal_path))
+        loaded, _ = JournalTaskStorage(self.filepath).load()
+        self.assertEqual([t["id"] for t in loaded], ["theirs", "ours"])
+
+
+class TestSqliteTaskStorage(unittest.TestCase):
+    """Unit tests for the SQLite backend."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.filepath = os.path.join(self.tmp_dir, "tasks.db")
+        self.storage = SqliteTaskStorage(self.filepath)
+        self.tasks = [
+            {"id": "a", "task": "Report", "deadline": "01-03-2026",
+             "priority": "High", "category": "Work", "completed": False},
+            {"id": "b", "task": "Gym", "deadline": "15-03-2026",
+             "priority": "Low", "category": "Health", "completed": True},
+            {"id": "c", "task": "Taxes", "deadline": "not a date",
+             "priority": "Medium", "category": "Work", "completed": False},
+        ]
+
+    def tearDown(self):
+        self.storage.close()
+        shutil.rmtree(self.tmp_dir)
+
+    def test_save_and_load(self):
+        self.storage.save(self.tasks)
+        reopened = SqliteTaskStorage(self.filepath)
+        loaded, updated = reopened.load()
+        reopened.close()
+        self.assertEqual(loaded, self.tasks)
+        self.assertFalse(updated)
+
+    def test_save_applies_updates_and_deletes(self):
+        self.storage.save(self.tasks)
+        self.tasks[0]["completed"] = True
+        del self.tasks[1]
+        self.storage.save(self.tasks)
+
+        self.assertIsNone(self.storage.get_task("b"))
+        self.assertTrue(self.storage.get_task("a")["completed"])
+        self.assertEqual([t["id"] for t in self.storage.load()[0]], ["a", "c"])
+
+    def test_save_changes(self):
+        self.storage.save(self.tasks)
+        self.storage.mark_dirty(dict(self.tasks[0], completed=True))
+        self.storage.mark_deleted("c")
+        self.storage.save_changes()
+
+        self.assertTrue(self.storage.get_task("a")["completed"])
+        self.assertIsNone(self.storage.get_task("c"))
+        self.assertEqual(len(self.storage.tasks_by_status(False)), 0)
+
+    def test_indexed_queries(self):
+        self.storage.save(self.tasks)
+        self.assertEqual(
+            [t["id"] for t in self.storage.tasks_in_category("Work")], ["a", "c"]
+        )
+        self.assertEqual([t["id"] for t in self.storage.tasks_by_status(True)], ["b"])
+        due = self.storage.tasks_due_between(date(2026, 3, 10), date(2026, 3, 31))
+        self.assertEqual([t["id"] for t in due], ["b"])
+        self.assertEqual(len(self.storage.tasks_due_between(end=date(2026, 12, 31))), 2)
+
+    def test_load_imports_existing_json(self):
+        TaskStorage(os.path.join(self.tmp_dir, "tasks.json")).save(self.tasks)
+        self.assertTrue(self.storage.exists)
+        loaded, _ = self.storage.load()
+        self.assertEqual(loaded, self.tasks)
+        self.assertTrue(os.path.exists(self.filepath))
+
+    def test_load_nonexistent_raises(self):
+        with self.assertRaises(FileNotFoundError):
+            self.storage.load()
+
+
+class TestCreateStorage(unittest.TestCase):
+    """Unit tests for backend selection."""
+
+    def test_known_backends(self):
+        self.assertIs(type(create_storage("/tmp", "json")), TaskStorage)
+        self.assertIs(type(create_storage("/tmp", "journal")), JournalTaskStorage)
+        sqlite_storage = create_storage("/tmp", "sqlite")
+        self.assertEqual(os.path.basename(sqlite_storage.filepath), "tasks.db")
+
+    def test_backend_selectable_on_command_line(self):
+        from todo_app.__main__ import build_parser
+
+        parser = build_parser()
+        self.assertEqual(parser.parse_args([]).storage, "json")
+        self.assertEqual(parser.parse_args(["--storage", "journal"]).storage, "journal")
+
+    def test_unknown_backend_raises(self):
+        with self.assertRaises(ValueError):
+            create_storage("/tmp", "nope")
+
 
 if __name__ == "__main__":
     unittest.main()
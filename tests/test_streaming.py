@@ -0,0 +1,89 @@
+"""Tests for the streaming task loader."""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from todo_app.storage import JournalTaskStorage, TaskStorage
+from todo_app.streaming import TaskStream
+
+
+class TestTaskStream(unittest.TestCase):
+    """Unit tests for incremental JSON parsing."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.filepath = os.path.join(self.tmp_dir, "tasks.json")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def _write(self, content):
+        with open(self.filepath, "w", encoding="utf-8") as f:
+            if isinstance(content, str):
+                f.write(content)
+            else:
+                json.dump(content, f, indent=4, ensure_ascii=False)
+
+    def test_matches_json_load_across_chunk_sizes(self):
+        tasks = [
+            {"id": str(i), "task": "Tâche " * (i % 7), "count": i * 1001}
+            for i in range(300)
+        ]
+        self._write(tasks)
+        for chunk_size in (1, 7, 4096):
+            with self.subTest(chunk_size=chunk_size):
+                stream = TaskStream(self.filepath, chunk_size=chunk_size)
+                self.assertEqual(list(stream), tasks)
+                self.assertFalse(stream.updated)
+                self.assertEqual(stream.progress, 1.0)
+
+    def test_assigns_ids_and_skips_non_objects(self):
+        self._write([{"task": "No ID"}, 42, "text", {"id": "x", "task": "Has ID"}])
+        stream = TaskStream(self.filepath, chunk_size=5)
+        loaded = list(stream)
+
+        self.assertEqual([t["task"] for t in loaded], ["No ID", "Has ID"])
+        self.assertTrue(loaded[0]["id"])
+        self.assertTrue(stream.updated)
+
+    def test_reports_progress(self):
+        self._write([{"id": str(i)} for i in range(100)])
+        reports = []
+        stream = TaskStream(
+            self.filepath, chunk_size=256, on_progress=lambda *a: reports.append(a)
+        )
+        list(stream)
+
+        total = os.path.getsize(self.filepath)
+        self.assertGreater(len(reports), 2)
+        self.assertEqual(reports[-1], (total, total))
+
+    def test_empty_array(self):
+        self._write("  [ ]\n")
+        self.assertEqual(list(TaskStream(self.filepath, chunk_size=1)), [])
+
+    def test_invalid_json_raises(self):
+        for content in ("", "{}", '[{"id": "a"}', '[{"id": "a"},]', "[1 2]"):
+            with self.subTest(content=content):
+                self._write(content)
+                with self.assertRaises(json.JSONDecodeError):
+                    list(TaskStream(self.filepath, chunk_size=3))
+
+    def test_missing_file_raises(self):
+        with self.assertRaises(FileNotFoundError):
+            list(TaskStream(self.filepath))
+
+    def test_storage_stream(self):
+        tasks = [{"id": "a", "task": "One"}, {"id": "b", "task": "Two"}]
+        TaskStorage(self.filepath).save(tasks)
+        self.assertEqual(list(TaskStorage(self.filepath).stream()), tasks)
+
+        journal = JournalTaskStorage(self.filepath)
+        self.assertEqual(list(journal.stream()), tasks)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+"""Tests for the columnar TaskTable."""
+
+import unittest
+from datetime import date
+
+from todo_app.models import Task
+from todo_app.table import TaskTable
+
+TODAY = date(2026, 6, 15).toordinal()
+
+
+def make_tasks():
+    return [
+        Task("1", "a", "01-06-2026", "High", "Work"),
+        Task("2", "b", "15-06-2026", "Low", "Work", completed=True),
+        Task("3", "c", "", "Medium", "Personal"),
+        Task("4", "d", "30-06-2026", "High", "Health"),
+        Task("5", "e", "10-06-2026", "High", "Work", completed=True),
+    ]
+
+
+class TestTaskTable(unittest.TestCase):
+    """Unit tests for TaskTable."""
+
+    def setUp(self):
+        self.tasks = make_tasks()
+        self.table = TaskTable(self.tasks)
+
+    def test_counts(self):
+        self.assertEqual(self.table.count(), 5)
+        self.assertEqual(self.table.count(completed=True), 2)
+        self.assertEqual(self.table.count(completed=False), 3)
+        self.assertEqual(self.table.count(completed=False, due_on_or_before=TODAY), 1)
+        self.assertEqual(self.table.count(priority="High", category="Work"), 2)
+        self.assertEqual(self.table.count(priority="Urgent"), 0)
+
+    def test_mask_and_select(self):
+        mask = self.table.mask(priority="High")
+        self.assertEqual([bool(flag) for flag in mask], [True, False, False, True, True])
+        self.assertEqual(
+            [task.id for task in self.table.select(due_on_or_before=TODAY)],
+            ["1", "2", "5"],
+        )
+        self.assertEqual(len(self.table.mask()), 5)
+
+    def test_due_range_and_value_sets(self):
+        def select(**filters):
+            return [task.id for task in self.table.select(**filters)]
+
+        self.assertEqual(select(due_on_or_after=TODAY), ["2", "4"])
+        self.assertEqual(
+            select(due_on_or_after=TODAY - 5, due_on_or_before=TODAY), ["2", "5"]
+        )
+        self.assertEqual(select(priority={"Low", "Medium"}), ["2", "3"])
+        self.assertEqual(select(category={"Health", "Home"}, priority="High"), ["4"])
+        self.assertEqual(select(category={"Home"}), [])
+        self.assertEqual(
+            sorted(self.table.values()), ["Health", "High", "Low", "Medium", "Personal", "Work"]
+        )
+
+    def test_group_counts(self):
+        self.assertEqual(
+            self.table.group_counts("category"), {"Work": 3, "Personal": 1, "Health": 1}
+        )
+        self.assertEqual(
+            self.table.group_counts("priority", completed=False),
+            {"High": 2, "Medium": 1},
+        )
+        self.assertEqual(self.table.group_counts("completed"), {False: 3, True: 2})
+        self.assertEqual(
+            self.table.group_counts("due", completed=False),
+            {
+                date(2026, 6, 1).toordinal(): 1,
+                date(2026, 6, 30).toordinal(): 1,
+                None: 1,
+            },
+        )
+        with self.assertRaises(ValueError):
+            self.table.group_counts("text")
+
+    def test_update_reads_changed_fields(self):
+        task = self.tasks[2]
+        task.completed = True
+        task.set_deadline("01-01-2026")
+        task.category = "Work"
+        self.table.update(task)
+        self.assertEqual(self.table.count(completed=True), 3)
+        self.assertEqual(self.table.group_counts("category")["Work"], 4)
+
+    def test_remove_and_replace(self):
+        self.table.remove(self.tasks[0])
+        self.table.remove(self.tasks[0])  # already gone
+        self.assertEqual(len(self.table), 4)
+        self.assertEqual(self.table.count(priority="High"), 2)
+        self.assertCountEqual(self.table.tasks(), self.tasks[1:])
+
+        new = Task("6", "f", priority="Low", completed=True)
+        self.table.replace(self.tasks[4], new)
+        self.assertEqual(len(self.table), 4)
+        self.assertEqual(self.table.count(priority="Low"), 2)
+        self.assertIn(new, self.table.tasks())
+        self.assertNotIn(self.tasks[4], self.table.tasks())
+
+    def test_reset(self):
+        self.table.reset([Task("x", completed=True)])
+        self.assertEqual(self.table.count(completed=True), 1)
+        self.assertEqual(self.table.group_counts("priority"), {"Medium": 1})
+
+
+if __name__ == "__main__":
+    unittest.main()
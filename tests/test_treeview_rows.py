@@ -0,0 +1,132 @@
+"""Tests for the Treeview row reconciler."""
+
+import random
+import tkinter as tk
+import unittest
+
+from todo_app.treeview_rows import TreeviewRows
+
+
+class FakeTree:
+    """Records the Treeview calls TreeviewRows makes and applies them."""
+
+    def __init__(self):
+        self.order = []
+        self.rows = {}
+        self.detached = set()
+        self.calls = []
+
+    def insert(self, parent, index, iid, values, tags):
+        self.calls.append("insert")
+        if iid in self.rows:
+            raise tk.TclError(f"Item {iid} already exists")
+        self.rows[iid] = (tuple(values), tuple(tags))
+        self.order.insert(len(self.order) if index == "end" else index, iid)
+
+    def item(self, iid, values, tags):
+        self.calls.append("item")
+        self.rows[iid] = (tuple(values), tuple(tags))
+
+    def delete(self, *iids):
+        self.calls.append("delete")
+        for iid in iids:
+            self.order.remove(iid)
+            del self.rows[iid]
+
+    def detach(self, *iids):
+        self.calls.append("detach")
+        for iid in iids:
+            self.order.remove(iid)
+            self.detached.add(iid)
+
+    def move(self, iid, parent, index):
+        self.calls.append("move")
+        assert iid in self.detached, "only detached rows are moved"
+        self.detached.discard(iid)
+        self.order.insert(index, iid)
+
+    def set_children(self, parent, *iids):
+        self.calls.append("set_children")
+        assert set(iids) == set(self.order) | self.detached
+        self.detached.clear()
+        self.order = list(iids)
+
+    def shown(self):
+        return [(iid, *self.rows[iid]) for iid in self.order]
+
+
+def rows(ids, mark=""):
+    return [(iid, (f"Task {iid}{mark}", "Work"), ()) for iid in ids]
+
+
+class TestTreeviewRows(unittest.TestCase):
+    """Unit tests for TreeviewRows."""
+
+    def setUp(self):
+        self.tree = FakeTree()
+        self.rows = TreeviewRows(self.tree)
+        self.rows.reconcile(rows("abcdef"))
+        self.tree.calls.clear()
+
+    def reconcile(self, wanted):
+        self.rows.reconcile(wanted)
+        self.assertEqual(self.tree.shown(), wanted)
+        self.assertEqual(self.rows.ids(), [row[0] for row in wanted])
+        calls, self.tree.calls = self.tree.calls, []
+        return calls
+
+    def test_unchanged_rows_cost_nothing(self):
+        self.assertEqual(self.reconcile(rows("abcdef")), [])
+
+    def test_one_changed_row_is_one_call(self):
+        wanted = rows("abcdef")
+        wanted[2] = ("c", ("Task c", "Work"), ("overdue",))
+        self.assertEqual(self.reconcile(wanted), ["item"])
+
+    def test_removed_rows_are_deleted_together(self):
+        self.assertEqual(self.reconcile(rows("ace")), ["delete"])
+
+    def test_inserted_rows_go_in_place(self):
+        self.assertEqual(self.reconcile(rows("axbcdyef")), ["insert", "insert"])
+
+    def test_moves_only_rows_out_of_order(self):
+        self.assertEqual(self.reconcile(rows("bcdefa")), ["detach", "move"])
+        self.assertEqual(self.reconcile(rows("bcfdea")), ["detach", "move"])
+
+    def test_large_reorder_is_one_call(self):
+        ids = [str(i) for i in range(100)]
+        self.reconcile(rows(ids))
+        calls = self.reconcile(rows(ids[::-1] + ["new"]))
+        self.assertEqual(calls, ["insert", "set_children"])
+
+    def test_random_changes(self):
+        rng = random.Random(7)
+        pool = [str(i) for i in range(60)]
+        for step in range(200):
+            ids = rng.sample(pool, rng.randint(0, len(pool)))
+            if step % 3:
+                ids.sort(key=int)
+            with self.subTest(step=step):
+                self.reconcile(rows(ids, mark="!" * (step % 2)))
+
+    def test_incremental_helpers(self):
+        self.rows.append("g", ("Task g", "Work"))
+        self.rows.append("a", ("Task a", "Home"))
+        self.rows.update("b", ("Task b", "Work"))
+        self.rows.delete(["c", "zz", "e"])
+        self.assertEqual(self.tree.calls, ["insert", "item", "delete"])
+        self.assertEqual(self.tree.order, list("abdfg"))
+        self.assertEqual(self.tree.rows["a"], (("Task a", "Home"), ()))
+        self.assertNotIn("c", self.rows)
+        self.assertEqual(len(self.rows), 5)
+
+    def test_failed_insert_is_skipped(self):
+        self.tree.rows["x"] = (("stray",), ())  # made outside TreeviewRows
+        wanted = rows("axb")
+        self.rows.reconcile(wanted)
+        self.assertEqual(self.rows.ids(), ["a", "b"])
+        self.assertEqual(self.tree.order, ["a", "b"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+"""Tests for the background view worker."""
+
+import unittest
+
+from todo_app.models import Task
+from todo_app.query import Query, parse_query
+from todo_app.view_worker import ViewWorker
+
+
+class TestViewWorker(unittest.TestCase):
+    """Unit tests for ViewWorker."""
+
+    def setUp(self):
+        self.tasks = [
+            Task("1", "write report", "03-06-2026", "High", "Work"),
+            Task("2", "buy milk", "01-06-2026", "Low", "Personal"),
+            Task("3", "call bob", "", "High", "Work", completed=True),
+            Task("4", "plan trip", "02-06-2026", "Medium", "Personal"),
+            Task("", "no id", "", "High"),
+        ]
+        self.worker = ViewWorker()
+        self.worker.extend(self.tasks)
+
+    def tearDown(self):
+        self.worker.close()
+
+    def view(self, text="", mode="Exact", sort=None):
+        self.worker.submit(parse_query(text), mode, sort)
+        self.worker.drain()
+        tasks = self.worker.poll()
+        self.assertFalse(self.worker.busy)
+        return [task.id for task in tasks]
+
+    def test_filters_and_sorts(self):
+        self.assertEqual(self.view(), ["1", "2", "3", "4"])
+        self.assertEqual(self.view("p:high"), ["1", "3"])
+        self.assertEqual(self.view(sort=("deadline", False)), ["2", "4", "1", "3"])
+        self.assertEqual(self.view("-done", sort=("task", True)), ["1", "4", "2"])
+        self.assertEqual(self.view("bob", "Fuzzy"), ["3"])
+
+    def test_results_are_the_original_tasks(self):
+        self.worker.submit(Query(), "Exact")
+        self.worker.drain()
+        self.assertIs(self.worker.poll()[0], self.tasks[0])
+
+    def test_replica_follows_changes(self):
+        self.tasks[1].text = "buy oat milk"
+        self.tasks[1].priority = "High"
+        self.worker.update(self.tasks[1])
+        self.tasks[1].priority = "Low"  # not reported: the replica keeps High
+        self.worker.replace(self.tasks[0], Task("1", "write memo", priority="Low"))
+        self.worker.remove(self.tasks[3])
+        self.worker.add(Task("5", "oat order", priority="High"))
+        self.assertEqual(self.view("p:high"), ["2", "3", "5"])
+        self.assertEqual(self.view("oat"), ["2", "5"])
+        self.assertEqual(self.view(sort=("task", False)), ["2", "3", "5", "1"])
+        self.worker.reset([self.tasks[3]])
+        self.assertEqual(self.view(), ["4"])
+
+    def test_tasks_are_copied_when_sent(self):
+        added = Task("5", "new", priority="High")
+        replacement = Task("1", "write memo", priority="High")
+        self.worker.add(added)
+        self.worker.replace(self.tasks[0], replacement)
+        added.priority = "Low"  # not reported: the replica keeps High
+        replacement.priority = "Low"
+        self.assertEqual(self.view("p:high"), ["1", "3", "5"])
+
+    def test_stale_result_is_recomputed(self):
+        self.worker.submit(parse_query("p:high"), "Exact")
+        self.worker.drain()
+        self.tasks[3].priority = "High"
+        self.worker.update(self.tasks[3])
+        self.assertIsNone(self.worker.poll())
+        self.assertTrue(self.worker.busy)
+        self.worker.drain()
+        self.assertEqual([task.id for task in self.worker.poll()], ["1", "3", "4"])
+
+    def test_only_the_newest_request_is_answered(self):
+        self.worker.submit(parse_query("p:high"), "Exact")
+        self.worker.submit(parse_query("p:low"), "Exact")
+        self.worker.drain()
+        self.assertEqual([task.id for task in self.worker.poll()], ["2"])
+        self.assertIsNone(self.worker.poll())
+        self.worker.submit(parse_query("p:low"), "Exact")
+        self.worker.cancel()
+        self.worker.drain()
+        self.assertIsNone(self.worker.poll())
+        self.assertFalse(self.worker.busy)
+
+    def test_errors_are_raised_by_poll(self):
+        self.worker.submit(None, "Exact")
+        self.worker.drain()
+        with self.assertRaises(AttributeError):
+            self.worker.poll()
+        self.assertFalse(self.worker.busy)
+
+    def test_trigrams_round_trip(self):
+        self.view("mlik", "Fuzzy")  # builds the trigram index
+        data = self.worker.dump_trigrams(self.tasks)
+        self.assertIsNotNone(data)
+        other = ViewWorker()
+        try:
+            other.extend(self.tasks)
+            other.restore_trigrams(self.tasks, data)
+            other.submit(parse_query("milc"), "Fuzzy")
+            other.drain()
+            self.assertEqual([task.id for task in other.poll()], ["2"])
+        finally:
+            other.close()
+
+    def test_closed_worker_rejects_changes(self):
+        self.worker.close()
+        with self.assertRaises(RuntimeError):
+            self.worker.add(Task("6"))
+
+
+if __name__ == "__main__":
+    unittest.main()
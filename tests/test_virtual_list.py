@@ -0,0 +1,176 @@
+"""Tests for the virtualized task list."""
+
+import unittest
+from types import SimpleNamespace
+
+from tests.test_treeview_rows import FakeTree
+from todo_app.virtual_list import VirtualTaskList
+
+SHIFT = 0x0001
+
+
+class FakeScrollTree(FakeTree):
+    """FakeTree plus the selection, scrolling and binding calls."""
+
+    def __init__(self):
+        super().__init__()
+        self.selected = ()
+        self.bindings = {}
+        self.options = {}
+        self.moved_to = None
+
+    def selection(self):
+        return self.selected
+
+    def selection_set(self, iids):
+        self.selected = tuple(iids)
+
+    def yview_moveto(self, fraction):
+        self.moved_to = fraction
+
+    def configure(self, **options):
+        self.options.update(options)
+
+    def bind(self, sequence, func, add=None):
+        self.bindings[sequence] = func
+
+    def after_idle(self, func):
+        func()
+
+
+class FakeScrollbar:
+    def __init__(self):
+        self.fractions = None
+        self.command = None
+
+    def configure(self, command):
+        self.command = command
+
+    def set(self, first, last):
+        self.fractions = (first, last)
+
+
+def items(count):
+    return [(str(i), i) for i in range(count)]
+
+
+class TestVirtualTaskList(unittest.TestCase):
+    """Unit tests for VirtualTaskList."""
+
+    def setUp(self):
+        self.tree = FakeScrollTree()
+        self.scrollbar = FakeScrollbar()
+        self.list = VirtualTaskList(
+            self.tree, self.scrollbar, lambda n: ((f"Task {n}",), ()), overscan=5
+        )
+        # 10 rows fit on screen
+        self.tree.bindings["<Configure>"](SimpleNamespace(height=450))
+        self.list.set_items(items(1000))
+
+    def shown(self):
+        return [int(iid) for iid in self.tree.order]
+
+    def test_only_the_window_is_materialized(self):
+        self.assertEqual(self.shown(), list(range(15)))
+        self.assertEqual(len(self.list), 1000)
+        self.assertEqual(self.scrollbar.fractions, (0.0, 0.01))
+        self.assertEqual(self.scrollbar.command, self.list.yview)
+
+    def test_scrollbar_maps_to_the_logical_list(self):
+        self.list.yview("moveto", "0.5")
+        self.assertEqual(self.shown(), list(range(495, 515)))
+        self.assertEqual(self.tree.moved_to, 5 / 20)
+        self.assertEqual(self.scrollbar.fractions, (0.5, 0.51))
+        self.list.yview("scroll", "1", "pages")
+        self.assertEqual(self.shown()[0], 505)
+        self.list.yview("scroll", "-3", "units")
+        self.assertEqual(self.shown()[0], 502)
+        self.list.yview("moveto", "1.0")
+        self.assertEqual(self.shown(), list(range(985, 1000)))
+        self.assertEqual(self.scrollbar.fractions, (0.99, 1.0))
+
+    def test_native_scrolling_pages_rows_in(self):
+        on_scroll = self.tree.options["yscrollcommand"]
+        on_scroll("0.2", "0.866")  # 3 rows down, still inside the window
+        self.assertEqual(self.shown(), list(range(15)))
+        self.assertEqual(self.scrollbar.fractions, (0.003, 0.013))
+        on_scroll("0.333", "1.0")  # near the window's end
+        self.assertEqual(self.shown(), list(range(0, 20)))
+        self.assertEqual(self.list._top, 5)
+
+    def test_selection_survives_scrolling(self):
+        self.tree.selected = ("2", "3")
+        self.tree.bindings["<<TreeviewSelect>>"]()
+        self.list.yview("moveto", "0.5")
+        self.assertEqual(self.tree.selected, ())
+        self.assertEqual(self.list.selection(), ("2", "3"))
+        # Shift-click keeps the rows out of view selected
+        self.tree.bindings["<ButtonPress-1>"](SimpleNamespace(state=SHIFT))
+        self.tree.selected = ("500",)
+        self.tree.bindings["<<TreeviewSelect>>"]()
+        self.assertEqual(set(self.list.selection()), {"2", "3", "500"})
+        self.list.yview("moveto", "0")
+        self.assertEqual(self.tree.selected, ("2", "3"))
+        # A plain click replaces the selection
+        self.tree.bindings["<ButtonPress-1>"](SimpleNamespace(state=0))
+        self.tree.selected = ("7",)
+        self.tree.bindings["<<TreeviewSelect>>"]()
+        self.assertEqual(self.list.selection(), ("7",))
+
+    def test_selection_set_and_see(self):
+        self.list.selection_set(["900", "nope"])
+        self.assertEqual(self.list.selection(), ("900",))
+        self.list.see("900")
+        self.assertIn(900, self.shown())
+        self.assertEqual(self.tree.selected, ("900",))
+        self.list.set_items(items(100))
+        self.assertEqual(self.list.selection(), ())
+
+    def test_incremental_changes(self):
+        self.list.update("3", 33)
+        self.assertEqual(self.tree.rows["3"], (("Task 33",), ()))
+        self.list.remove("0")
+        self.assertEqual(self.shown(), list(range(1, 16)))
+        self.assertEqual(self.tree.rows["3"], (("Task 33",), ()))
+        self.list.append("new", 5000)
+        self.assertEqual(self.list.ids()[-1], "new")
+        self.assertNotIn("new", self.tree.order)
+        small = VirtualTaskList(
+            FakeScrollTree(), FakeScrollbar(), lambda n: ((n,), ())
+        )
+        small.append("a", 1)
+        small.append("a", 2)
+        self.assertEqual(small.tree.shown(), [("a", (2,), ())])
+
+    def test_remove_many(self):
+        self.list.selection_set(["2", "500", "7"])
+        self.tree.calls.clear()
+        self.list.remove_many(["2", "nope", *map(str, range(500, 1000))])
+        self.assertEqual(len(self.list), 499)
+        self.assertEqual(self.shown(), [0, 1, *range(3, 16)])
+        self.assertEqual(self.list.selection(), ("7",))
+        self.assertEqual(self.list.ids()[-1], "499")
+        self.list.see("499")
+        self.assertIn(499, self.shown())
+        self.tree.calls.clear()
+        self.list.remove_many(["nope"])
+        self.assertEqual(self.tree.calls, [])
+
+    def test_extend_renders_only_rows_in_view(self):
+        tree = FakeScrollTree()
+        scrollbar = FakeScrollbar()
+        rows = VirtualTaskList(tree, scrollbar, lambda n: ((n,), ()), overscan=5)
+        tree.bindings["<Configure>"](SimpleNamespace(height=450))
+        rows.extend(items(3))
+        rows.extend([("1", 10)] + items(100)[3:])
+        self.assertEqual([int(iid) for iid in tree.order], list(range(15)))
+        self.assertEqual(tree.rows["1"], ((10,), ()))
+        tree.calls.clear()
+        rows.extend(items(200)[100:])
+        self.assertEqual(tree.calls, [])
+        self.assertEqual(len(rows), 200)
+        self.assertEqual(scrollbar.fractions, (0.0, 0.05))
+
+
+if __name__ == "__main__":
+    unittest.main()
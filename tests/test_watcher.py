@@ -0,0 +1,82 @@
+"""Tests for the task file watcher."""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from todo_app.storage import atomic_write
+from todo_app.watcher import FileWatcher
+
+
+class FakeRoot:
+    """Records ``after`` callbacks instead of running a Tk event loop."""
+
+    def __init__(self):
+        self.scheduled = []
+
+    def after(self, ms, callback):
+        self.scheduled.append(callback)
+        return f"after#{len(self.scheduled)}"
+
+    def after_cancel(self, ident):
+        pass
+
+
+class TestFileWatcher(unittest.TestCase):
+    """Unit tests for FileWatcher."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.filepath = os.path.join(self.tmp_dir, "tasks.json")
+        self.root = FakeRoot()
+        self.changes = 0
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def _on_change(self):
+        self.changes += 1
+
+    def _check_detects_changes(self, watcher):
+        try:
+            self.assertFalse(watcher.check())
+            atomic_write(self.filepath, "[]")
+            self.assertTrue(watcher.check())
+            self.assertFalse(watcher.check())
+
+            atomic_write(os.path.join(self.tmp_dir, "other.json"), "[]")
+            self.assertFalse(watcher.check())
+
+            os.remove(self.filepath)
+            self.assertTrue(watcher.check())
+        finally:
+            watcher.stop()
+
+    def test_polling_detects_changes(self):
+        watcher = FileWatcher(self.root, [self.filepath], self._on_change, use_inotify=False)
+        self.assertFalse(watcher.uses_inotify)
+        self._check_detects_changes(watcher)
+
+    def test_inotify_detects_changes(self):
+        watcher = FileWatcher(self.root, [self.filepath], self._on_change)
+        if not watcher.uses_inotify:
+            watcher.stop()
+            self.skipTest("inotify is not available")
+        self._check_detects_changes(watcher)
+
+    def test_poll_invokes_callback_and_reschedules(self):
+        watcher = FileWatcher(self.root, [self.filepath], self._on_change, use_inotify=False)
+        watcher.start()
+        atomic_write(self.filepath, "[]")
+        self.root.scheduled.pop()()
+        self.assertEqual(self.changes, 1)
+        self.assertEqual(len(self.root.scheduled), 1)
+
+        watcher.stop()
+        self.root.scheduled.pop()()
+        self.assertEqual(self.root.scheduled, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,129 @@
+"""Tests for the WriteBehindWriter class."""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from todo_app.models import Task
+from todo_app.storage import JournalTaskStorage, TaskStorage
+from todo_app.writer import WriteBehindWriter
+
+
+class FailingStorage(TaskStorage):
+    """Storage whose writes always fail."""
+
+    def _write(self, tasks):
+        raise IOError("disk full")
+
+
+class TestWriteBehindWriter(unittest.TestCase):
+    """Unit tests for background persistence."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.filepath = os.path.join(self.tmp_dir, "tasks.json")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_submit_and_drain(self):
+        storage = TaskStorage(self.filepath)
+        writer = WriteBehindWriter(storage, coalesce_window=0)
+        writer.submit([{"id": "a", "task": "Write me"}])
+        writer.drain()
+
+        loaded, _ = storage.load()
+        self.assertEqual(loaded[0]["task"], "Write me")
+        writer.close()
+
+    def test_snapshot_isolated_from_later_mutation(self):
+        storage = TaskStorage(self.filepath)
+        writer = WriteBehindWriter(storage, coalesce_window=60)
+        tasks = [{"id": "a", "task": "Before"}]
+        writer.submit(tasks)
+        tasks[0]["task"] = "After"
+        writer.close()
+
+        loaded, _ = storage.load()
+        self.assertEqual(loaded[0]["task"], "Before")
+
+    def test_task_objects_are_snapshotted_on_submit(self):
+        storage = TaskStorage(self.filepath)
+        writer = WriteBehindWriter(storage, coalesce_window=60)
+        task = Task("a", "Before")
+        writer.submit([task])
+        task.text = "After"
+        task.completed = True
+        writer.close()
+
+        loaded, _ = storage.load()
+        self.assertEqual(loaded[0]["task"], "Before")
+        self.assertFalse(loaded[0]["completed"])
+
+    def test_burst_is_coalesced_to_latest(self):
+        writes = []
+
+        class RecordingStorage(TaskStorage):
+            def _write(self, tasks):
+                writes.append(tasks)
+
+        writer = WriteBehindWriter(
+            RecordingStorage(self.filepath), coalesce_window=60, maxsize=2
+        )
+        for i in range(5):
+            writer.submit([{"id": "a", "task": f"Edit {i}"}])
+        writer.close()
+
+        self.assertEqual(len(writes), 1)
+        self.assertEqual(writes[0][0]["task"], "Edit 4")
+
+    def test_submit_changes_writes_marked_tasks(self):
+        storage = JournalTaskStorage(self.filepath)
+        writer = WriteBehindWriter(storage, coalesce_window=0)
+        storage.mark_dirty({"id": "a", "task": "Delta"})
+        writer.submit_changes()
+        writer.close()
+
+        loaded, _ = JournalTaskStorage(self.filepath).load()
+        self.assertEqual(loaded, [{"id": "a", "task": "Delta"}])
+
+    def test_external_changes_are_read_on_the_writer_thread(self):
+        storage = TaskStorage(self.filepath)
+        storage.save([{"id": "a", "task": "Ours"}])
+        TaskStorage(self.filepath).save(
+            [{"id": "a", "task": "Ours"}, {"id": "b", "task": "Theirs"}]
+        )
+        writer = WriteBehindWriter(storage, coalesce_window=0)
+        self.assertIsNone(writer.pop_external_changes())
+
+        writer.request_external_changes()
+        writer.request_external_changes()
+        self.assertTrue(writer.external_changes_pending)
+        writer.drain()
+        self.assertEqual(
+            writer.pop_external_changes(), {"b": {"id": "b", "task": "Theirs"}}
+        )
+        self.assertFalse(writer.external_changes_pending)
+        writer.close()
+
+    def test_failures_are_reported(self):
+        writer = WriteBehindWriter(FailingStorage(self.filepath), coalesce_window=0)
+        writer.submit([{"id": "a"}])
+        writer.drain()
+
+        errors = writer.pop_errors()
+        self.assertEqual(len(errors), 1)
+        self.assertIsInstance(errors[0], IOError)
+        self.assertEqual(writer.pop_errors(), [])
+        writer.close()
+
+    def test_submit_after_close_raises(self):
+        writer = WriteBehindWriter(TaskStorage(self.filepath))
+        writer.close()
+        with self.assertRaises(RuntimeError):
+            writer.submit([])
+
+
+if __name__ == "__main__":
+    unittest.main()